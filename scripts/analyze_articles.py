@@ -8,19 +8,44 @@ Utilise la configuration scoring.yaml pour les critères.
 
 Usage:
     python analyze_articles.py                    # Analyse le fichier du jour
+    python analyze_articles.py --workers 4        # Phase 1 répartie sur 4 processus
+    python analyze_articles.py --incremental      # Seulement les articles ajoutés depuis le dernier passage
     python analyze_articles.py --date 2026-01-05  # Analyse une date spécifique
     python analyze_articles.py --input file.jsonl # Analyse un fichier spécifique
+    python analyze_articles.py --query gemini --since 14d  # Articles trouvés par recherche plein texte
+    python analyze_articles.py --query 'gemini OR claude' --fts  # Requête en syntaxe FTS5
+    python analyze_articles.py --profile rh=config/scoring_rh.yaml,config/prefs_rh.json \
+                               --profile tech=config/scoring.yaml   # Un résultat par profil, une seule lecture
 """
 
 import argparse
+import hashlib
+import heapq
+import itertools
 import json
 import logging
+import os
 import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 import yaml
 
+from scoring import (
+    BatchScorer,
+    Bm25Scorer,
+    MultiProfileScorer,
+    NUMPY_AVAILABLE,
+    RelevanceIndex,
+    ScoringContext
+)
+from scoring.relevance import tokenize
+from scoring.context import DEFAULT_CACHE_PATH
+
 # Configuration logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,6 +59,24 @@ CONFIG_PATH = PROJECT_ROOT / "config" / "scoring.yaml"
 PREFS_PATH = PROJECT_ROOT / "config" / "content_preferences.json"
 RAW_DIR = PROJECT_ROOT / "output" / "raw-articles"
 OUTPUT_DIR = PROJECT_ROOT / "output" / "analyzed-articles"
+STATE_DIR = OUTPUT_DIR / "state"
+
+# Analyse parallèle: tranches par processus (équilibrage) et taille minimale
+CHUNKS_PER_WORKER = 4
+MIN_CHUNK_BYTES = 1 << 20
+
+# Analyse en flux: articles lus et scorés par lots de cette taille
+STREAM_BATCH_SIZE = 2048
+
+# Format de l'état incrémental (candidats gardés avec leur article)
+INCREMENTAL_STATE_VERSION = 2
+
+# Mémoire max du processus (module Unix)
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
 
 
 def load_scoring_config() -> dict:
@@ -52,6 +95,30 @@ def load_content_preferences() -> dict:
         return {}
 
 
+def article_content(article: dict) -> str:
+    """Contenu de l'article, relu depuis le stockage par contenu si besoin (content_ref)"""
+    if article.get('content_ref') and not article.get('content'):
+        from collectors.blob_store import load_content
+        return load_content(article)
+    return article.get('content', '')
+
+
+def article_timestamp(article: dict) -> Optional[int]:
+    """Date de publication epoch (published_ts), calculée depuis published_at pour les anciens JSONL"""
+    published_ts = article.get('published_ts')
+    if published_ts is None and article.get('published_at'):
+        from collectors.dates import parse_timestamp
+        return parse_timestamp(article['published_at'])
+    return published_ts
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Mémoire résidente max du processus (Mo), None si indisponible"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Octets sur macOS, kilo-octets sur Linux
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024
 
 
 def load_articles(input_path: Path) -> List[dict]:
@@ -77,7 +144,7 @@ def calculate_keyword_score(text: str, keywords: List[str]) -> float:
 def detect_categories(article: dict, config: dict) -> List[str]:
     """Détecte les catégories d'un article"""
     categories = []
-    text = f"{article.get('title', '')} {article.get('content', '')} {article.get('summary', '')}".lower()
+    text = f"{article.get('title', '')} {article_content(article)} {article.get('summary', '')}".lower()
 
     for cat in config.get('categories', []):
         keywords = cat.get('keywords', [])
@@ -87,21 +154,36 @@ def detect_categories(article: dict, config: dict) -> List[str]:
     return categories[:3] if categories else ['General']
 
 
-def score_article(article: dict, config: dict) -> Dict:
+def score_article(
+    article: dict,
+    config: dict,
+    context: ScoringContext = None,
+    now: int = None
+) -> Dict:
     """
     Score un article selon les critères configurés.
 
+    Les mots-clés de tous les critères sont cherchés en un seul passage
+    (scoring/keywords.py) ; passer `context` évite de recompiler l'automate
+    pour chaque article. La fraîcheur est l'âge de l'article (published_ts)
+    à la date `now` (epoch, défaut: maintenant).
+
     Retourne un dict avec le score et les détails.
     """
+    if context is None:
+        context = ScoringContext(config, {})
+    if now is None:
+        now = int(time.time())
+    engine = context.engine
+
     criteria = config.get('scoring_criteria', {})
-    thresholds = config.get('thresholds', {})
-    exclusions = config.get('exclusions', {})
 
     title = article.get('title', '')
-    content = article.get('content', '')
+    content = article_content(article)
     summary = article.get('summary', '')
     source = article.get('source_name', '')
-    full_text = f"{title} {content} {summary}"
+
+    matches = engine.scan_article(title, content, summary)
 
     scores = {}
     total_weight = 0
@@ -111,10 +193,9 @@ def score_article(article: dict, config: dict) -> Dict:
     audience = criteria.get('audience_relevance', {})
     if audience:
         weight = audience.get('weight', 0)
-        keywords = audience.get('keywords_boost', [])
-        score = calculate_keyword_score(full_text, keywords)
+        score = engine.keyword_score(matches, 'audience')
         # Bonus si titre contient des mots clés
-        if calculate_keyword_score(title, keywords) > 0:
+        if engine.keyword_score(matches, 'audience', title_only=True) > 0:
             score = min(score + 0.3, 1.0)
         scores['audience_relevance'] = score * 10
         weighted_sum += score * weight
@@ -124,8 +205,7 @@ def score_article(article: dict, config: dict) -> Dict:
     engagement = criteria.get('engagement_potential', {})
     if engagement:
         weight = engagement.get('weight', 0)
-        keywords = engagement.get('keywords_boost', [])
-        score = calculate_keyword_score(title, keywords)  # Surtout dans le titre
+        score = engine.keyword_score(matches, 'engagement', title_only=True)  # Surtout dans le titre
         scores['engagement_potential'] = score * 10
         weighted_sum += score * weight
         total_weight += weight
@@ -134,12 +214,11 @@ def score_article(article: dict, config: dict) -> Dict:
     source_quality = criteria.get('source_quality', {})
     if source_quality:
         weight = source_quality.get('weight', 0)
-        tier1 = source_quality.get('tier_1_sources', [])
-        tier2 = source_quality.get('tier_2_sources', [])
+        tier = context.source_tier(source)
 
-        if any(t1.lower() in source.lower() for t1 in tier1):
+        if tier == 1:
             score = 1.0
-        elif any(t2.lower() in source.lower() for t2 in tier2):
+        elif tier == 2:
             score = 0.7
         else:
             score = 0.4  # Source inconnue
@@ -148,12 +227,11 @@ def score_article(article: dict, config: dict) -> Dict:
         weighted_sum += score * weight
         total_weight += weight
 
-    # 4. Fraîcheur (basé sur published_at si dispo)
+    # 4. Fraîcheur (âge depuis published_ts, seuils en heures de la config)
     timeliness = criteria.get('timeliness', {})
     if timeliness:
         weight = timeliness.get('weight', 0)
-        # Pour l'instant, on assume que les articles sont récents
-        score = 0.7  # Score par défaut
+        score = context.timeliness_score(article_timestamp(article), now)
         scores['timeliness'] = score * 10
         weighted_sum += score * weight
         total_weight += weight
@@ -175,12 +253,10 @@ def score_article(article: dict, config: dict) -> Dict:
         final_score = 5.0
 
     # Appliquer les pénalités
-    negative_kw = exclusions.get('negative_keywords', [])
-    if any(nkw.lower() in full_text.lower() for nkw in negative_kw):
+    if matches.any('negative'):
         final_score *= 0.7
 
-    clickbait = exclusions.get('clickbait_patterns', [])
-    if any(cb.lower() in title.lower() for cb in clickbait):
+    if matches.any('clickbait', title_only=True):
         final_score *= 0.8
 
     # Arrondir et limiter
@@ -189,7 +265,7 @@ def score_article(article: dict, config: dict) -> Dict:
     return {
         'score': final_score,
         'breakdown': scores,
-        'categories': detect_categories(article, config)
+        'categories': engine.categories(matches)
     }
 
 
@@ -254,112 +330,414 @@ def suggest_hashtags(categories: List[str], config: dict) -> List[str]:
     return unique_tags[:max_tags]
 
 
-def extract_keywords_from_text(text: str) -> list:
-    """
-    Extrait les mots significatifs d'un texte (news_focus de l'utilisateur).
-    Ignore les mots vides (stop words).
-    """
-    # Mots vides à ignorer
-    stop_words = {
-        'le', 'la', 'les', 'un', 'une', 'des', 'de', 'du', 'au', 'aux',
-        'je', 'tu', 'il', 'elle', 'nous', 'vous', 'ils', 'elles',
-        'mon', 'ma', 'mes', 'ton', 'ta', 'tes', 'son', 'sa', 'ses',
-        'ce', 'cette', 'ces', 'qui', 'que', 'quoi', 'dont', 'où',
-        'et', 'ou', 'mais', 'donc', 'car', 'ni', 'si', 'pour', 'par',
-        'sur', 'sous', 'dans', 'avec', 'sans', 'entre', 'vers', 'chez',
-        'être', 'avoir', 'faire', 'pouvoir', 'vouloir', 'devoir', 'aller',
-        'est', 'sont', 'était', 'peut', 'va', 'fait', 'bien', 'plus',
-        'se', 'ne', 'pas', 'quels', 'quel', 'quelle', 'quelles',
-        'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-        'to', 'of', 'in', 'on', 'at', 'for', 'with', 'by', 'from',
-        'cherche', 'uniquement', 'news', 'peuvent', 'intéresser', 'publique',
-        'demande', 'comment', 'pourquoi', 'important', 'autant', 'faire',
-        'sujets', 'inclure', 'exclure', 'éviter', 'trop', 'techniques'
-    }
-
-    # Nettoyer et extraire les mots
-    words = re.findall(r'[a-zA-ZÀ-ÿ]{3,}', text.lower())
-    keywords = [w for w in words if w not in stop_words]
-
-    # Retourner les mots uniques
-    return list(set(keywords))
-
-
-def quick_score_title(article: dict, config: dict, preferences: dict) -> float:
+def quick_score_title(
+    article: dict,
+    config: dict,
+    preferences: dict,
+    context: ScoringContext = None
+) -> float:
     """
     Score rapide basé sur le titre ET le texte news_focus de l'utilisateur.
-    Extrait les mots-clés DIRECTEMENT depuis le texte saisi par l'utilisateur.
+    Extrait les mots-clés DIRECTEMENT depuis le texte saisi par l'utilisateur
+    (une seule fois par contexte de scoring).
     """
+    if context is None:
+        context = ScoringContext(config, preferences)
+
     title = article.get('title', '')
     source = article.get('source_name', '')
     title_lower = title.lower()
 
     score = 0.0
 
-    # Extraire les mots-clés depuis le texte news_focus de l'utilisateur
-    news_focus = preferences.get('news_focus', '')
-    user_keywords = extract_keywords_from_text(news_focus)
-
     # Score basé sur les mots-clés extraits du news_focus
-    matches = sum(1 for kw in user_keywords if kw in title_lower)
+    matches = context.news_focus_count(title_lower)
     score += min(matches * 2.0, 10.0)
 
     # Bonus source tier 1/2
-    criteria = config.get('scoring_criteria', {})
-    source_quality = criteria.get('source_quality', {})
-    if source_quality:
-        tier1 = source_quality.get('tier_1_sources', [])
-        tier2 = source_quality.get('tier_2_sources', [])
-        if any(t1.lower() in source.lower() for t1 in tier1):
-            score += 2.0
-        elif any(t2.lower() in source.lower() for t2 in tier2):
-            score += 1.0
+    tier = context.source_tier(source)
+    if tier == 1:
+        score += 2.0
+    elif tier == 2:
+        score += 1.0
 
     return score
 
 
-def analyze_articles(
+def quick_score_bm25(
+    article: dict,
+    context: ScoringContext,
+    relevance: Bm25Scorer,
+    words: List[str] = None
+) -> float:
+    """
+    Score rapide BM25 (quick_scoring.method: bm25): pertinence du titre et du
+    résumé pour le news_focus, plus le même bonus de source que
+    quick_score_title. `words`: titre et résumé déjà découpés (tokenize),
+    partagés entre profils.
+    """
+    if words is not None:
+        score = relevance.score_words(words)
+    else:
+        score = relevance.score(article.get('title', ''), article.get('summary', ''))
+
+    tier = context.source_tier(article.get('source_name', ''))
+    if tier == 1:
+        score += 2.0
+    elif tier == 2:
+        score += 1.0
+
+    return score
+
+
+def make_relevance_scorer(context: ScoringContext) -> Optional[Bm25Scorer]:
+    """Instantané BM25 de l'index de pertinence si la config le demande, sinon None"""
+    quick = context.config.get('quick_scoring', {}) or {}
+    if quick.get('method', 'titles') != 'bm25':
+        return None
+
+    with RelevanceIndex() as index:
+        scorer = index.scorer(
+            context.preferences.get('news_focus', ''),
+            k1=quick.get('bm25_k1', 1.2),
+            b=quick.get('bm25_b', 0.75)
+        )
+        documents, avgdl = index.stats()
+    if not documents:
+        logger.warning("Index de pertinence vide: activer settings.relevance_index (sources.yaml) "
+                       "ou lancer scripts/relevance_index.py build")
+    logger.info(f"Score rapide BM25: {len(scorer.idf)} termes, index de {documents} articles "
+                f"(longueur moyenne {avgdl:.1f} mots)")
+    return scorer
+
+
+def load_articles_from_query(
+    query: str,
+    since: str = None,
+    until: str = None,
+    source_type: str = None,
+    raw: bool = False
+) -> Iterator[dict]:
+    """
+    Articles trouvés par recherche plein texte (data/veille.db), lus au fil
+    de l'eau. Requête FTS5 invalide (raw): sqlite3.OperationalError au
+    premier article.
+    """
+    from collectors.article_store import ArticleStore, resolve_since
+
+    with ArticleStore() as store:
+        yield from store.iter_search(
+            query,
+            since=resolve_since(since) if since else None,
+            until=until,
+            source_type=source_type,
+            limit=None,
+            with_content=True,
+            raw=raw
+        )
+
+
+def make_batch_scorer(context: ScoringContext, batch: bool) -> Optional[BatchScorer]:
+    """Scoring par lots (numpy) si demandé et disponible, sinon None (article par article)"""
+    if not (batch and NUMPY_AVAILABLE):
+        return None
+    return BatchScorer(context, article_content, timestamp_loader=article_timestamp)
+
+
+def select_candidates_streaming(
+    input_path: Optional[Path],
+    context: ScoringContext,
+    max_articles: int,
+    batch_scorer: Optional[BatchScorer] = None,
+    relevance: Optional[Bm25Scorer] = None,
+    articles: Iterable[dict] = None
+) -> Tuple[int, List[dict]]:
+    """
+    Phase 1 en flux: le JSONL (ou l'itérable articles) est lu et scoré par
+    lots de STREAM_BATCH_SIZE articles, seuls les max_articles meilleurs
+    restent en mémoire (tas). Même sélection et même ordre que le tri de la
+    liste complète.
+
+    Returns:
+        (nombre total d'articles, meilleurs candidats dans l'ordre)
+    """
+    # (score rapide, -position, article): le moins bon candidat en tête
+    heap = []
+    total = 0
+    for chunk in iter_article_batches(input_path, articles):
+        quick_scores = _quick_scores(chunk, context, batch_scorer, relevance)
+        _push_candidates(heap, quick_scores, chunk, total, max_articles)
+        total += len(chunk)
+
+    return total, _heap_candidates(heap)
+
+
+def iter_article_batches(input_path: Optional[Path], articles: Iterable[dict] = None) -> Iterator[List[dict]]:
+    """Articles par lots de STREAM_BATCH_SIZE: liste ou itérable fourni, sinon JSONL lu en flux"""
+    if articles is not None:
+        articles = iter(articles)
+        while True:
+            chunk = list(itertools.islice(articles, STREAM_BATCH_SIZE))
+            if not chunk:
+                break
+            yield chunk
+        return
+
+    with open(input_path, 'r', encoding='utf-8') as f:
+        lines = (line for line in f if line.strip())
+        while True:
+            chunk = [json.loads(line) for line in itertools.islice(lines, STREAM_BATCH_SIZE)]
+            if not chunk:
+                break
+            yield chunk
+
+
+def _push_candidates(heap: list, quick_scores: List[float], chunk: List[dict], first: int, k: int):
+    """Ajoute un lot (positions first, first + 1...) au tas des k meilleurs (score rapide, -position, article)"""
+    for position, (quick_score, article) in enumerate(zip(quick_scores, chunk), first):
+        item = (quick_score, -position, article)
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif heap and item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+
+def _heap_candidates(heap: list) -> List[dict]:
+    """Candidats du tas par score rapide décroissant, puis ordre du fichier"""
+    heap.sort(key=lambda item: (-item[0], -item[1]))
+    return [article for _, _, article in heap]
+
+
+def split_byte_ranges(input_path: Path, chunks: int) -> List[Tuple[int, int]]:
+    """Découpe un fichier en tranches d'octets [début, fin) alignées sur les fins de ligne"""
+    size = input_path.stat().st_size
+    bounds = [0]
+    with open(input_path, 'rb') as f:
+        for i in range(1, chunks):
+            f.seek(max(size * i // chunks, bounds[-1]))
+            f.readline()
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def parse_jsonl_bytes(data: bytes, base: int = 0) -> Tuple[List[int], List[dict]]:
+    """
+    Articles d'un morceau de JSONL et position (octet) de leur ligne dans le
+    fichier, `base` étant la position du morceau.
+    """
+    offsets = []
+    articles = []
+    pos = base
+    for raw in data.split(b"\n"):
+        line = raw.decode('utf-8')
+        if line.strip():
+            offsets.append(pos)
+            articles.append(json.loads(line))
+        pos += len(raw) + 1
+    return offsets, articles
+
+
+def _quick_scores(
+    articles: List[dict],
+    context: ScoringContext,
+    batch_scorer: Optional[BatchScorer],
+    relevance: Optional[Bm25Scorer] = None
+) -> List[float]:
+    """Scores rapides (phase 1): BM25 si relevance est fourni, sinon titres, par lots si possible"""
+    if relevance is not None:
+        return [quick_score_bm25(a, context, relevance) for a in articles]
+    if batch_scorer:
+        return batch_scorer.quick_scores(articles)
+    return [quick_score_title(a, context.config, context.preferences, context) for a in articles]
+
+
+# Contexte de scoring d'un processus de l'analyse parallèle (chargé une fois)
+_worker_context: Optional[ScoringContext] = None
+_worker_scorer: Optional[BatchScorer] = None
+_worker_relevance: Optional[Bm25Scorer] = None
+
+
+def _init_worker(context: ScoringContext, batch: bool, relevance: Optional[Bm25Scorer] = None):
+    global _worker_context, _worker_scorer, _worker_relevance
+    _worker_context = context
+    _worker_scorer = make_batch_scorer(context, batch)
+    _worker_relevance = relevance
+
+
+def _rank_key(item: tuple) -> tuple:
+    """Ordre de la phase 1: score rapide décroissant, puis ordre du fichier"""
+    quick_score, offset, _ = item
+    return -quick_score, offset
+
+
+def _quick_score_chunk(input_path: str, start: int, end: int, k: int) -> Tuple[int, list]:
+    """
+    Score rapide d'une tranche du JSONL (dans un processus de travail).
+
+    Returns:
+        (nombre d'articles, k meilleurs (score rapide, position, article)
+         triés selon _rank_key)
+    """
+    with open(input_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    offsets, articles = parse_jsonl_bytes(data, start)
+    quick_scores = _quick_scores(articles, _worker_context, _worker_scorer, _worker_relevance)
+
+    top = heapq.nsmallest(k, zip(quick_scores, offsets, articles), key=_rank_key)
+    return len(articles), top
+
+
+def select_candidates_parallel(
     input_path: Path,
+    context: ScoringContext,
+    max_articles: int,
+    workers: int,
+    batch: bool = True,
+    relevance: Optional[Bm25Scorer] = None
+) -> Tuple[int, List[dict]]:
+    """
+    Phase 1 répartie sur plusieurs processus: chaque processus score des
+    tranches d'octets du JSONL et garde ses max_articles meilleurs, fusionnés
+    ensuite (même sélection et même ordre que le chemin séquentiel).
+
+    Returns:
+        (nombre total d'articles, meilleurs candidats dans l'ordre)
+    """
+    chunks = max(1, min(workers * CHUNKS_PER_WORKER, input_path.stat().st_size // MIN_CHUNK_BYTES))
+    ranges = split_byte_ranges(input_path, chunks)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(context, batch, relevance)
+    ) as pool:
+        futures = [
+            pool.submit(_quick_score_chunk, str(input_path), start, end, max_articles)
+            for start, end in ranges
+        ]
+        results = [future.result() for future in futures]
+
+    total = sum(count for count, _ in results)
+    merged = heapq.merge(*(top for _, top in results), key=_rank_key)
+    return total, [article for _, _, article in itertools.islice(merged, max_articles)]
+
+
+def analyze_articles(
+    input_path: Optional[Path],
     config: dict,
-    max_articles: int = None
+    max_articles: int = None,
+    articles: List[dict] = None,
+    context: ScoringContext = None,
+    batch: bool = True,
+    workers: int = 1,
+    now: int = None,
+    relevance: Bm25Scorer = None
 ) -> Dict:
     """
     Analyse les articles en 2 passes:
     1. Score rapide sur TOUS les titres (basé sur préférences utilisateur)
     2. Analyse complète des meilleurs articles
 
+    Args:
+        input_path: Fichier JSONL à analyser
+        config: Configuration de scoring
+        max_articles: Nombre max d'articles analysés en phase 2
+        articles: Articles déjà chargés, input_path n'est alors pas lu. Un
+                  itérable qui n'est pas une liste (ex: résultats d'une
+                  recherche) est lu en flux
+        context: Contexte de scoring précompilé (construit depuis config
+                 et content_preferences.json si absent)
+        batch: Scorer tous les articles d'un coup avec numpy (si installé),
+               sinon article par article (chemin de référence)
+        workers: Processus pour la phase 1 sur input_path (1 = séquentiel)
+        now: Date de référence (epoch) de la fraîcheur, défaut: maintenant
+        relevance: Scoreur BM25 de la phase 1 (défaut: instantané de l'index
+                   de pertinence si quick_scoring.method vaut bm25)
+
     Returns:
         Dict avec les résultats d'analyse
     """
-    articles = load_articles(input_path)
     thresholds = config.get('thresholds', {})
-    preferences = load_content_preferences()
+    if context is None:
+        context = ScoringContext(config, load_content_preferences())
 
     if max_articles is None:
         max_articles = thresholds.get('max_articles_to_analyze', 30)
 
-    logger.info(f"Phase 1: Score rapide de {len(articles)} titres selon preferences utilisateur...")
+    batch_scorer = make_batch_scorer(context, batch)
+    if relevance is None:
+        relevance = make_relevance_scorer(context)
+
+    if articles is None and workers > 1:
+        logger.info(f"Phase 1: Score rapide des titres de {input_path} sur {workers} processus...")
+        total_articles, top_candidates = select_candidates_parallel(
+            input_path, context, max_articles, workers, batch, relevance
+        )
+    elif articles is None or not isinstance(articles, list):
+        source = input_path if articles is None else "la recherche"
+        logger.info(f"Phase 1: Score rapide des titres de {source} (lecture en flux)...")
+        total_articles, top_candidates = select_candidates_streaming(
+            input_path, context, max_articles, batch_scorer, relevance, articles
+        )
+    else:
+        total_articles = len(articles)
 
-    # Phase 1: Score rapide sur tous les titres (basé sur news_focus)
-    articles_with_quick_score = []
-    for article in articles:
-        quick_score = quick_score_title(article, config, preferences)
-        articles_with_quick_score.append({
-            'article': article,
-            'quick_score': quick_score
-        })
+        logger.info(f"Phase 1: Score rapide de {len(articles)} titres selon preferences utilisateur...")
 
-    # Trier par score rapide et prendre les meilleurs
-    articles_with_quick_score.sort(key=lambda x: x['quick_score'], reverse=True)
-    top_candidates = [item['article'] for item in articles_with_quick_score[:max_articles]]
+        # Phase 1: Score rapide sur tous les titres (basé sur news_focus)
+        quick_scores = _quick_scores(articles, context, batch_scorer, relevance)
+
+        articles_with_quick_score = []
+        for article, quick_score in zip(articles, quick_scores):
+            articles_with_quick_score.append({
+                'article': article,
+                'quick_score': quick_score
+            })
+
+        # Trier par score rapide et prendre les meilleurs
+        articles_with_quick_score.sort(key=lambda x: x['quick_score'], reverse=True)
+        top_candidates = [item['article'] for item in articles_with_quick_score[:max_articles]]
 
     logger.info(f"Phase 2: Analyse complete de {len(top_candidates)} articles selectionnes...")
 
     # Phase 2: Analyse complète des meilleurs candidats
-    analyzed = []
-    for article in top_candidates:
-        result = score_article(article, config)
+    analyzed = analyze_candidates(top_candidates, config, context, batch_scorer, now)
+
+    peak = peak_rss_mb()
+    if peak is not None:
+        logger.info(f"{total_articles} articles analysés, mémoire max: {peak:.0f} Mo")
+
+    return build_results(analyzed, total_articles, input_path, thresholds)
+
 
+def analyze_candidates(
+    candidates: List[dict],
+    config: dict,
+    context: ScoringContext,
+    batch_scorer: Optional[BatchScorer] = None,
+    now: int = None
+) -> List[Dict]:
+    """Phase 2: score complet, angles et hashtags de chaque candidat (même ordre)"""
+    if now is None:
+        now = int(time.time())
+    if batch_scorer:
+        results = batch_scorer.score_articles(candidates, now)
+    else:
+        results = [score_article(a, config, context, now) for a in candidates]
+    return candidate_entries(candidates, results, config)
+
+
+def candidate_entries(candidates: List[dict], results: List[Dict], config: dict) -> List[Dict]:
+    """Entrées des résultats d'analyse (score_article, angles, hashtags) de chaque candidat"""
+    analyzed = []
+    for article, result in zip(candidates, results):
         analyzed.append({
             'title': article.get('title'),
             'url': article.get('url'),
@@ -371,7 +749,16 @@ def analyze_articles(
             'linkedin_angles': generate_linkedin_angles(article, result['categories']),
             'suggested_hashtags': suggest_hashtags(result['categories'], config)
         })
+    return analyzed
 
+
+def build_results(
+    analyzed: List[Dict],
+    total_articles: int,
+    input_path: Optional[Path],
+    thresholds: dict
+) -> Dict:
+    """Résultats d'analyse: candidats analysés triés par score, statistiques"""
     # Trier par score final décroissant
     analyzed.sort(key=lambda x: x['score'], reverse=True)
 
@@ -382,8 +769,8 @@ def analyze_articles(
 
     return {
         'date': datetime.utcnow().strftime('%Y-%m-%d'),
-        'input_file': str(input_path),
-        'total_articles': len(articles),
+        'input_file': str(input_path) if input_path else None,
+        'total_articles': total_articles,
         'analyzed': len(analyzed),
         'above_threshold': len(top_articles),
         'threshold_used': min_score,
@@ -393,12 +780,286 @@ def analyze_articles(
     }
 
 
-def save_results(results: Dict, output_dir: Path):
+def _profile_quick_scores(
+    chunk: List[dict],
+    contexts: List[ScoringContext],
+    multi: Optional[MultiProfileScorer],
+    relevances: List[Optional[Bm25Scorer]]
+) -> List[List[float]]:
+    """Scores rapides d'un lot pour chaque profil (automates et découpage en mots partagés)"""
+    keyword_scores = None
+    if multi and any(relevance is None for relevance in relevances):
+        keyword_scores = multi.quick_scores(chunk)
+    words = None
+    if any(relevance is not None for relevance in relevances):
+        words = [tokenize(f"{a.get('title', '') or ''} {a.get('summary', '') or ''}") for a in chunk]
+
+    scores = []
+    for i, (context, relevance) in enumerate(zip(contexts, relevances)):
+        if relevance is not None:
+            scores.append([quick_score_bm25(a, context, relevance, w) for a, w in zip(chunk, words)])
+        elif keyword_scores is not None:
+            scores.append(keyword_scores[i])
+        else:
+            scores.append(_quick_scores(chunk, context, None))
+    return scores
+
+
+def analyze_profiles(
+    input_path: Optional[Path],
+    profiles: Dict[str, ScoringContext],
+    max_articles: int = None,
+    articles: Iterable[dict] = None,
+    batch: bool = True,
+    now: int = None
+) -> Dict[str, Dict]:
+    """
+    Analyse pour plusieurs profils (variantes de scoring.yaml et des
+    préférences) en une seule lecture du corpus.
+
+    Le JSONL est lu et parsé une fois, par lots. Chaque lot est parcouru une
+    seule fois par un DFA réunissant les mots-clés de tous les profils
+    (MultiProfileScorer), titres et résumés sont découpés une fois pour les
+    profils en BM25. Chaque profil garde ses meilleurs candidats, puis la
+    phase 2 score l'union des candidats en un passage. Résultats identiques
+    à analyze_articles profil par profil.
+
+    Args:
+        input_path: Fichier JSONL à analyser
+        profiles: Nom du profil -> contexte de scoring
+        max_articles: Articles analysés en phase 2 par profil (défaut: seuil
+                      max_articles_to_analyze de chaque profil)
+        articles: Articles déjà chargés ou itérable lu en flux (ex: résultats
+                  d'une recherche), input_path n'est alors pas lu
+        batch: Scoring par lots numpy (si installé), sinon article par article
+        now: Date de référence (epoch) de la fraîcheur, défaut: maintenant
+
+    Returns:
+        Nom du profil -> résultats d'analyse (comme analyze_articles)
+    """
+    if now is None:
+        now = int(time.time())
+
+    names = list(profiles)
+    contexts = [profiles[name] for name in names]
+    limits = [
+        max_articles if max_articles is not None
+        else context.config.get('thresholds', {}).get('max_articles_to_analyze', 30)
+        for context in contexts
+    ]
+    relevances = [make_relevance_scorer(context) for context in contexts]
+    multi = None
+    if batch and NUMPY_AVAILABLE:
+        multi = MultiProfileScorer(contexts, article_content, timestamp_loader=article_timestamp)
+
+    source = input_path if articles is None else "la sélection d'articles"
+    logger.info(f"Phase 1: Score rapide de {source} pour {len(names)} profils ({', '.join(names)})...")
+
+    heaps = [[] for _ in names]
+    total = 0
+    for chunk in iter_article_batches(input_path, articles):
+        quick_scores = _profile_quick_scores(chunk, contexts, multi, relevances)
+        for heap, profile_scores, k in zip(heaps, quick_scores, limits):
+            _push_candidates(heap, profile_scores, chunk, total, k)
+        total += len(chunk)
+    candidates = [_heap_candidates(heap) for heap in heaps]
+
+    # Phase 2: un seul passage sur l'union des candidats de tous les profils
+    union = list({id(a): a for profile_candidates in candidates for a in profile_candidates}.values())
+    logger.info(f"Phase 2: Analyse complete de {len(union)} articles (candidats des {len(names)} profils)...")
+    if multi:
+        position = {id(a): i for i, a in enumerate(union)}
+        union_results = multi.score_articles(union, now)
+        profile_results = [
+            [results[position[id(a)]] for a in profile_candidates]
+            for results, profile_candidates in zip(union_results, candidates)
+        ]
+    else:
+        profile_results = [
+            [score_article(a, context.config, context, now) for a in profile_candidates]
+            for context, profile_candidates in zip(contexts, candidates)
+        ]
+
+    peak = peak_rss_mb()
+    if peak is not None:
+        logger.info(f"{total} articles analysés pour {len(names)} profils, mémoire max: {peak:.0f} Mo")
+
+    return {
+        name: build_results(
+            candidate_entries(profile_candidates, results, context.config),
+            total, input_path, context.config.get('thresholds', {})
+        )
+        for name, context, profile_candidates, results
+        in zip(names, contexts, candidates, profile_results)
+    }
+
+
+def _state_digest(context: ScoringContext, max_articles: int) -> str:
+    """Empreinte de ce qui détermine les résultats (config, préférences, nb de candidats)"""
+    payload = json.dumps(
+        [context.config, context.preferences, max_articles],
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_incremental_state(state_path: Path, input_path: Path, digest: str) -> Optional[dict]:
+    """
+    État de la dernière analyse incrémentale d'un fichier.
+
+    None (tout reprendre) si l'état est absent, illisible ou d'un format
+    antérieur, si la config ou les préférences ont changé, ou si le fichier
+    a été réécrit (plus court, ou dernière ligne lue différente).
+    """
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"État incrémental illisible ({state_path}): {e}")
+        return None
+
+    if state.get('digest') != digest or state.get('input_file') != str(input_path):
+        logger.info("Config de scoring modifiée: analyse complète")
+        return None
+    if state.get('version') != INCREMENTAL_STATE_VERSION:
+        logger.info("État incrémental d'un format antérieur: analyse complète")
+        return None
+
+    offset = state.get('offset', 0)
+    if offset:
+        if input_path.stat().st_size < offset:
+            logger.info(f"{input_path} réécrit: analyse complète")
+            return None
+        with open(input_path, 'rb') as f:
+            f.seek(state['last_line_start'])
+            try:
+                _, last = parse_jsonl_bytes(f.read(offset - state['last_line_start']))
+            except ValueError:
+                last = []
+        if not last or last[-1].get('id') != state.get('last_id'):
+            logger.info(f"{input_path} réécrit: analyse complète")
+            return None
+
+    return state
+
+
+def save_incremental_state(state_path: Path, state: dict):
+    """Écrit l'état incrémental (écriture atomique)"""
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp_path, state_path)
+
+
+def analyze_incremental(
+    input_path: Path,
+    config: dict,
+    max_articles: int = None,
+    context: ScoringContext = None,
+    batch: bool = True,
+    state_dir: Path = STATE_DIR,
+    now: int = None
+) -> Dict:
+    """
+    Analyse incrémentale d'un JSONL complété au fil de la journée.
+
+    Seules les lignes ajoutées depuis le dernier passage (position en octets
+    et ID du dernier article gardés dans state_dir) sont lues et scorées en
+    phase 1. Les max_articles meilleurs candidats, articles compris, sont
+    gardés dans l'état: la phase 1 ne dépend pas de l'heure, et la phase 2
+    de ces seuls candidats est refaite à chaque passage pour que la
+    fraîcheur soit calculée maintenant. Résultats identiques à
+    analyze_articles sur le fichier entier à la même date. Le score rapide
+    BM25 garde les statistiques de l'index du premier passage.
+
+    Une ligne sans fin de ligne (en cours d'écriture) attend le passage
+    suivant.
+
+    Args:
+        now: Date de référence (epoch) de la fraîcheur, défaut: maintenant
+
+    Returns:
+        Dict avec les résultats d'analyse, plus 'new_articles'
+    """
+    thresholds = config.get('thresholds', {})
+    if context is None:
+        context = ScoringContext(config, load_content_preferences())
+
+    if max_articles is None:
+        max_articles = thresholds.get('max_articles_to_analyze', 30)
+
+    state_path = Path(state_dir) / f"{input_path.stem}.json"
+    digest = _state_digest(context, max_articles)
+    state = load_incremental_state(state_path, input_path, digest)
+    if state is None:
+        relevance = make_relevance_scorer(context)
+        state = {
+            'version': INCREMENTAL_STATE_VERSION,
+            'offset': 0,
+            'last_line_start': 0,
+            'last_id': None,
+            'relevance': relevance.to_dict() if relevance else None,
+            'total_articles': 0,
+            'candidates': [],
+        }
+    else:
+        relevance = Bm25Scorer.from_dict(state['relevance']) if state.get('relevance') else None
+
+    # Lignes complètes ajoutées depuis le dernier passage
+    start = state['offset']
+    with open(input_path, 'rb') as f:
+        f.seek(start)
+        data = f.read()
+    data = data[:data.rfind(b"\n") + 1]
+    offsets, articles = parse_jsonl_bytes(data, start)
+
+    logger.info(f"Incrémental: {len(articles)} nouveaux articles dans {input_path} (depuis l'octet {start})")
+
+    batch_scorer = make_batch_scorer(context, batch)
+    quick_scores = _quick_scores(articles, context, batch_scorer, relevance)
+
+    # Top-k maintenu: anciens candidats et nouveaux articles (score rapide, position, article)
+    new_top = heapq.nsmallest(max_articles, zip(quick_scores, offsets, articles), key=_rank_key)
+    old_top = [tuple(candidate) for candidate in state['candidates']]
+    candidates = [
+        list(item) for item in
+        itertools.islice(heapq.merge(old_top, new_top, key=_rank_key), max_articles)
+    ]
+
+    # Phase 2 de tous les candidats, fraîcheur à la date de ce passage
+    logger.info(f"Phase 2: Analyse complete de {len(candidates)} candidats...")
+    analyzed = analyze_candidates(
+        [article for _, _, article in candidates], config, context, batch_scorer, now
+    )
+
+    if articles:
+        state.update({
+            'last_line_start': offsets[-1],
+            'last_id': articles[-1].get('id'),
+        })
+    state.update({
+        'input_file': str(input_path),
+        'digest': digest,
+        'offset': start + len(data),
+        'total_articles': state['total_articles'] + len(articles),
+        'candidates': candidates,
+    })
+    save_incremental_state(state_path, state)
+
+    results = build_results(analyzed, state['total_articles'], input_path, thresholds)
+    results['new_articles'] = len(articles)
+    return results
+
+
+def save_results(results: Dict, output_dir: Path, suffix: str = ""):
     """Sauvegarde les résultats d'analyse"""
     output_dir.mkdir(parents=True, exist_ok=True)
 
     date_str = results.get('date', datetime.utcnow().strftime('%Y-%m-%d'))
-    output_file = output_dir / f"analyzed_{date_str}.json"
+    output_file = output_dir / f"analyzed_{date_str}{suffix}.json"
 
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(results, f, ensure_ascii=False, indent=2)
@@ -423,6 +1084,35 @@ def main():
         default=None,
         help="Chemin vers le fichier JSONL à analyser"
     )
+    parser.add_argument(
+        '--query',
+        type=str,
+        default=None,
+        help="Analyser les articles trouvés par cette recherche plein texte"
+    )
+    parser.add_argument(
+        '--since',
+        type=str,
+        default=None,
+        help="Avec --query: début de période (YYYY-MM-DD ou 14d, 2w)"
+    )
+    parser.add_argument(
+        '--until',
+        type=str,
+        default=None,
+        help="Avec --query: fin de période incluse (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        '--source',
+        type=str,
+        default=None,
+        help="Avec --query: limiter à un source_type (rss, reddit...)"
+    )
+    parser.add_argument(
+        '--fts',
+        action='store_true',
+        help="Avec --query: requête en syntaxe FTS5 (AND/OR/NOT, \"phrases\", préfixe*)"
+    )
     parser.add_argument(
         '--max',
         type=int,
@@ -434,41 +1124,167 @@ def main():
         action='store_true',
         help="Sortie JSON des résultats"
     )
+    parser.add_argument(
+        '--reference',
+        action='store_true',
+        help="Scorer article par article, sans le scoring par lots numpy"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help="Processus pour le score rapide d'un fichier (0 = tous les cœurs)"
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help="Ne scorer que les articles ajoutés au fichier depuis le dernier passage"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Recompiler le contexte de scoring sans lire ni écrire data/scoring_context.pickle"
+    )
+    parser.add_argument(
+        '--profile',
+        action='append',
+        default=None,
+        metavar="NOM=SCORING_YAML[,PREFERENCES_JSON]",
+        help="Profil de scoring (répétable): une analyse par profil, articles lus une seule fois"
+    )
 
     args = parser.parse_args()
 
-    # Charger la config
-    config = load_scoring_config()
+    if args.profile:
+        if args.incremental or args.workers != 1:
+            parser.error("--profile est incompatible avec --incremental et --workers")
+        try:
+            profiles = load_profiles(args.profile, use_cache=not args.no_cache)
+        except ValueError as e:
+            parser.error(str(e))
+        return main_profiles(args, profiles)
+
+    # Charger la config (contexte précompilé, repris du cache s'il est à jour)
+    context = ScoringContext.load(
+        CONFIG_PATH, PREFS_PATH,
+        cache_path=None if args.no_cache else DEFAULT_CACHE_PATH
+    )
+    config = context.config
+
+    if args.query:
+        articles = load_articles_from_query(args.query, args.since, args.until, args.source, args.fts)
+        try:
+            results = analyze_articles(None, config, args.max, articles=articles, context=context,
+                                       batch=not args.reference)
+        except sqlite3.OperationalError as e:
+            logger.error(f"Recherche invalide \"{args.query}\": {e}")
+            return 1
+        logger.info(f"Recherche \"{args.query}\": {results['total_articles']} articles")
+        results['query'] = args.query
+
+        # Ne pas écraser l'analyse du jour
+        slug = re.sub(r"[^\w]+", "-", args.query.lower()).strip("-")[:40]
+        save_results(results, OUTPUT_DIR, suffix=f"_q-{slug}")
+    else:
+        # Déterminer le fichier d'entrée
+        input_path = resolve_input_path(args)
+        if not input_path.exists():
+            logger.error(f"Fichier non trouvé: {input_path}")
+            return 1
+
+        # Analyser
+        if args.incremental:
+            results = analyze_incremental(input_path, config, args.max, context=context,
+                                          batch=not args.reference)
+        else:
+            results = analyze_articles(input_path, config, args.max, context=context,
+                                       batch=not args.reference, workers=args.workers or os.cpu_count())
+
+        # Sauvegarder
+        save_results(results, OUTPUT_DIR)
+
+    # Afficher le résumé
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print_summary(results)
+
+    return 0
 
-    # Déterminer le fichier d'entrée
+
+def resolve_input_path(args) -> Path:
+    """Fichier JSONL à analyser: --input, sinon celui de --date (défaut: aujourd'hui)"""
     if args.input:
-        input_path = Path(args.input)
+        return Path(args.input)
+    date_str = args.date or datetime.utcnow().strftime('%Y-%m-%d')
+    return RAW_DIR / f"articles_{date_str}.jsonl"
+
+
+def print_summary(results: Dict, title: str = "RÉSUMÉ DE L'ANALYSE"):
+    print(f"\n{'='*50}")
+    print(title)
+    print(f"{'='*50}")
+    print(f"Articles analysés: {results['analyzed']}")
+    print(f"Score >= {results['threshold_used']}: {results['above_threshold']}")
+    print("\nTop 5 articles:")
+    for i, article in enumerate(results['top_articles'][:5], 1):
+        print(f"  {i}. [{article['score']}/10] {article['title'][:60]}...")
+
+
+def load_profiles(specs: List[str], use_cache: bool = True) -> Dict[str, ScoringContext]:
+    """
+    Contextes des profils "nom=scoring.yaml[,preferences.json]" (préférences
+    par défaut: config/content_preferences.json). Chaque profil a son propre
+    cache de contexte (data/scoring_context_<nom>.pickle).
+    """
+    profiles = {}
+    for spec in specs:
+        name, sep, paths = spec.partition('=')
+        name = name.strip()
+        if not sep or not re.fullmatch(r"[\w-]+", name) or not paths:
+            raise ValueError(f"Profil invalide: {spec!r} (attendu: nom=scoring.yaml[,preferences.json])")
+        if name in profiles:
+            raise ValueError(f"Profil en double: {name}")
+        scoring_path, _, prefs_path = paths.partition(',')
+        cache_path = DEFAULT_CACHE_PATH.with_name(f"scoring_context_{name}.pickle") if use_cache else None
+        profiles[name] = ScoringContext.load(
+            Path(scoring_path), Path(prefs_path) if prefs_path else PREFS_PATH, cache_path=cache_path
+        )
+    return profiles
+
+
+def main_profiles(args, profiles: Dict[str, ScoringContext]) -> int:
+    """main() avec --profile: une analyse et un fichier de résultats par profil"""
+    articles = None
+    input_path = None
+    suffix = ""
+    if args.query:
+        articles = load_articles_from_query(args.query, args.since, args.until, args.source, args.fts)
+        suffix = "_q-" + re.sub(r"[^\w]+", "-", args.query.lower()).strip("-")[:40]
     else:
-        date_str = args.date or datetime.utcnow().strftime('%Y-%m-%d')
-        input_path = RAW_DIR / f"articles_{date_str}.jsonl"
+        input_path = resolve_input_path(args)
+        if not input_path.exists():
+            logger.error(f"Fichier non trouvé: {input_path}")
+            return 1
 
-    if not input_path.exists():
-        logger.error(f"Fichier non trouvé: {input_path}")
+    try:
+        all_results = analyze_profiles(input_path, profiles, args.max, articles=articles,
+                                       batch=not args.reference)
+    except sqlite3.OperationalError as e:
+        logger.error(f"Recherche invalide \"{args.query}\": {e}")
         return 1
 
-    # Analyser
-    results = analyze_articles(input_path, config, args.max)
-
-    # Sauvegarder
-    save_results(results, OUTPUT_DIR)
+    for name, results in all_results.items():
+        if args.query:
+            results['query'] = args.query
+        results['profile'] = name
+        save_results(results, OUTPUT_DIR, suffix=f"{suffix}_p-{name}")
 
-    # Afficher le résumé
     if args.json:
-        print(json.dumps(results, ensure_ascii=False, indent=2))
+        print(json.dumps(all_results, ensure_ascii=False, indent=2))
     else:
-        print(f"\n{'='*50}")
-        print("RÉSUMÉ DE L'ANALYSE")
-        print(f"{'='*50}")
-        print(f"Articles analysés: {results['analyzed']}")
-        print(f"Score >= {results['threshold_used']}: {results['above_threshold']}")
-        print(f"\nTop 5 articles:")
-        for i, article in enumerate(results['top_articles'][:5], 1):
-            print(f"  {i}. [{article['score']}/10] {article['title'][:60]}...")
+        for name, results in all_results.items():
+            print_summary(results, f"RÉSUMÉ DE L'ANALYSE - PROFIL {name}")
 
     return 0
 
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Archive des articles bruts - Post Veille IA
+
+Convertit les JSONL de la collecte en segments compressés indexés
+(collectors/archive.py) et interroge l'archive.
+
+Usage:
+    python scripts/archive_articles.py convert                # JSONL antérieurs à aujourd'hui
+    python scripts/archive_articles.py convert --keep-days 7 --delete-jsonl
+    python scripts/archive_articles.py get 3f2a9c1e0b7d4a65
+    python scripts/archive_articles.py list --source reddit --from 2026-01-01 --to 2026-01-31
+    python scripts/archive_articles.py stats
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from collectors.archive import ArchiveReader, ArchiveWriter, archive_old_jsonl
+
+# Configuration logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RAW_DIR = PROJECT_ROOT / "output" / "raw-articles"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive compressée des articles bruts")
+    parser.add_argument('--archive-dir', type=str, default=None, help="Dossier de l'archive")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert = subparsers.add_parser('convert', help="Archive les JSONL existants")
+    convert.add_argument('--raw-dir', type=str, default=None, help="Dossier des JSONL")
+    convert.add_argument('--keep-days', type=int, default=0,
+                         help="Jours récents laissés en JSONL (défaut: 0, seul le jour courant)")
+    convert.add_argument('--delete-jsonl', action='store_true',
+                         help="Supprimer les JSONL entièrement archivés par cet import")
+
+    get = subparsers.add_parser('get', help="Affiche un article par ID")
+    get.add_argument('article_id')
+
+    list_cmd = subparsers.add_parser('list', help="Liste les articles archivés")
+    list_cmd.add_argument('--source', type=str, default=None, help="source_type (rss, reddit...)")
+    list_cmd.add_argument('--from', dest='date_from', type=str, default=None, help="YYYY-MM-DD")
+    list_cmd.add_argument('--to', dest='date_to', type=str, default=None, help="YYYY-MM-DD")
+    list_cmd.add_argument('--json', action='store_true', help="Articles complets en JSONL")
+
+    subparsers.add_parser('stats', help="Statistiques de l'archive")
+
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        raw_dir = Path(args.raw_dir) if args.raw_dir else RAW_DIR
+        with ArchiveWriter(args.archive_dir) as writer:
+            result = archive_old_jsonl(
+                raw_dir, writer, keep_days=args.keep_days, delete=args.delete_jsonl
+            )
+        logger.info(f"{result['files']} fichiers archivés ({result['articles']} articles, "
+                    f"{result['deleted']} JSONL supprimés)")
+        return 0
+
+    with ArchiveReader(args.archive_dir) as reader:
+        if args.command == 'get':
+            article = reader.get(args.article_id)
+            if article is None:
+                print(f"Article introuvable: {args.article_id}")
+                return 1
+            print(json.dumps(article, indent=2, ensure_ascii=False))
+
+        elif args.command == 'list':
+            for article in reader.iter_articles(args.source, args.date_from, args.date_to):
+                if args.json:
+                    print(json.dumps(article, ensure_ascii=False))
+                else:
+                    print(f"{article['id']}  {article.get('source_name', '')[:20]:<20}  {article.get('title', '')[:80]}")
+
+        elif args.command == 'stats':
+            print(json.dumps(reader.get_stats(), indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
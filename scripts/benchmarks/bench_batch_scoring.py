@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Parité et benchmark du scoring par lots - Post Veille IA
+
+Compare BatchScorer (numpy, scoring/batch.py) au chemin de référence article
+par article (quick_score_title, score_article):
+  1. parité: scores rapides, scores, détail par critère (dont la fraîcheur,
+     dates de publication variées autour des seuils) et catégories
+     identiques sur chaque article (code de sortie 1 sinon)
+  2. temps des deux chemins
+
+Usage:
+    python scripts/benchmarks/bench_batch_scoring.py
+    python scripts/benchmarks/bench_batch_scoring.py --count 300000
+    python scripts/benchmarks/bench_batch_scoring.py --input output/raw-articles/articles_2026-01-15.jsonl
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le dossier scripts au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyze_articles import (
+    load_articles,
+    load_content_preferences,
+    load_scoring_config,
+    quick_score_title,
+    score_article
+)
+from bench_keyword_engine import make_articles
+from scoring import AHOCORASICK_AVAILABLE, NUMPY_AVAILABLE, BatchScorer, ScoringContext
+
+# news_focus utilisé si content_preferences.json n'en a pas
+DEFAULT_NEWS_FOCUS = (
+    "Je cherche des news sur les LLM, les agents autonomes, OpenAI, Anthropic, "
+    "Mistral, la régulation européenne et l'IA générative en entreprise"
+)
+
+
+def add_publication_dates(articles: list, now: int, seed: int = 42):
+    """published_ts (comme à la collecte) de 0 à 5 jours, seuils exacts inclus; 10 % sans date"""
+    rng = random.Random(seed)
+    boundaries = [24 * 3600, 72 * 3600]
+    for article in articles:
+        if rng.random() < 0.1:
+            continue
+        if rng.random() < 0.05:
+            age = rng.choice(boundaries) + rng.choice([-1, 0, 1])
+        else:
+            age = rng.randint(-3600, 5 * 24 * 3600)   # Quelques dates dans le futur
+        article['published_ts'] = now - age
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parité et benchmark du scoring par lots")
+    parser.add_argument('--count', type=int, default=100_000, help="Articles synthétiques")
+    parser.add_argument('--input', type=str, default=None, help="Fichier JSONL réel")
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("numpy non installé: pip install numpy")
+        return 1
+
+    config = load_scoring_config()
+    preferences = load_content_preferences()
+    if not preferences.get('news_focus'):
+        preferences = dict(preferences, news_focus=DEFAULT_NEWS_FOCUS)
+
+    if args.input:
+        articles = load_articles(Path(args.input))
+    else:
+        articles = make_articles(args.count, config)
+    now = int(time.time())
+    if not args.input:
+        add_publication_dates(articles, now)
+
+    backend = "pyahocorasick" if AHOCORASICK_AVAILABLE else "Python"
+    print(f"Articles: {len(articles)} - automate: {backend}")
+
+    context = ScoringContext(config, preferences)
+    batch = BatchScorer(context)
+
+    timings = {}
+
+    start = time.perf_counter()
+    quick_reference = [quick_score_title(a, config, preferences, context) for a in articles]
+    timings['quick_reference'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    quick_batch = batch.quick_scores(articles)
+    timings['quick_batch'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = [score_article(a, config, context, now) for a in articles]
+    timings['full_reference'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = batch.score_articles(articles, now)
+    timings['full_batch'] = time.perf_counter() - start
+
+    print(f"Score rapide  - référence: {timings['quick_reference']:.2f} s, "
+          f"lots: {timings['quick_batch']:.2f} s "
+          f"(x{timings['quick_reference'] / timings['quick_batch']:.1f})")
+    print(f"Score complet - référence: {timings['full_reference']:.2f} s, "
+          f"lots: {timings['full_batch']:.2f} s "
+          f"(x{timings['full_reference'] / timings['full_batch']:.1f})")
+
+    quick_mismatches = [i for i, (a, b) in enumerate(zip(quick_reference, quick_batch)) if a != b]
+    mismatches = [i for i, (a, b) in enumerate(zip(reference, results)) if a != b]
+
+    if quick_mismatches or mismatches:
+        print(f"PARITÉ KO: {len(quick_mismatches)} scores rapides, {len(mismatches)} scores différents")
+        for i in quick_mismatches[:5]:
+            print(f"  {articles[i].get('title', '')[:60]!r}: {quick_reference[i]} != {quick_batch[i]}")
+        for i in mismatches[:5]:
+            print(f"  {articles[i].get('title', '')[:60]!r}")
+            print(f"    référence: {reference[i]}")
+            print(f"    lots:      {results[i]}")
+        return 1
+
+    print("Parité OK: scores rapides, scores, détails et catégories identiques")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
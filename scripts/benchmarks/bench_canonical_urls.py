@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark canonicalisation des URLs - Post Veille IA
+
+Sur le JSONL d'une journée de collecte, compte les articles qui ne forment
+qu'une seule page une fois les URLs canonicalisées (tracking, www., AMP,
+redirections...) et mesure le travail d'analyse (score rapide des titres)
+ainsi évité.
+
+Usage:
+    python scripts/benchmarks/bench_canonical_urls.py --date 2026-01-15
+    python scripts/benchmarks/bench_canonical_urls.py --input output/raw-articles/articles_2026-01-15.jsonl
+"""
+
+import argparse
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+# Ajouter le dossier scripts au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyze_articles import (
+    RAW_DIR,
+    load_articles,
+    load_scoring_config,
+    load_content_preferences,
+    quick_score_title
+)
+from scoring import ScoringContext
+from collectors.urls import get_canonicalizer
+
+
+def time_quick_scores(articles: list, context: ScoringContext) -> float:
+    """Durée du score rapide (phase 1 de l'analyse) sur une liste d'articles"""
+    start = time.perf_counter()
+    for article in articles:
+        quick_score_title(article, context.config, context.preferences, context)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la canonicalisation des URLs")
+    parser.add_argument('--date', type=str, help="Date des articles (YYYY-MM-DD)")
+    parser.add_argument('--input', type=str, help="Fichier JSONL d'entrée")
+    parser.add_argument('--top', type=int, default=10, help="Groupes de variantes affichés")
+    args = parser.parse_args()
+
+    if args.input:
+        input_path = Path(args.input)
+    else:
+        date_str = args.date or datetime.utcnow().strftime('%Y-%m-%d')
+        input_path = RAW_DIR / f"articles_{date_str}.jsonl"
+
+    if not input_path.exists():
+        print(f"Fichier introuvable: {input_path}")
+        return 1
+
+    articles = load_articles(input_path)
+    canonicalizer = get_canonicalizer()
+
+    start = time.perf_counter()
+    canonical_urls = [canonicalizer.canonicalize(a.get('url', '')) for a in articles]
+    canon_seconds = time.perf_counter() - start
+
+    groups = defaultdict(list)
+    for article, canonical in zip(articles, canonical_urls):
+        groups[canonical].append(article)
+
+    # Référence: une entrée par URL brute (dédup actuelle par hash de l'URL)
+    raw_kept = list({a.get('url', ''): a for a in articles}.values())
+    kept = [variants[0] for variants in groups.values()]
+    removed = len(raw_kept) - len(kept)
+
+    context = ScoringContext(load_scoring_config(), load_content_preferences())
+    before_seconds = time_quick_scores(raw_kept, context)
+    after_seconds = time_quick_scores(kept, context)
+
+    print(f"Fichier: {input_path}")
+    print(f"Articles: {len(articles)}")
+    print(f"URLs brutes distinctes: {len(raw_kept)}")
+    print(f"URLs canoniques distinctes: {len(groups)}")
+    print(f"Articles à analyser en moins: {removed} ({removed / max(len(raw_kept), 1):.1%})")
+    print(f"Canonicalisation: {len(articles) / max(canon_seconds, 1e-9):,.0f} URLs/s")
+    print(f"Score rapide: {before_seconds * 1000:.1f} ms -> {after_seconds * 1000:.1f} ms")
+
+    collapsed = sorted(
+        (
+            (canonical, sorted({a.get('url', '') for a in variants}))
+            for canonical, variants in groups.items()
+        ),
+        key=lambda item: len(item[1]), reverse=True
+    )
+    collapsed = [item for item in collapsed if len(item[1]) > 1]
+    if collapsed:
+        print(f"\nVariantes regroupées (top {args.top}):")
+        for canonical, variant_urls in collapsed[:args.top]:
+            print(f"  {canonical}")
+            for url in variant_urls:
+                print(f"    - {url}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Parité et benchmark du moteur de mots-clés - Post Veille IA
+
+Compare score_article (automate d'Aho–Corasick, scoring/keywords.py) à
+l'implémentation historique (un test `kw.lower() in text` par mot-clé) :
+  1. parité: score, détail par critère et catégories identiques sur chaque
+     article (code de sortie 1 sinon)
+  2. temps de scoring des deux implémentations
+
+Articles synthétiques générés depuis les mots-clés de scoring.yaml (casse
+variée, mots-clés collés, caractères accentués), ou fichier JSONL réel.
+Contrôle de parité rapide sur un échantillon fixe: check_keyword_engine.py.
+
+Usage:
+    python scripts/benchmarks/bench_keyword_engine.py
+    python scripts/benchmarks/bench_keyword_engine.py --count 100000
+    python scripts/benchmarks/bench_keyword_engine.py --input output/raw-articles/articles_2026-01-15.jsonl
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le dossier scripts au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyze_articles import (
+    calculate_keyword_score,
+    detect_categories,
+    load_articles,
+    load_scoring_config,
+    score_article
+)
+from scoring import AHOCORASICK_AVAILABLE, KeywordEngine, ScoringContext
+
+FILLER = (
+    "the model was trained on a large corpus and evaluated against several "
+    "baselines while researchers noted improvements in reasoning and coding "
+    "café naïve Über straße ÉTÉ"
+).split()
+
+
+def legacy_score_article(article: dict, config: dict) -> dict:
+    """score_article avant le moteur de mots-clés (référence de parité)"""
+    criteria = config.get('scoring_criteria', {})
+    exclusions = config.get('exclusions', {})
+
+    title = article.get('title', '')
+    content = article.get('content', '')
+    summary = article.get('summary', '')
+    source = article.get('source_name', '')
+    full_text = f"{title} {content} {summary}"
+
+    scores = {}
+    total_weight = 0
+    weighted_sum = 0
+
+    audience = criteria.get('audience_relevance', {})
+    if audience:
+        weight = audience.get('weight', 0)
+        keywords = audience.get('keywords_boost', [])
+        score = calculate_keyword_score(full_text, keywords)
+        if calculate_keyword_score(title, keywords) > 0:
+            score = min(score + 0.3, 1.0)
+        scores['audience_relevance'] = score * 10
+        weighted_sum += score * weight
+        total_weight += weight
+
+    engagement = criteria.get('engagement_potential', {})
+    if engagement:
+        weight = engagement.get('weight', 0)
+        keywords = engagement.get('keywords_boost', [])
+        score = calculate_keyword_score(title, keywords)
+        scores['engagement_potential'] = score * 10
+        weighted_sum += score * weight
+        total_weight += weight
+
+    source_quality = criteria.get('source_quality', {})
+    if source_quality:
+        weight = source_quality.get('weight', 0)
+        tier1 = source_quality.get('tier_1_sources', [])
+        tier2 = source_quality.get('tier_2_sources', [])
+        if any(t1.lower() in source.lower() for t1 in tier1):
+            score = 1.0
+        elif any(t2.lower() in source.lower() for t2 in tier2):
+            score = 0.7
+        else:
+            score = 0.4
+        scores['source_quality'] = score * 10
+        weighted_sum += score * weight
+        total_weight += weight
+
+    timeliness = criteria.get('timeliness', {})
+    if timeliness:
+        weight = timeliness.get('weight', 0)
+        score = 0.7
+        scores['timeliness'] = score * 10
+        weighted_sum += score * weight
+        total_weight += weight
+
+    uniqueness = criteria.get('uniqueness', {})
+    if uniqueness:
+        weight = uniqueness.get('weight', 0)
+        title_length_score = min(len(title) / 80, 1.0)
+        scores['uniqueness'] = title_length_score * 10
+        weighted_sum += title_length_score * weight
+        total_weight += weight
+
+    final_score = (weighted_sum / total_weight) * 10 if total_weight > 0 else 5.0
+
+    negative_kw = exclusions.get('negative_keywords', [])
+    if any(nkw.lower() in full_text.lower() for nkw in negative_kw):
+        final_score *= 0.7
+
+    clickbait = exclusions.get('clickbait_patterns', [])
+    if any(cb.lower() in title.lower() for cb in clickbait):
+        final_score *= 0.8
+
+    final_score = round(min(max(final_score, 1), 10), 1)
+
+    return {
+        'score': final_score,
+        'breakdown': scores,
+        'categories': detect_categories(article, config)
+    }
+
+
+def config_keywords(config: dict) -> list:
+    engine = KeywordEngine.from_config(config)
+    return [kw for keywords in engine.lists.values() for kw in keywords]
+
+
+def random_case(word: str, rng: random.Random) -> str:
+    return rng.choice([word, word.lower(), word.upper(), word.title()])
+
+
+def make_articles(count: int, config: dict, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    keywords = config_keywords(config)
+    sources = keywords + ["Unknown Blog", "Medium", ""]
+
+    def text(n_words: int, keyword_rate: float) -> str:
+        words = []
+        for _ in range(n_words):
+            if rng.random() < keyword_rate:
+                word = random_case(rng.choice(keywords), rng)
+                # Mot-clé collé à un autre mot (correspondance dans le mot)
+                if rng.random() < 0.2:
+                    word = rng.choice(FILLER) + word
+            else:
+                word = rng.choice(FILLER)
+            words.append(word)
+        return " ".join(words)
+
+    return [
+        {
+            'title': text(rng.randint(0, 14), 0.25),
+            'content': text(rng.randint(0, 400), 0.03),
+            'summary': text(rng.randint(0, 40), 0.05) if rng.random() < 0.7 else '',
+            'source_name': rng.choice(sources),
+        }
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parité et benchmark du moteur de mots-clés")
+    parser.add_argument('--count', type=int, default=100_000, help="Articles synthétiques")
+    parser.add_argument('--input', type=str, default=None, help="Fichier JSONL réel")
+    args = parser.parse_args()
+
+    config = load_scoring_config()
+    if args.input:
+        articles = load_articles(Path(args.input))
+    else:
+        articles = make_articles(args.count, config)
+
+    backend = "pyahocorasick" if AHOCORASICK_AVAILABLE else "Python"
+    print(f"Articles: {len(articles)} - automate: {backend}")
+
+    start = time.perf_counter()
+    context = ScoringContext(config, {})
+    print(f"Compilation de l'automate: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    legacy = [legacy_score_article(a, config) for a in articles]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [score_article(a, config, context) for a in articles]
+    engine_seconds = time.perf_counter() - start
+
+    mismatches = [i for i, (a, b) in enumerate(zip(legacy, results)) if a != b]
+
+    print(f"Historique (in par mot-clé): {legacy_seconds:.2f} s")
+    print(f"Automate:                    {engine_seconds:.2f} s (x{legacy_seconds / engine_seconds:.1f})")
+
+    if mismatches:
+        print(f"PARITÉ KO: {len(mismatches)} articles différents")
+        for i in mismatches[:5]:
+            print(f"  {articles[i].get('title', '')[:60]!r}")
+            print(f"    historique: {legacy[i]}")
+            print(f"    automate:   {results[i]}")
+        return 1
+
+    print("Parité OK: scores, détails et catégories identiques")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
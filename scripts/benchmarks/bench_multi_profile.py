@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Parité et benchmark de l'analyse multi-profils - Post Veille IA
+
+Compare, sur le même JSONL, une analyse par profil (analyze_articles, le
+fichier relu et re-scoré à chaque fois) et analyze_profiles (une lecture,
+un passage des automates pour tous les profils):
+  1. parité: résultats identiques pour chaque profil (code de sortie 1 sinon)
+  2. temps des deux chemins pour 1 à --profiles profils
+
+Les profils sont des variantes de scoring.yaml (mots-clés d'audience et
+d'engagement, poids, seuils) et du news_focus.
+
+Usage:
+    python scripts/benchmarks/bench_multi_profile.py
+    python scripts/benchmarks/bench_multi_profile.py --count 200000 --profiles 8
+"""
+
+import argparse
+import copy
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ajouter le dossier scripts au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyze_articles import analyze_articles, analyze_profiles, load_scoring_config
+from bench_batch_scoring import DEFAULT_NEWS_FOCUS
+from bench_parallel_analysis import write_articles
+from scoring import NUMPY_AVAILABLE, ScoringContext
+
+NEWS_FOCUS_VARIANTS = [
+    DEFAULT_NEWS_FOCUS,
+    "Recrutement, RH, productivité des équipes et adoption de l'IA en entreprise",
+    "Puces NVIDIA, GPU, infrastructure des datacenters et coûts d'inférence",
+    "Recherche: papers arXiv, benchmarks, raisonnement et modèles open source",
+    "Startups IA, levées de fonds, acquisitions et stratégie de Google et Microsoft",
+    "Sécurité, alignement, régulation européenne et risques des modèles",
+    "Outils pour développeurs: API, SDK, agents de code et automatisation",
+    "Vision, vidéo, audio et modèles multimodaux",
+]
+
+
+def make_profiles(count: int, config: dict, seed: int = 7) -> dict:
+    """Variantes de la config et du news_focus (profil 0: config d'origine)"""
+    rng = random.Random(seed)
+    category_keywords = [kw for cat in config.get('categories', []) for kw in cat.get('keywords', [])]
+    profiles = {}
+    for i in range(count):
+        variant = copy.deepcopy(config)
+        criteria = variant.get('scoring_criteria', {})
+        if i:
+            for name in ('audience_relevance', 'engagement_potential'):
+                keywords = criteria.get(name, {}).get('keywords_boost', [])
+                if keywords:
+                    kept = rng.sample(keywords, max(1, len(keywords) * 2 // 3))
+                    criteria[name]['keywords_boost'] = kept + rng.sample(category_keywords, 5)
+            for criterion in criteria.values():
+                criterion['weight'] = criterion.get('weight', 0) + rng.randint(-5, 5)
+            variant.setdefault('thresholds', {})['max_articles_to_analyze'] = rng.choice([20, 50, 100])
+        preferences = {'news_focus': NEWS_FOCUS_VARIANTS[i % len(NEWS_FOCUS_VARIANTS)]}
+        profiles[f"p{i}"] = ScoringContext(variant, preferences)
+    return profiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parité et benchmark de l'analyse multi-profils")
+    parser.add_argument('--count', type=int, default=100_000, help="Articles synthétiques")
+    parser.add_argument('--profiles', type=int, default=4, help="Nombre max de profils")
+    args = parser.parse_args()
+
+    config = load_scoring_config()
+    all_profiles = make_profiles(args.profiles, config)
+    now = int(time.time())
+
+    mismatches = []
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "articles.jsonl"
+        write_articles(input_path, args.count, config)
+        print(f"Fichier: {args.count} articles ({input_path.stat().st_size / 1e6:.0f} Mo) - "
+              f"scoring: {'numpy' if NUMPY_AVAILABLE else 'article par article'}")
+
+        counts = sorted({1, 2, args.profiles} | {n for n in (4, 8) if n <= args.profiles})
+        for n in counts:
+            profiles = dict(list(all_profiles.items())[:n])
+
+            start = time.perf_counter()
+            separate = {
+                name: analyze_articles(input_path, context.config, context=context, now=now)
+                for name, context in profiles.items()
+            }
+            separate_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            shared = analyze_profiles(input_path, profiles, now=now)
+            shared_seconds = time.perf_counter() - start
+
+            print(f"  {n} profil(s): séparés {separate_seconds:6.2f} s, "
+                  f"un passage {shared_seconds:6.2f} s (x{separate_seconds / shared_seconds:.1f})")
+            mismatches += [(n, name) for name in profiles if separate[name] != shared[name]]
+
+    if mismatches:
+        print(f"RÉSULTATS DIFFÉRENTS (nombre de profils, profil): {mismatches}")
+        return 1
+
+    print("Parité OK: résultats identiques à une analyse par profil")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
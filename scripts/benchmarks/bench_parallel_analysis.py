@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark de l'analyse parallèle - Post Veille IA
+
+Analyse le même JSONL en séquentiel puis avec 2 à N processus
+(analyze_articles --workers), vérifie que les résultats sont identiques
+(code de sortie 1 sinon) et affiche l'accélération par nombre de cœurs.
+
+Sans --input, un JSONL synthétique est généré dans un dossier temporaire.
+
+Usage:
+    python scripts/benchmarks/bench_parallel_analysis.py
+    python scripts/benchmarks/bench_parallel_analysis.py --count 500000 --workers 8
+    python scripts/benchmarks/bench_parallel_analysis.py --input output/raw-articles/articles_2026-01-15.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ajouter le dossier scripts au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyze_articles import analyze_articles, load_content_preferences, load_scoring_config
+from bench_batch_scoring import DEFAULT_NEWS_FOCUS
+from bench_keyword_engine import make_articles
+from scoring import NUMPY_AVAILABLE, ScoringContext
+
+
+def write_articles(path: Path, count: int, config: dict):
+    with open(path, 'w', encoding='utf-8') as f:
+        for i, article in enumerate(make_articles(count, config)):
+            article['url'] = f"https://example.com/articles/{i}"
+            f.write(json.dumps(article, ensure_ascii=False) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'analyse parallèle")
+    parser.add_argument('--count', type=int, default=200_000, help="Articles synthétiques")
+    parser.add_argument('--input', type=str, default=None, help="Fichier JSONL réel")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Nombre max de processus")
+    parser.add_argument('--max', type=int, default=None, help="Articles analysés en phase 2")
+    args = parser.parse_args()
+
+    config = load_scoring_config()
+    preferences = load_content_preferences()
+    if not preferences.get('news_focus'):
+        preferences = dict(preferences, news_focus=DEFAULT_NEWS_FOCUS)
+    context = ScoringContext(config, preferences)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.input:
+            input_path = Path(args.input)
+        else:
+            input_path = Path(tmp) / "articles.jsonl"
+            write_articles(input_path, args.count, config)
+
+        size_mb = input_path.stat().st_size / 1e6
+        print(f"Fichier: {input_path} ({size_mb:.0f} Mo) - cœurs: {os.cpu_count()}, "
+              f"scoring: {'numpy' if NUMPY_AVAILABLE else 'article par article'}")
+
+        start = time.perf_counter()
+        reference = analyze_articles(input_path, config, args.max, context=context)
+        serial_seconds = time.perf_counter() - start
+        print(f"  1 processus (séquentiel): {serial_seconds:6.2f} s")
+
+        mismatches = []
+        for workers in range(2, max(args.workers, 2) + 1):
+            start = time.perf_counter()
+            results = analyze_articles(input_path, config, args.max, context=context, workers=workers)
+            seconds = time.perf_counter() - start
+            print(f"  {workers} processus:            {seconds:6.2f} s (x{serial_seconds / seconds:.2f})")
+            if results != reference:
+                mismatches.append(workers)
+
+    if mismatches:
+        print(f"RÉSULTATS DIFFÉRENTS du séquentiel avec {mismatches} processus")
+        return 1
+
+    print(f"Résultats identiques au séquentiel ({reference['total_articles']} articles, "
+          f"{reference['analyzed']} analysés)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
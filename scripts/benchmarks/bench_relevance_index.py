@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Parité et benchmark de l'index de pertinence BM25 - Post Veille IA
+
+Sur des articles synthétiques (ou un JSONL réel), dans une base temporaire:
+  1. indexation en une fois et par lots successifs (comme la collecte):
+     statistiques et classements identiques
+  2. parité: BM25 calculé depuis les postings de l'index (search) et
+     BM25 du titre + résumé recalculé article par article (phase 1)
+  3. analyse: mêmes candidats en liste complète et en flux avec le score
+     rapide BM25
+  4. temps par article: indexation, quick_score_title, quick_score_bm25
+Code de sortie 1 si une vérification échoue.
+
+Usage:
+    python scripts/benchmarks/bench_relevance_index.py
+    python scripts/benchmarks/bench_relevance_index.py --count 200000
+    python scripts/benchmarks/bench_relevance_index.py --input output/raw-articles/articles_2026-01-15.jsonl
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ajouter le dossier scripts au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyze_articles import (
+    analyze_articles,
+    load_articles,
+    load_content_preferences,
+    load_scoring_config,
+    quick_score_bm25,
+    quick_score_title
+)
+from bench_batch_scoring import DEFAULT_NEWS_FOCUS
+from bench_keyword_engine import make_articles
+from scoring import RelevanceIndex, ScoringContext
+
+# Articles par lot d'indexation (taille des lots de la collecte)
+INGEST_BATCH_SIZE = 50
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parité et benchmark de l'index BM25")
+    parser.add_argument('--count', type=int, default=50_000, help="Articles synthétiques")
+    parser.add_argument('--input', type=str, default=None, help="Fichier JSONL réel")
+    args = parser.parse_args()
+
+    config = load_scoring_config()
+    preferences = load_content_preferences()
+    if not preferences.get('news_focus'):
+        preferences = dict(preferences, news_focus=DEFAULT_NEWS_FOCUS)
+    news_focus = preferences['news_focus']
+    context = ScoringContext(config, preferences)
+
+    if args.input:
+        articles = load_articles(Path(args.input))
+    else:
+        articles = make_articles(args.count, config)
+        for i, article in enumerate(articles):
+            article['id'] = f"{i:016x}"
+            article['url'] = f"https://example.com/articles/{i}"
+    n = len(articles)
+    print(f"Articles: {n} - news_focus: {news_focus[:60]!r}")
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # 1. Indexation en une fois / par lots (doublons ignorés)
+        with RelevanceIndex(Path(tmp) / "once.db") as once:
+            once.add_articles(articles)
+            once_scorer = once.scorer(news_focus)
+            once_ranking = once.search(news_focus, limit=None)
+
+        start = time.perf_counter()
+        with RelevanceIndex(Path(tmp) / "batches.db") as index:
+            for i in range(0, n, INGEST_BATCH_SIZE):
+                index.add_articles(articles[i:i + INGEST_BATCH_SIZE])
+            ingest_seconds = time.perf_counter() - start
+            index.add_articles(articles[:INGEST_BATCH_SIZE])
+            stats = index.get_stats()
+            scorer = index.scorer(news_focus)
+            ranking = index.search(news_focus, limit=None)
+
+        print(f"Index: {stats['documents']} articles, {stats['terms']} termes, "
+              f"longueur moyenne {stats['avg_length']} mots")
+        print(f"Indexation par lots de {INGEST_BATCH_SIZE}: {ingest_seconds / n * 1e6:.0f} µs/article")
+
+        if scorer.to_dict() != once_scorer.to_dict() or ranking != once_ranking:
+            failures.append("index par lots différent de l'index construit en une fois")
+
+        # 2. Postings vs recalcul article par article
+        from_postings = dict(ranking)
+        recomputed = {}
+        for article in articles:
+            score = scorer.score(article.get('title', ''), article.get('summary', ''))
+            if score > 0:
+                recomputed[article['id']] = score
+        if from_postings != recomputed:
+            diff = set(from_postings.items()) ^ set(recomputed.items())
+            failures.append(f"BM25 des postings différent du recalcul ({len(diff)} écarts)")
+
+        # 3. Analyse complète: liste et flux avec le score rapide BM25
+        input_path = Path(tmp) / "articles.jsonl"
+        with open(input_path, 'w', encoding='utf-8') as f:
+            for article in articles:
+                f.write(json.dumps(article, ensure_ascii=False) + '\n')
+        as_list = analyze_articles(input_path, config, articles=articles, context=context, relevance=scorer)
+        streamed = analyze_articles(input_path, config, context=context, relevance=scorer)
+        if as_list != streamed:
+            failures.append("analyse en flux différente de la liste complète (BM25)")
+
+    # 4. Temps de la phase 1
+    start = time.perf_counter()
+    for article in articles:
+        quick_score_title(article, config, preferences, context)
+    title_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for article in articles:
+        quick_score_bm25(article, context, scorer)
+    bm25_seconds = time.perf_counter() - start
+
+    print(f"Score rapide - titres: {title_seconds / n * 1e6:.1f} µs/article, "
+          f"BM25 titre + résumé: {bm25_seconds / n * 1e6:.1f} µs/article")
+
+    if failures:
+        for failure in failures:
+            print(f"KO: {failure}")
+        return 1
+
+    print("Parité OK: index par lots, postings et recalcul, liste et flux identiques")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark sérialisation des articles - Post Veille IA
+
+Compare, sur N articles synthétiques (100 000 par défaut):
+  - l'ancien chemin: dataclass sans slots, asdict + json.dumps, from_dict
+    par compréhension sur __dataclass_fields__
+  - le chemin actuel: Article à slots, to_json / from_json écrits à la main
+    (backend orjson / msgspec / json selon ce qui est installé)
+
+Mesure le temps de sérialisation, de chargement et la mémoire occupée par
+les objets chargés (tracemalloc).
+
+Usage:
+    python scripts/benchmarks/bench_serialization.py
+    python scripts/benchmarks/bench_serialization.py --count 20000
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Ajouter le dossier scripts au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from collectors.schema import Article
+from collectors.serialization import JSON_BACKEND
+
+# Même structure qu'Article, sans slots ni conversions dédiées
+LegacyArticle = dataclasses.make_dataclass(
+    "LegacyArticle",
+    [(f.name, f.type, dataclasses.field(default=f.default)) for f in dataclasses.fields(Article)]
+)
+
+
+def legacy_to_json(article) -> str:
+    return json.dumps(dataclasses.asdict(article), ensure_ascii=False)
+
+
+def legacy_from_dict(data: dict):
+    return LegacyArticle(**{k: v for k, v in data.items() if k in LegacyArticle.__dataclass_fields__})
+
+
+def make_articles(count: int) -> list:
+    return [
+        Article(
+            id=f"{i:016x}",
+            url=f"https://example.com/posts/{i}",
+            title=f"Nouveau modèle de langage n°{i} annoncé",
+            content="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8,
+            summary="Résumé court de l'annonce.",
+            source_name="Example Blog",
+            source_type="rss",
+            source_category="news",
+            published_at="2026-01-15T08:00:00Z",
+            tags=["llm", "release", "open source"],
+            score=i % 500,
+            num_comments=i % 50,
+        )
+        for i in range(count)
+    ]
+
+
+def timed(label: str, func):
+    gc.collect()
+    start = time.perf_counter()
+    result = func()
+    print(f"  {label:<32} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def measure_memory(label: str, build):
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<32} {current / 1024 / 1024:8.1f} Mo")
+    return objects
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la sérialisation des articles")
+    parser.add_argument('--count', type=int, default=100_000, help="Nombre d'articles")
+    args = parser.parse_args()
+
+    print(f"Articles: {args.count} - backend JSON: {JSON_BACKEND}")
+    articles = make_articles(args.count)
+    legacy = [LegacyArticle(**{f.name: getattr(a, f.name) for f in dataclasses.fields(Article)}) for a in articles]
+
+    print("\nSérialisation (to_json):")
+    legacy_lines = timed("ancien (asdict + json)", lambda: [legacy_to_json(a) for a in legacy])
+    lines = timed("actuel", lambda: [a.to_json() for a in articles])
+
+    # Même contenu quel que soit le chemin
+    assert json.loads(lines[0]) == json.loads(legacy_lines[0])
+
+    print("\nChargement (JSON -> objets):")
+    timed("ancien (json + from_dict)", lambda: [legacy_from_dict(json.loads(line)) for line in legacy_lines])
+    timed("actuel (from_json)", lambda: [Article.from_json(line) for line in lines])
+
+    print("\nMémoire des objets chargés:")
+    del articles, legacy
+    measure_memory("ancien (dataclass + __dict__)", lambda: [legacy_from_dict(json.loads(line)) for line in legacy_lines])
+    measure_memory("actuel (slots)", lambda: [Article.from_json(line) for line in lines])
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Mémoire de l'analyse en flux - Post Veille IA
+
+Analyse le même JSONL dans deux processus séparés (mémoire max mesurée
+indépendamment):
+  - liste: load_articles puis analyze_articles(articles=...), tout le
+    fichier en mémoire (chemin historique)
+  - flux: analyze_articles(input_path), lecture par lots et tas des
+    meilleurs candidats
+et vérifie que les résultats sont identiques (code de sortie 1 sinon).
+
+Usage:
+    python scripts/benchmarks/bench_streaming_analysis.py
+    python scripts/benchmarks/bench_streaming_analysis.py --count 500000
+    python scripts/benchmarks/bench_streaming_analysis.py --input output/raw-articles/articles_2026-01-15.jsonl
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ajouter le dossier scripts au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyze_articles import (
+    analyze_articles,
+    load_articles,
+    load_content_preferences,
+    load_scoring_config,
+    peak_rss_mb
+)
+from bench_batch_scoring import DEFAULT_NEWS_FOCUS
+from bench_parallel_analysis import write_articles
+from scoring import ScoringContext
+
+
+def run_mode(mode: str, input_path: Path, output_path: Path):
+    """Analyse dans ce processus et écrit résultats, durée et mémoire max"""
+    config = load_scoring_config()
+    preferences = load_content_preferences()
+    if not preferences.get('news_focus'):
+        preferences = dict(preferences, news_focus=DEFAULT_NEWS_FOCUS)
+    context = ScoringContext(config, preferences)
+
+    start = time.perf_counter()
+    if mode == 'list':
+        results = analyze_articles(input_path, config, articles=load_articles(input_path), context=context)
+    else:
+        results = analyze_articles(input_path, config, context=context)
+    seconds = time.perf_counter() - start
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'results': results, 'seconds': seconds, 'peak_rss_mb': peak_rss_mb()}, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mémoire de l'analyse en flux")
+    parser.add_argument('--count', type=int, default=200_000, help="Articles synthétiques")
+    parser.add_argument('--input', type=str, default=None, help="Fichier JSONL réel")
+    parser.add_argument('--mode', choices=['write', 'list', 'stream'], help=argparse.SUPPRESS)
+    parser.add_argument('--output', type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode == 'write':
+        write_articles(Path(args.output), args.count, load_scoring_config())
+        return 0
+    if args.mode:
+        run_mode(args.mode, Path(args.input), Path(args.output))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.input:
+            input_path = Path(args.input)
+        else:
+            # Génération dans un processus à part: sous Linux, la mémoire max
+            # d'un processus parent est héritée par ses fils
+            input_path = Path(tmp) / "articles.jsonl"
+            subprocess.run(
+                [sys.executable, __file__, '--mode', 'write',
+                 '--count', str(args.count), '--output', str(input_path)],
+                check=True
+            )
+        print(f"Fichier: {input_path} ({input_path.stat().st_size / 1e6:.0f} Mo)")
+
+        runs = {}
+        for mode in ('list', 'stream'):
+            output_path = Path(tmp) / f"{mode}.json"
+            subprocess.run(
+                [sys.executable, __file__, '--mode', mode,
+                 '--input', str(input_path), '--output', str(output_path)],
+                check=True, stderr=subprocess.DEVNULL
+            )
+            with open(output_path, 'r', encoding='utf-8') as f:
+                runs[mode] = json.load(f)
+
+    for mode, label in (('list', 'Liste complète'), ('stream', 'Flux + tas   ')):
+        run = runs[mode]
+        rss = f"{run['peak_rss_mb']:.0f} Mo" if run['peak_rss_mb'] is not None else "n/d"
+        print(f"  {label}: {run['seconds']:6.2f} s, mémoire max {rss}")
+
+    if runs['list']['results'] != runs['stream']['results']:
+        print("RÉSULTATS DIFFÉRENTS entre liste et flux")
+        return 1
+
+    print(f"Résultats identiques ({runs['stream']['results']['total_articles']} articles)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
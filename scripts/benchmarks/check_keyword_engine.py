@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Contrôle de parité rapide du moteur de mots-clés - Post Veille IA
+
+Sans générer de corpus : un échantillon fixe construit depuis scoring.yaml
+couvre chaque mot-clé de chaque liste (audience, engagement, sources tier
+1/2, exclusions, catégories) placé dans le titre, le contenu, le résumé ou
+le nom de la source, en casse variée, collé à un autre mot ou coupé entre
+le titre et le contenu. Pour chaque article, score_article (automate) doit
+être identique à l'implémentation historique (bench_keyword_engine), et
+chaque liste doit compter les mêmes entrées qu'un `kw.lower() in text`.
+
+Code de sortie 1 à la première série de différences.
+
+Usage:
+    python scripts/benchmarks/check_keyword_engine.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le dossier scripts au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyze_articles import load_scoring_config, score_article
+from bench_keyword_engine import legacy_score_article
+from scoring import AHOCORASICK_AVAILABLE, KeywordEngine, ScoringContext
+
+
+def keyword_cases(keyword: str) -> list:
+    """Articles plaçant un mot-clé à chaque endroit lu par le scoring"""
+    half = len(keyword) // 2
+    return [
+        {'title': keyword},
+        {'title': f"New {keyword.upper()} release", 'content': "nothing else"},
+        {'title': "Weekly notes", 'content': f"see{keyword.title()}here"},
+        {'title': "Weekly notes", 'summary': f"about {keyword.lower()}"},
+        {'title': "Weekly notes", 'source_name': keyword},
+        {'title': f"Blog {keyword}", 'source_name': f"The {keyword.upper()} Blog"},
+        # Coupé entre titre et contenu: présent dans le texte complet seulement
+        {'title': f"Intro {keyword[:half]}", 'content': f"{keyword[half:]} ÉTÉ straße"},
+    ]
+
+
+def make_sample(engine: KeywordEngine) -> list:
+    """Échantillon fixe: chaque mot-clé de chaque liste, puis listes complètes"""
+    articles = [{}, {'title': "", 'content': "", 'summary': ""}]
+    for name, keywords in engine.lists.items():
+        for keyword in keywords:
+            articles.extend(keyword_cases(keyword))
+        # Toute la liste dans un même article (score plafonné, catégories multiples)
+        articles.append({'title': " ".join(keywords), 'summary': " ".join(keywords)})
+        articles.append({'title': "Roundup", 'content': "".join(keywords)})
+    return articles
+
+
+def list_mismatches(engine: KeywordEngine, article: dict) -> list:
+    """Listes dont les entrées trouvées diffèrent des tests de sous-chaîne"""
+    title = article.get('title', '') or ''
+    text = f"{title} {article.get('content', '') or ''} {article.get('summary', '') or ''}".lower()
+    matches = engine.scan_article(title, article.get('content', ''), article.get('summary', ''))
+
+    mismatches = []
+    for name, keywords in engine.lists.items():
+        expected = sum(1 for kw in keywords if kw.lower() in text)
+        expected_title = sum(1 for kw in keywords if kw.lower() in title.lower()) if title else 0
+        if matches.count(name) != expected or (title and matches.count(name, True) != expected_title):
+            mismatches.append(name)
+    return mismatches
+
+
+def main():
+    config = load_scoring_config()
+    context = ScoringContext(config, {})
+    engine = KeywordEngine.from_config(config)
+    articles = make_sample(engine)
+
+    backend = "pyahocorasick" if AHOCORASICK_AVAILABLE else "Python"
+    covered = ", ".join(f"{name} ({len(kws)})" for name, kws in engine.lists.items())
+    print(f"Articles: {len(articles)} - automate: {backend}")
+    print(f"Listes: {covered}")
+
+    start = time.perf_counter()
+    failures = []
+    for article in articles:
+        lists = list_mismatches(engine, article)
+        legacy = legacy_score_article(article, config)
+        result = score_article(article, config, context)
+        if lists or legacy != result:
+            failures.append((article, lists, legacy, result))
+    elapsed = time.perf_counter() - start
+
+    if failures:
+        print(f"PARITÉ KO: {len(failures)} articles différents")
+        for article, lists, legacy, result in failures[:5]:
+            print(f"  {article}")
+            if lists:
+                print(f"    listes: {', '.join(lists)}")
+            if legacy != result:
+                print(f"    historique: {legacy}")
+                print(f"    automate:   {result}")
+        return 1
+
+    print(f"Parité OK en {elapsed:.2f} s: listes, scores, détails et catégories identiques")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
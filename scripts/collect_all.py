@@ -9,8 +9,11 @@ Exécute tous les collecteurs et sauvegarde les résultats.
 import argparse
 import json
 import logging
+import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 import sys
 
 # Ajouter le dossier parent au path
@@ -24,12 +27,44 @@ from dotenv import load_dotenv
 load_dotenv(PROJECT_ROOT / ".env")
 
 from collectors import (
-    collect_rss,
-    collect_jina,
-    collect_reddit,
+    iter_rss,
+    iter_jina,
+    iter_reddit,
+    iter_youtube,
+    load_youtube_videos,
     deduplicate_articles,
-    Article
+    DeduplicationDB,
+    Article,
+    YOUTUBE_AVAILABLE
 )
+from collectors.dedup import DEFAULT_BLOOM_CAPACITY, DEFAULT_BLOOM_ERROR_RATE
+from collectors.near_dup import (
+    NearDuplicateIndex,
+    DEFAULT_THRESHOLD as DEFAULT_NEAR_DUP_THRESHOLD,
+    DEFAULT_LOOKBACK_DAYS,
+    DEFAULT_NUM_PERM,
+    load_source_tiers
+)
+from collectors.pipeline import (
+    run_pipeline,
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_SECONDS
+)
+from collectors.article_store import ArticleStore
+from collectors.blob_store import BlobStore, externalize_articles, DEFAULT_MIN_CHARS
+from collectors.serialization import dumps
+from collectors.archive import (
+    ArchiveWriter,
+    archive_old_jsonl,
+    DEFAULT_FRAME_ARTICLES,
+    DEFAULT_SEGMENT_MAX_MB,
+    DEFAULT_ZSTD_LEVEL,
+    DEFAULT_KEEP_JSONL_DAYS
+)
+from collectors.http_session import get_connection_stats
+from collectors.settings import load_settings
+from scoring import RelevanceIndex
 
 # Configuration logging
 logging.basicConfig(
@@ -40,8 +75,20 @@ logger = logging.getLogger(__name__)
 OUTPUT_DIR = PROJECT_ROOT / "output" / "raw-articles"
 CONFIG_PATH = PROJECT_ROOT / "config" / "sources.yaml"
 
+# JSONL des quasi-doublons (near-duplicates_YYYY-MM-DD.jsonl), hors analyse
+NEAR_DUP_PREFIX = "near-duplicates"
+
+# Types de sources collectés par défaut
+ALL_SOURCES = ['rss', 'jina', 'reddit', 'youtube']
 
-def save_articles(articles: list, output_dir: Path, prefix: str = "articles"):
+
+def save_articles(
+    articles: list,
+    output_dir: Path,
+    prefix: str = "articles",
+    blob_store: BlobStore = None,
+    min_chars: int = DEFAULT_MIN_CHARS
+):
     """
     Sauvegarde les articles en JSONL.
 
@@ -49,6 +96,10 @@ def save_articles(articles: list, output_dir: Path, prefix: str = "articles"):
         articles: Liste d'Articles
         output_dir: Dossier de sortie
         prefix: Préfixe du fichier
+        blob_store: Si fourni, les contenus d'au moins min_chars caractères
+                    y sont stockés et remplacés par content_ref (dans le
+                    JSONL et dans les Articles, passés ensuite aux index)
+        min_chars: Taille min d'un contenu sorti du JSONL
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -58,120 +109,240 @@ def save_articles(articles: list, output_dir: Path, prefix: str = "articles"):
 
     # Mode append pour ajouter aux articles existants du jour
     with open(output_file, 'a', encoding='utf-8') as f:
-        for article in articles:
-            f.write(article.to_json() + '\n')
+        if blob_store is None:
+            for article in articles:
+                f.write(article.to_json() + '\n')
+        else:
+            records = externalize_articles([a.to_dict() for a in articles], blob_store, min_chars)
+            for article, record in zip(articles, records):
+                article.content = record['content']
+                article.content_ref = record.get('content_ref')
+                f.write(dumps(record) + '\n')
 
     logger.info(f"Sauvegardé {len(articles)} articles dans {output_file}")
     return output_file
 
 
+def iter_youtube_videos(config_path: str) -> Iterator[Article]:
+    """Collecte les transcripts des vidéos listées dans sources.yaml"""
+    if not YOUTUBE_AVAILABLE:
+        logger.warning("youtube-transcript-api non installé - collecte YouTube ignorée")
+        return
+
+    video_urls = load_youtube_videos(config_path)
+    if video_urls:
+        yield from iter_youtube(video_urls)
+
+
+def make_stage(name: str, config_path: str, stats: dict) -> Callable[[], Iterable[Article]]:
+    """Retourne la fabrique d'itérateur d'articles d'un type de source"""
+    if name == 'rss':
+        rss_stats = stats.setdefault('rss_fetch', {})
+        return lambda: iter_rss(config_path, stats=rss_stats)
+    if name == 'jina':
+        return lambda: iter_jina(config_path)
+    if name == 'reddit':
+        return lambda: iter_reddit(config_path)
+    if name == 'youtube':
+        return lambda: iter_youtube_videos(config_path)
+    raise ValueError(f"Source inconnue: {name}")
+
+
 def collect_all(
     sources: list = None,
     config_path: str = None,
     output_dir: str = None,
-    skip_dedup: bool = False
+    skip_dedup: bool = False,
+    deadline_seconds: float = None
 ) -> dict:
     """
     Exécute la collecte complète.
 
+    Les sources sont collectées en parallèle (un thread par type de source,
+    erreurs isolées) et leurs articles sont dédupliqués puis ajoutés au
+    JSONL du jour par petits lots, au fil de la collecte.
+
     Args:
-        sources: Liste des sources à collecter ['rss', 'jina', 'reddit']
+        sources: Liste des sources à collecter ['rss', 'jina', 'reddit', 'youtube']
                  Si None, collecte tout
         config_path: Chemin vers sources.yaml
         output_dir: Dossier de sortie
         skip_dedup: Si True, ne pas dédupliquer
+        deadline_seconds: Durée max de la collecte (défaut: settings.run_deadline_seconds).
+                          Les étapes non terminées à l'échéance sont abandonnées.
 
     Returns:
         Statistiques de collecte
     """
     if sources is None:
-        sources = ['rss', 'jina', 'reddit']
+        sources = list(ALL_SOURCES)
 
     config_path = Path(config_path) if config_path else CONFIG_PATH
     output_dir = Path(output_dir) if output_dir else OUTPUT_DIR
+    settings = load_settings(str(config_path))
+
+    if deadline_seconds is None:
+        deadline_seconds = settings.get('run_deadline_seconds')
 
-    all_articles = []
     stats = {
         'start_time': datetime.utcnow().isoformat() + "Z",
         'sources_collected': [],
         'by_source': {},
+        'stage_seconds': {},
+        'timed_out': [],
         'total_raw': 0,
         'total_new': 0,
         'total_deduped': 0,
+        'total_near_dup': 0,
     }
 
-    # Collecte RSS
-    if 'rss' in sources:
-        logger.info("=" * 50)
-        logger.info("COLLECTE RSS")
-        logger.info("=" * 50)
-        try:
-            rss_articles = collect_rss(str(config_path))
-            all_articles.extend(rss_articles)
-            stats['by_source']['rss'] = len(rss_articles)
-            stats['sources_collected'].append('rss')
-        except Exception as e:
-            logger.error(f"Erreur collecte RSS: {e}")
-            stats['by_source']['rss'] = 0
-
-    # Collecte Jina
-    if 'jina' in sources:
-        logger.info("=" * 50)
-        logger.info("COLLECTE JINA AI")
-        logger.info("=" * 50)
+    dedup_db = None
+    near_dup_index = None
+    if not skip_dedup:
+        bloom_settings = settings.get('dedup_bloom', {}) or {}
+        dedup_db = DeduplicationDB(
+            use_bloom=bloom_settings.get('enabled', True),
+            bloom_capacity=bloom_settings.get('capacity', DEFAULT_BLOOM_CAPACITY),
+            bloom_error_rate=bloom_settings.get('error_rate', DEFAULT_BLOOM_ERROR_RATE)
+        )
+        dedup_db.cleanup_old(retention_days=settings.get('dedupe_window_days', 7))
+
+        near_dedup_settings = settings.get('near_dedup', {}) or {}
+        if near_dedup_settings.get('enabled', True):
+            near_dup_index = NearDuplicateIndex(
+                threshold=near_dedup_settings.get('threshold', DEFAULT_NEAR_DUP_THRESHOLD),
+                lookback_days=near_dedup_settings.get('lookback_days', DEFAULT_LOOKBACK_DAYS),
+                num_perm=near_dedup_settings.get('num_perm', DEFAULT_NUM_PERM),
+                source_tiers=load_source_tiers(str(config_path))
+            )
+            near_dup_index.cleanup_old(retention_days=settings.get('dedupe_window_days', 7))
+
+    blob_settings = settings.get('blob_store', {}) or {}
+    blob_store = BlobStore() if blob_settings.get('enabled', False) else None
+    min_chars = blob_settings.get('min_chars', DEFAULT_MIN_CHARS)
+
+    article_store = None
+    if (settings.get('article_store', {}) or {}).get('enabled', False):
         try:
-            jina_articles = collect_jina(str(config_path))
-            all_articles.extend(jina_articles)
-            stats['by_source']['jina'] = len(jina_articles)
-            stats['sources_collected'].append('jina')
-        except Exception as e:
-            logger.error(f"Erreur collecte Jina: {e}")
-            stats['by_source']['jina'] = 0
-
-    # Collecte Reddit
-    if 'reddit' in sources:
-        logger.info("=" * 50)
-        logger.info("COLLECTE REDDIT")
-        logger.info("=" * 50)
-        try:
-            reddit_articles = collect_reddit(str(config_path))
-            all_articles.extend(reddit_articles)
-            stats['by_source']['reddit'] = len(reddit_articles)
-            stats['sources_collected'].append('reddit')
-        except Exception as e:
-            logger.error(f"Erreur collecte Reddit: {e}")
-            stats['by_source']['reddit'] = 0
-
-    stats['total_raw'] = len(all_articles)
+            article_store = ArticleStore()
+        except sqlite3.OperationalError as e:
+            # SQLite compilé sans FTS5
+            logger.warning(f"Stockage plein texte indisponible: {e}")
+
+    # Index BM25 des titres et résumés (score rapide de l'analyse)
+    relevance_index = None
+    if (settings.get('relevance_index', {}) or {}).get('enabled', False):
+        relevance_index = RelevanceIndex()
+
+    def process_batch(batch: list):
+        stats['total_raw'] += len(batch)
+
+        new_articles = batch
+        if dedup_db is not None:
+            new_articles = deduplicate_articles(batch, db=dedup_db)
+            stats['total_deduped'] += len(batch) - len(new_articles)
+
+        # Une seule entrée par histoire (même annonce depuis plusieurs sources)
+        # dans le JSONL analysé; les autres sont gardés à part avec leur cluster_id
+        near_duplicates = []
+        if near_dup_index is not None and new_articles:
+            new_articles, near_duplicates = near_dup_index.assign_clusters(new_articles)
+            stats['total_near_dup'] += len(near_duplicates)
+
+        if new_articles:
+            save_articles(new_articles, output_dir, blob_store=blob_store, min_chars=min_chars)
+            stats['total_new'] += len(new_articles)
+        if near_duplicates:
+            save_articles(
+                near_duplicates, output_dir, prefix=NEAR_DUP_PREFIX,
+                blob_store=blob_store, min_chars=min_chars
+            )
+
+        stored = new_articles + near_duplicates
+        if stored:
+            if article_store is not None:
+                article_store.add_articles(stored)
+            if relevance_index is not None:
+                relevance_index.add_articles(stored)
 
-    # Déduplication
-    if not skip_dedup and all_articles:
-        logger.info("=" * 50)
-        logger.info("DÉDUPLICATION")
-        logger.info("=" * 50)
-        new_articles = deduplicate_articles(all_articles)
-        stats['total_deduped'] = len(all_articles) - len(new_articles)
-        all_articles = new_articles
-
-    stats['total_new'] = len(all_articles)
+    logger.info("=" * 50)
+    logger.info(f"COLLECTE EN FLUX: {', '.join(s.upper() for s in sources)}")
+    logger.info("=" * 50)
 
-    # Sauvegarde
-    if all_articles:
-        logger.info("=" * 50)
-        logger.info("SAUVEGARDE")
-        logger.info("=" * 50)
-        save_articles(all_articles, output_dir)
+    run_start = time.monotonic()
+    try:
+        results = run_pipeline(
+            {name: make_stage(name, str(config_path), stats) for name in sources},
+            process_batch,
+            buffer_size=settings.get('pipeline_buffer_size', DEFAULT_BUFFER_SIZE),
+            batch_size=settings.get('pipeline_batch_size', DEFAULT_BATCH_SIZE),
+            flush_seconds=settings.get('pipeline_flush_seconds', DEFAULT_FLUSH_SECONDS),
+            deadline_seconds=deadline_seconds
+        )
+    finally:
+        if dedup_db is not None:
+            if dedup_db.bloom is not None:
+                stats['dedup_bloom'] = dict(dedup_db.bloom_stats)
+            dedup_db.close()
+        if near_dup_index is not None:
+            near_dup_index.close()
+        if article_store is not None:
+            article_store.close()
+        if relevance_index is not None:
+            relevance_index.close()
+        if blob_store is not None:
+            blob_store.close()
+
+    for name in sources:
+        result = results[name]
+        stats['by_source'][name] = result.count
+        stats['stage_seconds'][name] = round(result.seconds, 2)
+        if not result.done:
+            stats['timed_out'].append(name)
+        elif result.error is None:
+            stats['sources_collected'].append(name)
+
+    stats['collect_seconds'] = round(time.monotonic() - run_start, 2)
+
+    # Les JSONL anciens passent dans l'archive compressée
+    archive_settings = settings.get('archive', {}) or {}
+    if archive_settings.get('enabled', False):
+        try:
+            with ArchiveWriter(
+                frame_articles=archive_settings.get('frame_articles', DEFAULT_FRAME_ARTICLES),
+                segment_max_mb=archive_settings.get('segment_max_mb', DEFAULT_SEGMENT_MAX_MB),
+                zstd_level=archive_settings.get('zstd_level', DEFAULT_ZSTD_LEVEL)
+            ) as archive:
+                stats['archived'] = archive_old_jsonl(
+                    output_dir,
+                    archive,
+                    keep_days=archive_settings.get('keep_jsonl_days', DEFAULT_KEEP_JSONL_DAYS),
+                    delete=archive_settings.get('delete_jsonl', False)
+                )
+        except Exception as e:
+            logger.error(f"Erreur archivage: {e}")
 
     stats['end_time'] = datetime.utcnow().isoformat() + "Z"
+    http_stats = get_connection_stats()
+    stats['http'] = {k: v for k, v in http_stats.items() if k != 'by_host'}
 
     # Résumé
     logger.info("=" * 50)
     logger.info("RÉSUMÉ")
     logger.info("=" * 50)
     logger.info(f"Sources collectées: {', '.join(stats['sources_collected'])}")
+    for name, seconds in stats['stage_seconds'].items():
+        logger.info(f"  {name.upper()}: {seconds}s")
+    if stats['timed_out']:
+        logger.warning(f"Étapes abandonnées (échéance): {', '.join(stats['timed_out'])}")
     logger.info(f"Articles bruts: {stats['total_raw']}")
     logger.info(f"Articles dédupliqués: {stats['total_deduped']}")
+    logger.info(f"Quasi-doublons (même histoire): {stats['total_near_dup']}")
     logger.info(f"Nouveaux articles: {stats['total_new']}")
+    logger.info(
+        f"Connexions HTTP: {stats['http']['requests']} requêtes, "
+        f"{stats['http']['connections']} connexions ({stats['http']['reused']} réutilisées)"
+    )
 
     return stats
 
@@ -183,7 +354,7 @@ def main():
     parser.add_argument(
         '--sources',
         nargs='+',
-        choices=['rss', 'jina', 'reddit', 'all'],
+        choices=ALL_SOURCES + ['all'],
         default=['all'],
         help="Sources à collecter (défaut: all)"
     )
@@ -204,6 +375,12 @@ def main():
         action='store_true',
         help="Ne pas dédupliquer les articles"
     )
+    parser.add_argument(
+        '--deadline',
+        type=float,
+        default=None,
+        help="Durée max de la collecte en secondes (défaut: settings.run_deadline_seconds)"
+    )
     parser.add_argument(
         '--json',
         action='store_true',
@@ -225,7 +402,8 @@ def main():
         sources=sources,
         config_path=args.config,
         output_dir=args.output,
-        skip_dedup=args.skip_dedup
+        skip_dedup=args.skip_dedup,
+        deadline_seconds=args.deadline
     )
 
     # Sortie JSON si demandé
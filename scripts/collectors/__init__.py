@@ -4,19 +4,23 @@ Post Veille IA - Sprint 1 & 2
 """
 
 from .schema import Article, AnalyzedArticle, LinkedInDraft, CATEGORIES, POST_TYPES
-from .rss_collector import collect_rss
-from .jina_collector import collect_jina
-from .reddit_collector import collect_reddit
+from .rss_collector import collect_rss, iter_rss
+from .jina_collector import collect_jina, iter_jina
+from .reddit_collector import collect_reddit, iter_reddit
 from .dedup import deduplicate_articles, DeduplicationDB
+from .near_dup import NearDuplicateIndex
+from .urls import canonicalize_url
 
 # YouTube collector (optionnel, peut échouer si youtube-transcript-api non installé)
 try:
-    from .youtube_collector import collect_youtube, get_transcript
+    from .youtube_collector import collect_youtube, iter_youtube, get_transcript, load_youtube_videos
     YOUTUBE_AVAILABLE = True
 except ImportError:
     YOUTUBE_AVAILABLE = False
     collect_youtube = None
+    iter_youtube = None
     get_transcript = None
+    load_youtube_videos = None
 
 __all__ = [
     'Article',
@@ -28,8 +32,15 @@ __all__ = [
     'collect_jina',
     'collect_reddit',
     'collect_youtube',
+    'iter_rss',
+    'iter_jina',
+    'iter_reddit',
+    'iter_youtube',
     'get_transcript',
+    'load_youtube_videos',
     'deduplicate_articles',
     'DeduplicationDB',
+    'NearDuplicateIndex',
+    'canonicalize_url',
     'YOUTUBE_AVAILABLE',
 ]
@@ -0,0 +1,465 @@
+"""
+Archive compressée des articles bruts - Post Veille IA
+
+Remplace à terme les articles_YYYY-MM-DD.jsonl non compressés. Les articles
+sont écrits dans des segments par jour (articles-YYYY-MM-DD-NNN.jsonl.zst) :
+chaque segment est une suite de trames compressées indépendamment (quelques
+dizaines d'articles par trame), donc lisible d'un bloc par `zstd -d` et
+accessible par trame sans tout décompresser.
+
+Un index SQLite (index.db dans le dossier de l'archive) donne pour chaque
+article son segment, la position de sa trame et sa ligne, ainsi que sa date
+et son source_type : lecture directe d'un article ou d'une seule source sur
+une période.
+
+zstandard est optionnel ; sans lui les trames sont des membres gzip
+(fichiers .jsonl.gz, lisibles par `zcat`).
+
+Usage:
+    with ArchiveWriter(archive_dir) as archive:
+        archive.append([article.to_dict() for article in articles])
+
+    reader = ArchiveReader(archive_dir)
+    reader.get("3f2a9c1e0b7d4a65")
+    for article in reader.iter_articles(source_type="reddit", date_from="2026-01-01"):
+        ...
+"""
+
+import gzip
+import logging
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from .serialization import dumps_bytes, loads
+
+# Compression zstd (optionnelle, gzip sinon)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Dossier par défaut de l'archive
+DEFAULT_ARCHIVE_DIR = Path(__file__).parent.parent.parent / "output" / "archive"
+
+# Valeurs par défaut (surchargées par settings.archive)
+DEFAULT_FRAME_ARTICLES = 64         # Articles par trame compressée
+DEFAULT_SEGMENT_MAX_MB = 64         # Taille max d'un segment avant rotation
+DEFAULT_ZSTD_LEVEL = 10
+DEFAULT_KEEP_JSONL_DAYS = 7         # JSONL récents conservés pour l'analyse
+
+_EXTENSIONS = {'zstd': '.jsonl.zst', 'gzip': '.jsonl.gz'}
+# JSONL de la collecte: articles du jour et quasi-doublons (cluster_id renseigné)
+_JSONL_NAME = re.compile(r"^(?:articles|near-duplicates)_(\d{4}-\d{2}-\d{2})\.jsonl$")
+
+
+def _require_zstd():
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("Segments zstd: installer le paquet zstandard")
+
+
+def _compressor(codec: str, level: int):
+    if codec == 'zstd':
+        _require_zstd()
+        return zstandard.ZstdCompressor(level=level).compress
+    return lambda data: gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def _decompressor(codec: str):
+    if codec == 'zstd':
+        _require_zstd()
+        return zstandard.ZstdDecompressor().decompress
+    return gzip.decompress
+
+
+def _fsync_dir(path: Path):
+    """Rend durable la création d'un fichier dans un dossier (POSIX)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _open_index(archive_dir: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(archive_dir / "index.db")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    with conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS segments (
+                name TEXT PRIMARY KEY,
+                date TEXT NOT NULL,
+                codec TEXT NOT NULL,
+                articles INTEGER NOT NULL DEFAULT 0,
+                bytes INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS archived_articles (
+                id TEXT PRIMARY KEY,
+                segment TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                line INTEGER NOT NULL,
+                date TEXT NOT NULL,
+                source_type TEXT,
+                source_name TEXT,
+                published_at TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_archived_source_date
+            ON archived_articles(source_type, date)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_archived_date
+            ON archived_articles(date)
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS imported_files (
+                name TEXT PRIMARY KEY,
+                articles INTEGER NOT NULL,
+                imported_at TEXT NOT NULL
+            )
+        """)
+    return conn
+
+
+def raw_jsonl_files(raw_dir: Path) -> List[Path]:
+    """JSONL de la collecte d'un dossier (articles_ et near-duplicates_), triés"""
+    return sorted(p for p in Path(raw_dir).glob("*.jsonl") if _JSONL_NAME.match(p.name))
+
+
+class ArchiveWriter:
+    """Ajoute des articles à l'archive (un seul écrivain à la fois)"""
+
+    def __init__(
+        self,
+        archive_dir: str = None,
+        frame_articles: int = DEFAULT_FRAME_ARTICLES,
+        segment_max_mb: float = DEFAULT_SEGMENT_MAX_MB,
+        zstd_level: int = DEFAULT_ZSTD_LEVEL,
+        codec: str = None
+    ):
+        self.archive_dir = Path(archive_dir) if archive_dir else DEFAULT_ARCHIVE_DIR
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self.frame_articles = max(1, frame_articles)
+        self.segment_max_bytes = int(segment_max_mb * 1024 * 1024)
+        self.codec = codec or ('zstd' if ZSTD_AVAILABLE else 'gzip')
+        self._compress = _compressor(self.codec, zstd_level)
+        self._conn = _open_index(self.archive_dir)
+        # Index synchronisé à chaque transaction: un JSONL archivé peut être supprimé
+        self._conn.execute("PRAGMA synchronous=FULL")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _current_segment(self, date: str) -> str:
+        """Dernier segment du jour avec ce codec, ou un nouveau s'il est plein"""
+        row = self._conn.execute("""
+            SELECT name, bytes FROM segments
+            WHERE date = ? AND codec = ?
+            ORDER BY name DESC LIMIT 1
+        """, (date, self.codec)).fetchone()
+
+        if row and row[1] < self.segment_max_bytes:
+            return row[0]
+
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM segments WHERE date = ?", (date,)
+        ).fetchone()[0]
+        name = f"articles-{date}-{count:03d}{_EXTENSIONS[self.codec]}"
+        self._conn.execute("""
+            INSERT INTO segments (name, date, codec, created_at) VALUES (?, ?, ?, ?)
+        """, (name, date, self.codec, datetime.utcnow().isoformat() + "Z"))
+        return name
+
+    def append(self, articles: Iterable[dict], date: str = None) -> int:
+        """
+        Ajoute des articles (dicts Article.to_dict) à l'archive.
+
+        Args:
+            articles: Articles à archiver (les IDs déjà archivés sont ignorés)
+            date: Jour de rattachement (défaut: date de collected_at)
+
+        Returns:
+            Nombre d'articles écrits (les IDs déjà archivés ne sont pas comptés)
+        """
+        by_date = {}
+        for article in articles:
+            day = date or (article.get('collected_at') or "")[:10] or datetime.utcnow().strftime("%Y-%m-%d")
+            by_date.setdefault(day, []).append(article)
+
+        written = 0
+        for day, day_articles in sorted(by_date.items()):
+            ids = [a['id'] for a in day_articles]
+            known = set()
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                known.update(row[0] for row in self._conn.execute(
+                    f"SELECT id FROM archived_articles WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                ))
+
+            fresh = []
+            for article in day_articles:
+                if article['id'] not in known:
+                    known.add(article['id'])
+                    fresh.append(article)
+
+            if len(fresh) < len(day_articles):
+                logger.info(f"Archive {day}: {len(day_articles) - len(fresh)} articles déjà archivés ignorés")
+
+            for i in range(0, len(fresh), self.frame_articles):
+                self._write_frame(day, fresh[i:i + self.frame_articles])
+            written += len(fresh)
+
+        return written
+
+    def _write_frame(self, date: str, frame_articles: List[dict]):
+        frame = self._compress(b"".join(dumps_bytes(a) + b"\n" for a in frame_articles))
+
+        with self._conn:
+            segment = self._current_segment(date)
+            path = self.archive_dir / segment
+            with open(path, "ab") as f:
+                offset = f.tell()
+                f.write(frame)
+                # Trame sur disque avant son entrée dans l'index
+                f.flush()
+                os.fsync(f.fileno())
+            if offset == 0:
+                _fsync_dir(self.archive_dir)
+
+            self._conn.executemany("""
+                INSERT OR IGNORE INTO archived_articles
+                    (id, segment, offset, length, line, date, source_type, source_name, published_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    a['id'], segment, offset, len(frame), line, date,
+                    a.get('source_type'), a.get('source_name'), a.get('published_at')
+                )
+                for line, a in enumerate(frame_articles)
+            ])
+            self._conn.execute("""
+                UPDATE segments SET articles = articles + ?, bytes = ? WHERE name = ?
+            """, (len(frame_articles), offset + len(frame), segment))
+
+    def import_jsonl(self, path: Path) -> Optional[dict]:
+        """
+        Archive un fichier articles_YYYY-MM-DD.jsonl ou near-duplicates_YYYY-MM-DD.jsonl
+        (une seule fois par fichier).
+
+        Returns:
+            {'read': articles du fichier, 'written': articles écrits par cet
+            import}, None si un fichier de ce nom a déjà été importé
+        """
+        path = Path(path)
+        if self._conn.execute(
+            "SELECT 1 FROM imported_files WHERE name = ?", (path.name,)
+        ).fetchone():
+            return None
+
+        match = _JSONL_NAME.match(path.name)
+        date = match.group(1) if match else None
+
+        read = 0
+        written = 0
+        batch = []
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                read += 1
+                batch.append(loads(line))
+                if len(batch) >= self.frame_articles * 16:
+                    written += self.append(batch, date=date)
+                    batch = []
+        written += self.append(batch, date=date)
+
+        with self._conn:
+            self._conn.execute("""
+                INSERT INTO imported_files (name, articles, imported_at) VALUES (?, ?, ?)
+            """, (path.name, written, datetime.utcnow().isoformat() + "Z"))
+        return {'read': read, 'written': written}
+
+
+class ArchiveReader:
+    """Lecture de l'archive via l'index"""
+
+    def __init__(self, archive_dir: str = None):
+        self.archive_dir = Path(archive_dir) if archive_dir else DEFAULT_ARCHIVE_DIR
+        self._conn = _open_index(self.archive_dir)
+        self._codecs = dict(self._conn.execute("SELECT name, codec FROM segments"))
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _read_frame(self, segment: str, offset: int, length: int) -> List[bytes]:
+        codec = self._codecs.get(segment)
+        if codec is None:
+            codec = self._conn.execute(
+                "SELECT codec FROM segments WHERE name = ?", (segment,)
+            ).fetchone()[0]
+            self._codecs[segment] = codec
+
+        with open(self.archive_dir / segment, "rb") as f:
+            f.seek(offset)
+            data = f.read(length)
+        return _decompressor(codec)(data).splitlines()
+
+    def get(self, article_id: str) -> Optional[dict]:
+        """Article archivé par ID (une seule trame décompressée)"""
+        row = self._conn.execute("""
+            SELECT segment, offset, length, line FROM archived_articles WHERE id = ?
+        """, (article_id,)).fetchone()
+        if row is None:
+            return None
+        segment, offset, length, line = row
+        return loads(self._read_frame(segment, offset, length)[line])
+
+    def iter_articles(
+        self,
+        source_type: str = None,
+        date_from: str = None,
+        date_to: str = None
+    ) -> Iterator[dict]:
+        """
+        Parcourt les articles archivés, dans l'ordre d'écriture.
+
+        Args:
+            source_type: Ne lire que cette source (rss, jina, reddit, youtube)
+            date_from: Premier jour inclus (YYYY-MM-DD)
+            date_to: Dernier jour inclus (YYYY-MM-DD)
+        """
+        conditions = []
+        params = []
+        if source_type:
+            conditions.append("source_type = ?")
+            params.append(source_type)
+        if date_from:
+            conditions.append("date >= ?")
+            params.append(date_from)
+        if date_to:
+            conditions.append("date <= ?")
+            params.append(date_to)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        cursor = self._conn.execute(f"""
+            SELECT segment, offset, length, line FROM archived_articles
+            {where}
+            ORDER BY segment, offset, line
+        """, params)
+
+        # Une trame n'est décompressée qu'une fois pour toutes ses lignes retenues
+        current = None
+        lines = []
+        for segment, offset, length, line in cursor:
+            if (segment, offset) != current:
+                current = (segment, offset)
+                lines = self._read_frame(segment, offset, length)
+            yield loads(lines[line])
+
+    def get_stats(self) -> dict:
+        """Statistiques de l'archive"""
+        articles, first_date, last_date = self._conn.execute(
+            "SELECT COUNT(*), MIN(date), MAX(date) FROM archived_articles"
+        ).fetchone()
+        segments, total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM segments"
+        ).fetchone()
+        by_source = dict(self._conn.execute("""
+            SELECT source_type, COUNT(*) FROM archived_articles GROUP BY source_type
+        """))
+        return {
+            'articles': articles,
+            'segments': segments,
+            'bytes': total_bytes,
+            'first_date': first_date,
+            'last_date': last_date,
+            'by_source': by_source,
+        }
+
+
+def archive_old_jsonl(
+    raw_dir: Path,
+    writer: ArchiveWriter,
+    keep_days: int = DEFAULT_KEEP_JSONL_DAYS,
+    delete: bool = False
+) -> dict:
+    """
+    Archive les JSONL du jour (articles_ et near-duplicates_YYYY-MM-DD.jsonl)
+    plus vieux que keep_days.
+
+    Args:
+        raw_dir: Dossier des JSONL du jour
+        writer: Archive de destination
+        keep_days: Jours récents laissés en JSONL (lus par l'analyse)
+        delete: Supprimer les JSONL une fois archivés. Un fichier n'est supprimé
+                que si cet import a écrit tous ses articles (trames synchronisées
+                sur disque) : jamais s'il avait déjà été importé sous ce nom, ni
+                si certains de ses IDs étaient déjà archivés depuis un autre fichier
+
+    Returns:
+        {'files': n, 'articles': m, 'deleted': k}
+    """
+    cutoff = (datetime.utcnow() - timedelta(days=keep_days)).strftime("%Y-%m-%d")
+    result = {'files': 0, 'articles': 0, 'deleted': 0}
+
+    for path in raw_jsonl_files(raw_dir):
+        if _JSONL_NAME.match(path.name).group(1) >= cutoff:
+            continue
+
+        imported = writer.import_jsonl(path)
+        if imported is None:
+            if delete:
+                logger.warning(f"{path.name} déjà importé sous ce nom: non archivé, conservé")
+            continue
+
+        result['files'] += 1
+        result['articles'] += imported['written']
+        logger.info(f"Archivé {path.name}: {imported['written']} articles")
+
+        if not delete:
+            continue
+        if imported['written'] < imported['read']:
+            logger.warning(
+                f"{path.name}: {imported['read'] - imported['written']} articles non écrits "
+                f"(IDs déjà archivés), conservé"
+            )
+            continue
+        path.unlink()
+        result['deleted'] += 1
+
+    return result
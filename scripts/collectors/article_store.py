@@ -0,0 +1,442 @@
+"""
+Stockage des articles avec recherche plein texte - Post Veille IA
+
+Table `articles` (articles normalisés) dans data/veille.db, à côté des tables
+de déduplication, indexée par une table FTS5 sur titre, résumé et contenu
+(contenu externe synchronisé par triggers). Permet de retrouver « tout sur
+Gemini depuis deux semaines » sans relire les JSONL.
+
+Un contenu sorti dans la table blobs (collectors/blob_store.py) n'est pas
+recopié : la ligne garde content_ref, et l'index FTS5 lit le texte à travers
+la vue articles_fts_source, qui le décompresse depuis blobs (fonction SQL
+blob_text, enregistrée sur chaque connexion ouverte par ArticleStore).
+
+Usage:
+    with ArticleStore() as store:
+        store.add_articles(articles)
+        hits = store.search("gemini", since="2026-01-01", limit=20)
+        for article in store.iter_search("OpenAI: news", limit=None):
+            ...
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from .schema import Article
+from .dates import parse_timestamp
+from .blob_store import blob_text, content_hash, create_blobs_table
+from .dedup import DEFAULT_DB_PATH
+from .serialization import dumps, loads
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Poids BM25 des colonnes FTS (titre, résumé, contenu)
+RANK_WEIGHTS = (10.0, 4.0, 1.0)
+
+# Résultats par défaut d'une recherche
+DEFAULT_SEARCH_LIMIT = 50
+
+# Texte indexé d'un article: contenu en ligne, sinon blob référencé
+_BODY_SQL = (
+    "COALESCE(NULLIF({row}.content, ''), "
+    "(SELECT blob_text(b.codec, b.data) FROM blobs b WHERE b.hash = {row}.content_ref))"
+)
+
+_COLUMNS = (
+    "id", "url", "title", "summary", "content", "source_name", "source_type",
+    "source_category", "published_at", "published_ts", "collected_at", "language",
+    "author", "tags", "score", "num_comments", "metadata", "content_ref",
+)
+_LIGHT_COLUMNS = tuple(c for c in _COLUMNS if c != "content")
+
+
+def to_fts_query(text: str, raw: bool = False) -> str:
+    """
+    Convertit une recherche libre en requête FTS5.
+
+    Chaque mot est mis entre guillemets, guillemets internes doublés : « GPT-5 »,
+    « OpenAI: », « C++ » ou « NOT » sont des mots cherchés, jamais de la
+    syntaxe, et tous doivent être présents. Avec raw, le texte est passé tel
+    quel à FTS5 (AND/OR/NOT, "phrases", préfixe*, filtres de colonne) et une
+    syntaxe invalide lève sqlite3.OperationalError.
+    """
+    text = text.strip()
+    if raw:
+        return text
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+def resolve_since(value: str) -> str:
+    """
+    Date de début d'une période: "14d", "2w" (relatif à aujourd'hui) ou
+    "YYYY-MM-DD" (inchangé).
+    """
+    match = re.fullmatch(r"(\d+)([dw])", value.strip())
+    if not match:
+        return value
+    days = int(match.group(1)) * (7 if match.group(2) == "w" else 1)
+    return (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+class ArticleStore:
+    """Articles normalisés + index FTS5 dans la base veille.db"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = self._connect(check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """Connexion avec la fonction blob_text utilisée par l'index FTS5"""
+        conn = sqlite3.connect(self.db_path, **kwargs)
+        conn.create_function("blob_text", 2, blob_text, deterministic=True)
+        return conn
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _init_db(self):
+        """Crée la table des articles, l'index FTS5 et ses triggers"""
+        with self._lock, self._conn:
+            create_blobs_table(self._conn)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    id TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    summary TEXT,
+                    content TEXT,
+                    source_name TEXT,
+                    source_type TEXT,
+                    source_category TEXT,
+                    published_at TEXT,
+                    published_ts INTEGER,
+                    collected_at TEXT NOT NULL,
+                    language TEXT,
+                    author TEXT,
+                    tags TEXT,
+                    score INTEGER,
+                    num_comments INTEGER,
+                    metadata TEXT,
+                    content_ref TEXT
+                )
+            """)
+            self._add_published_ts()
+            self._add_content_ref()
+            rebuild = self._drop_inline_fts()
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_articles_collected
+                ON articles(collected_at)
+            """)
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_articles_source_collected
+                ON articles(source_type, collected_at)
+            """)
+            self._conn.execute(f"""
+                CREATE VIEW IF NOT EXISTS articles_fts_source AS
+                SELECT a.rowid AS rowid, a.title, a.summary, {_BODY_SQL.format(row='a')} AS content
+                FROM articles a
+            """)
+            self._conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                    title, summary, content,
+                    content='articles_fts_source', content_rowid='rowid',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            """)
+            new_body = _BODY_SQL.format(row='new')
+            old_body = _BODY_SQL.format(row='old')
+            self._conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+                    INSERT INTO articles_fts(rowid, title, summary, content)
+                    VALUES (new.rowid, new.title, new.summary, {new_body});
+                END
+            """)
+            self._conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+                    INSERT INTO articles_fts(articles_fts, rowid, title, summary, content)
+                    VALUES ('delete', old.rowid, old.title, old.summary, {old_body});
+                END
+            """)
+            self._conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
+                    INSERT INTO articles_fts(articles_fts, rowid, title, summary, content)
+                    VALUES ('delete', old.rowid, old.title, old.summary, {old_body});
+                    INSERT INTO articles_fts(rowid, title, summary, content)
+                    VALUES (new.rowid, new.title, new.summary, {new_body});
+                END
+            """)
+            if rebuild:
+                self._conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+                logger.info("Index plein texte reconstruit (contenus lus depuis blobs)")
+
+    def _add_published_ts(self):
+        """Base antérieure à published_ts: ajout de la colonne, calculée depuis published_at"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        if "published_ts" in columns:
+            return
+        self._conn.execute("ALTER TABLE articles ADD COLUMN published_ts INTEGER")
+        rows = self._conn.execute(
+            "SELECT rowid, published_at FROM articles WHERE published_at IS NOT NULL"
+        ).fetchall()
+        self._conn.executemany(
+            "UPDATE articles SET published_ts = ? WHERE rowid = ?",
+            [(parse_timestamp(published_at), rowid) for rowid, published_at in rows]
+        )
+        logger.info(f"Colonne published_ts ajoutée ({len(rows)} dates converties)")
+
+    def _add_content_ref(self):
+        """Base antérieure à content_ref: ajout de la colonne"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        if "content_ref" not in columns:
+            self._conn.execute("ALTER TABLE articles ADD COLUMN content_ref TEXT")
+
+    def _drop_inline_fts(self) -> bool:
+        """
+        Ancien index FTS5 adossé directement à articles (contenus des blobs
+        recopiés dans articles.content): supprime l'index et ses triggers,
+        remplace les copies par leur content_ref.
+
+        Returns:
+            True si l'index est à reconstruire
+        """
+        row = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'articles_fts'"
+        ).fetchone()
+        if row is None or "articles_fts_source" in row[0]:
+            return False
+
+        for trigger in ("articles_fts_insert", "articles_fts_delete", "articles_fts_update"):
+            self._conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        self._conn.execute("DROP TABLE articles_fts")
+
+        copies = []
+        rows = self._conn.execute(
+            "SELECT rowid, content FROM articles WHERE content_ref IS NULL AND content != ''"
+        )
+        for rowid, content in rows:
+            ref = content_hash(content)
+            if self._conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (ref,)).fetchone():
+                copies.append((ref, rowid))
+        self._conn.executemany(
+            "UPDATE articles SET content = '', content_ref = ? WHERE rowid = ?", copies
+        )
+        logger.info(f"Index plein texte migré ({len(copies)} contenus dédoublonnés avec blobs)")
+        return True
+
+    def add_articles(self, articles: Iterable) -> int:
+        """
+        Ajoute des articles (Article ou dict) en une transaction.
+        Les IDs déjà présents sont ignorés. Un contenu sorti dans blobs
+        (content_ref) n'est pas recopié: l'index FTS5 le lit depuis blobs.
+
+        Returns:
+            Nombre d'articles insérés
+        """
+        articles = [a.to_dict() if isinstance(a, Article) else a for a in articles]
+
+        rows = []
+        for data in articles:
+            rows.append((
+                data['id'], data['url'], data.get('title') or "", data.get('summary'),
+                data.get('content'), data.get('source_name'), data.get('source_type'),
+                data.get('source_category'), data.get('published_at'),
+                data['published_ts'] if data.get('published_ts') is not None
+                else parse_timestamp(data.get('published_at')),
+                data.get('collected_at') or "", data.get('language'), data.get('author'),
+                dumps(data.get('tags') or []), data.get('score'), data.get('num_comments'),
+                dumps(data['metadata']) if data.get('metadata') is not None else None,
+                data.get('content_ref'),
+            ))
+
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            max_rowid = self._conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM articles").fetchone()[0]
+            self._conn.executemany(f"""
+                INSERT OR IGNORE INTO articles ({', '.join(_COLUMNS)})
+                VALUES ({', '.join('?' * len(_COLUMNS))})
+            """, rows)
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM articles WHERE rowid > ?", (max_rowid,)
+            ).fetchone()[0]
+
+    def _row_to_dict(self, columns, row) -> dict:
+        data = dict(zip(columns, row))
+        if 'tags' in data:
+            data['tags'] = loads(data['tags']) if data['tags'] else []
+        if data.get('metadata'):
+            data['metadata'] = loads(data['metadata'])
+        return data
+
+    @staticmethod
+    def _filters(since: str, until: str, source_type: str, params: list) -> str:
+        conditions = []
+        if since:
+            conditions.append("a.collected_at >= ?")
+            params.append(since)
+        if until:
+            # Jour inclus: "2026-01-31" couvre toute la journée du 31
+            if len(until) == 10:
+                conditions.append("a.collected_at < date(?, '+1 day')")
+            else:
+                conditions.append("a.collected_at <= ?")
+            params.append(until)
+        if source_type:
+            conditions.append("a.source_type = ?")
+            params.append(source_type)
+        return "".join(f" AND {c}" for c in conditions)
+
+    def _iter_rows(self, sql: str, params: list) -> Iterator[tuple]:
+        """
+        Lignes d'une requête lues au fil du curseur, sur une connexion de
+        lecture dédiée (WAL: ni verrou ni connexion partagée tenus pendant
+        le parcours).
+        """
+        conn = self._connect()
+        try:
+            yield from conn.execute(sql, params)
+        finally:
+            conn.close()
+
+    def iter_search(
+        self,
+        query: str,
+        since: str = None,
+        until: str = None,
+        source_type: str = None,
+        limit: Optional[int] = DEFAULT_SEARCH_LIMIT,
+        with_content: bool = False,
+        raw: bool = False
+    ) -> Iterator[dict]:
+        """
+        Recherche plein texte, résultats classés par pertinence (BM25) et lus
+        au fil de l'eau: limit=None ne charge pas tous les résultats en mémoire.
+
+        Args:
+            query: Recherche libre (voir to_fts_query)
+            since: collected_at minimal (YYYY-MM-DD ou ISO 8601)
+            until: collected_at maximal, jour inclus
+            source_type: rss, jina, reddit, youtube
+            limit: Nombre max de résultats (None = tous)
+            with_content: Inclure le contenu (vide avec content_ref: voir
+                          blob_store.load_content)
+            raw: query est une requête FTS5 (syntaxe invalide:
+                 sqlite3.OperationalError au premier résultat)
+
+        Yields:
+            Articles (dicts) avec 'rank' (plus petit = plus pertinent) et
+            'snippet' (extrait du contenu autour des termes trouvés)
+        """
+        fts_query = to_fts_query(query, raw)
+        if not fts_query:
+            return
+
+        columns = _COLUMNS if with_content else _LIGHT_COLUMNS
+        params = [fts_query]
+        filters = self._filters(since, until, source_type, params)
+        limit_sql = ""
+        if limit is not None:
+            limit_sql = "LIMIT ?"
+            params.append(limit)
+
+        weights = ", ".join(str(w) for w in RANK_WEIGHTS)
+        rows = self._iter_rows(f"""
+            SELECT {', '.join('a.' + c for c in columns)},
+                   bm25(articles_fts, {weights}) AS rank,
+                   snippet(articles_fts, 2, '[', ']', '…', 16)
+            FROM articles_fts
+            JOIN articles a ON a.rowid = articles_fts.rowid
+            WHERE articles_fts MATCH ?{filters}
+            ORDER BY rank
+            {limit_sql}
+        """, params)
+
+        for row in rows:
+            data = self._row_to_dict(columns, row[:-2])
+            data['rank'] = round(row[-2], 4)
+            data['snippet'] = row[-1]
+            yield data
+
+    def search(
+        self,
+        query: str,
+        since: str = None,
+        until: str = None,
+        source_type: str = None,
+        limit: Optional[int] = DEFAULT_SEARCH_LIMIT,
+        with_content: bool = False,
+        raw: bool = False
+    ) -> List[dict]:
+        """Liste des résultats de iter_search (mêmes arguments)"""
+        return list(self.iter_search(query, since, until, source_type, limit, with_content, raw))
+
+    def iter_articles(
+        self,
+        since: str = None,
+        until: str = None,
+        source_type: str = None,
+        with_content: bool = True
+    ) -> Iterator[dict]:
+        """Parcourt les articles stockés par date de collecte (lus au fil du curseur)"""
+        columns = _COLUMNS if with_content else _LIGHT_COLUMNS
+        params = []
+        filters = self._filters(since, until, source_type, params)
+        rows = self._iter_rows(f"""
+            SELECT {', '.join('a.' + c for c in columns)}
+            FROM articles a WHERE 1 = 1{filters}
+            ORDER BY a.collected_at
+        """, params)
+        for row in rows:
+            yield self._row_to_dict(columns, row)
+
+    def get(self, article_id: str) -> Optional[dict]:
+        """Article par ID"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM articles WHERE id = ?", (article_id,)
+            ).fetchone()
+        return self._row_to_dict(_COLUMNS, row) if row else None
+
+    def optimize(self):
+        """Fusionne les segments de l'index FTS5 (après un gros import)"""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('optimize')")
+
+    def get_stats(self) -> dict:
+        """Statistiques du stockage"""
+        with self._lock:
+            total, first, last = self._conn.execute(
+                "SELECT COUNT(*), MIN(collected_at), MAX(collected_at) FROM articles"
+            ).fetchone()
+            by_source = dict(self._conn.execute(
+                "SELECT source_type, COUNT(*) FROM articles GROUP BY source_type"
+            ))
+        return {
+            'total_articles': total,
+            'first_collected_at': first,
+            'last_collected_at': last,
+            'by_source': by_source,
+        }
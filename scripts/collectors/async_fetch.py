@@ -0,0 +1,220 @@
+"""
+Moteur de requêtes asynchrone - Post Veille IA
+
+Exécute les requêtes HTTP en parallèle avec un limiteur de débit
+(token bucket) par hôte, à la place des time.sleep() fixes entre sources.
+Les en-têtes Retry-After et X-RateLimit-* renvoyés par les serveurs
+ajustent le limiteur en cours de route.
+
+Usage:
+    async def main():
+        fetcher = RateLimitedFetcher({'r.jina.ai': 20})
+        return await asyncio.gather(*(fetcher.get(url) for url in urls))
+
+    responses = run_async(main())
+"""
+
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from .http_session import get_session
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Débit par défaut pour un hôte non configuré (requêtes / minute)
+DEFAULT_RPM = 60
+
+# Statuts pour lesquels on réessaie après Retry-After
+RETRY_STATUSES = {429, 503}
+
+
+class TokenBucket:
+    """Limiteur de débit asyncio (token bucket)"""
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        self.rate = max(rate_per_minute, 0.1) / 60.0   # Jetons par seconde
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def pause_until(self, timestamp: float):
+        """Suspend le bucket jusqu'à `timestamp` (horloge monotonic)"""
+        if timestamp > self.paused_until:
+            self.paused_until = timestamp
+            self.tokens = 0.0
+
+    async def acquire(self):
+        """Attend qu'un jeton soit disponible (ordre FIFO)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convertit un en-tête Retry-After (secondes ou date HTTP) en secondes"""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedFetcher:
+    """Exécute des requêtes HTTP concurrentes, limitées par hôte"""
+
+    def __init__(
+        self,
+        host_limits: Dict[str, float] = None,
+        default_rpm: float = DEFAULT_RPM,
+        burst: int = 1,
+        max_concurrency: int = 8,
+        max_retries: int = 2
+    ):
+        """
+        Args:
+            host_limits: Débit max par hôte en requêtes/minute ({'r.jina.ai': 20})
+            default_rpm: Débit pour les hôtes absents de host_limits
+            burst: Nombre de requêtes pouvant partir d'un coup
+            max_concurrency: Requêtes en vol simultanément (tous hôtes confondus)
+            max_retries: Nouvelles tentatives après un 429/503
+        """
+        self.host_limits = {h.lower(): rpm for h, rpm in (host_limits or {}).items()}
+        self.default_rpm = default_rpm
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._semaphore = None
+        self.stats = {'requests': 0, 'retries': 0, 'throttled': 0}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            rpm = self.host_limits.get(host, self.default_rpm)
+            self._buckets[host] = TokenBucket(rpm, self.burst)
+        return self._buckets[host]
+
+    def _apply_rate_headers(self, host: str, response: requests.Response) -> Optional[float]:
+        """
+        Ajuste le bucket selon les en-têtes de la réponse.
+
+        Returns:
+            Délai d'attente avant de réessayer si la requête a été refusée
+        """
+        headers = response.headers
+        bucket = self._bucket(host)
+        wait = None
+
+        if response.status_code in RETRY_STATUSES:
+            wait = parse_retry_after(headers.get('Retry-After'))
+            if wait is None:
+                wait = 60.0 / max(self.host_limits.get(host, self.default_rpm), 0.1)
+
+        # X-RateLimit-Remaining / Reset (Reddit) ou RateLimit-* (IETF draft)
+        remaining = headers.get('X-RateLimit-Remaining') or headers.get('RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset') or headers.get('RateLimit-Reset')
+        try:
+            if remaining is not None and float(remaining) < 1 and reset is not None:
+                wait = max(wait or 0.0, float(reset))
+        except ValueError:
+            pass
+
+        if wait:
+            self.stats['throttled'] += 1
+            logger.info(f"Limite atteinte pour {host} - pause de {wait:.0f}s")
+            bucket.pause_until(time.monotonic() + wait)
+
+        return wait
+
+    async def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Exécute une requête en respectant la limite de l'hôte.
+
+        La requête bloquante tourne dans un thread (asyncio.to_thread) sur
+        la session HTTP partagée ; les 429/503 sont réessayés après le délai indiqué par le serveur.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        host = urlparse(url).netloc.lower()
+        bucket = self._bucket(host)
+
+        for attempt in range(self.max_retries + 1):
+            await bucket.acquire()
+            async with self._semaphore:
+                self.stats['requests'] += 1
+                response = await asyncio.to_thread(get_session().request, method, url, **kwargs)
+
+            wait = self._apply_rate_headers(host, response)
+            if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                return response
+
+            self.stats['retries'] += 1
+            logger.debug(f"Nouvelle tentative {attempt + 1} pour {url} dans {wait:.0f}s")
+
+        return response
+
+    async def get(self, url: str, **kwargs) -> requests.Response:
+        return await self.request('GET', url, **kwargs)
+
+
+def run_async(coro):
+    """Exécute une coroutine depuis du code synchrone"""
+    return asyncio.run(coro)
+
+
+def iter_in_order(make_coros: Callable[[], Iterable[Awaitable]]) -> Iterator:
+    """
+    Générateur synchrone : les coroutines tournent en parallèle dans une
+    boucle asyncio dédiée, leurs résultats sont produits dans l'ordre des
+    coroutines (chacun dès qu'il est prêt, ainsi que tous les précédents).
+    L'ordre de sortie ne dépend donc pas des temps de réponse.
+
+    Args:
+        make_coros: Fabrique appelée dans la boucle (les objets asyncio
+                    comme RateLimitedFetcher doivent y être créés)
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        async def start():
+            return [asyncio.ensure_future(coro) for coro in make_coros()]
+
+        # Attendre une tâche fait aussi avancer toutes les autres
+        for task in loop.run_until_complete(start()):
+            yield loop.run_until_complete(task)
+    finally:
+        for task in asyncio.all_tasks(loop):
+            task.cancel()
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
@@ -0,0 +1,271 @@
+"""
+Stockage des corps d'articles par contenu - Post Veille IA
+
+Les contenus volumineux (HTML RSS, selftext Reddit, transcripts YouTube) ne
+sont plus écrits dans chaque ligne JSONL : ils sont stockés une seule fois,
+compressés, dans la table `blobs` de data/veille.db, sous le hash SHA-256 de
+leur texte. L'article ne garde que `content_ref` ; un même corps re-collecté
+ou repris par plusieurs sources n'est stocké qu'une fois.
+
+Le contenu n'est relu qu'à la demande (Article.get_content, load_content) :
+les traitements qui ne lisent que les titres ne le décompressent jamais.
+
+Désactivé par défaut (settings.blob_store) : les JSONL et l'archive ne sont
+alors plus autonomes (content_ref vers data/veille.db). Les blobs qu'aucun
+JSONL, article archivé ni article du stockage plein texte ne référence sont
+supprimés par collect_garbage (scripts/gc_blobs.py).
+
+Usage:
+    with BlobStore() as blobs:
+        ref = blobs.put(article.content)
+        text = blobs.get(ref)
+        blobs.collect_garbage(live_refs)
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .dedup import DEFAULT_DB_PATH
+
+# Compression zstd (optionnelle, zlib sinon)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Taille min (caractères) d'un contenu sorti du JSONL (surchargée par settings.blob_store)
+DEFAULT_MIN_CHARS = 1024
+
+# Âge min d'un blob supprimable: une collecte en cours a pu le stocker sans
+# avoir encore écrit le JSONL qui le référence
+DEFAULT_GC_MIN_AGE_HOURS = 24
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def content_hash(text: str) -> str:
+    """Référence d'un contenu: SHA-256 hexadécimal du texte UTF-8"""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class BlobStore:
+    """Table blobs (hash -> contenu compressé) dans la base veille.db"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if ZSTD_AVAILABLE:
+            self.codec = 'zstd'
+            self._compress = zstandard.ZstdCompressor(level=10).compress
+        else:
+            self.codec = 'zlib'
+            self._compress = lambda data: zlib.compress(data, 6)
+        self._init_db()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _init_db(self):
+        with self._lock, self._conn:
+            create_blobs_table(self._conn)
+
+    def put_many(self, texts: Iterable[str]) -> List[str]:
+        """
+        Stocke des contenus en une transaction (les contenus déjà connus ne
+        sont ni recompressés ni réécrits).
+
+        Returns:
+            Références, dans l'ordre des contenus
+        """
+        texts = list(texts)
+        refs = [content_hash(text) for text in texts]
+        if not refs:
+            return refs
+
+        with self._lock, self._conn:
+            known = set()
+            unique_refs = list(dict.fromkeys(refs))
+            for i in range(0, len(unique_refs), 500):
+                chunk = unique_refs[i:i + 500]
+                known.update(row[0] for row in self._conn.execute(
+                    f"SELECT hash FROM blobs WHERE hash IN ({','.join('?' * len(chunk))})", chunk
+                ))
+
+            now = datetime.utcnow().isoformat() + "Z"
+            rows = []
+            for ref, text in zip(refs, texts):
+                if ref in known:
+                    continue
+                known.add(ref)
+                data = text.encode()
+                rows.append((ref, self.codec, len(data), self._compress(data), now))
+
+            self._conn.executemany("""
+                INSERT OR IGNORE INTO blobs (hash, codec, size, data, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+
+        return refs
+
+    def put(self, text: str) -> str:
+        """Stocke un contenu et retourne sa référence"""
+        return self.put_many([text])[0]
+
+    def get_many(self, refs: Iterable[str]) -> Dict[str, str]:
+        """Contenus par référence (les références inconnues sont absentes)"""
+        refs = list(dict.fromkeys(refs))
+        results = {}
+        with self._lock:
+            for i in range(0, len(refs), 500):
+                chunk = refs[i:i + 500]
+                for ref, codec, data in self._conn.execute(
+                    f"SELECT hash, codec, data FROM blobs WHERE hash IN ({','.join('?' * len(chunk))})", chunk
+                ):
+                    results[ref] = _decompress(codec, data).decode()
+        return results
+
+    def get(self, ref: str) -> Optional[str]:
+        """Contenu d'une référence, None si inconnue"""
+        return self.get_many([ref]).get(ref)
+
+    def collect_garbage(
+        self,
+        live_refs: Iterable[str],
+        min_age_hours: float = DEFAULT_GC_MIN_AGE_HOURS,
+        dry_run: bool = False
+    ) -> int:
+        """
+        Supprime les blobs absents de live_refs (références encore utilisées)
+        et créés il y a plus de min_age_hours.
+
+        Returns:
+            Nombre de blobs supprimés (ou supprimables avec dry_run)
+        """
+        cutoff = (datetime.utcnow() - timedelta(hours=min_age_hours)).isoformat() + "Z"
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS live_refs (hash TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM live_refs")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO live_refs (hash) VALUES (?)", ((ref,) for ref in live_refs)
+            )
+            condition = "created_at < ? AND hash NOT IN (SELECT hash FROM live_refs)"
+            if dry_run:
+                removed = self._conn.execute(
+                    f"SELECT COUNT(*) FROM blobs WHERE {condition}", (cutoff,)
+                ).fetchone()[0]
+            else:
+                removed = self._conn.execute(f"DELETE FROM blobs WHERE {condition}", (cutoff,)).rowcount
+            self._conn.execute("DROP TABLE live_refs")
+        return removed
+
+    def get_stats(self) -> dict:
+        """Statistiques du stockage"""
+        with self._lock:
+            count, size, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM blobs"
+            ).fetchone()
+        return {
+            'blobs': count,
+            'bytes': size,
+            'stored_bytes': stored,
+            'compression_ratio': round(size / stored, 2) if stored else 0.0,
+        }
+
+
+def create_blobs_table(conn: sqlite3.Connection):
+    """Crée la table blobs (partagée avec l'index plein texte d'article_store)"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS blobs (
+            hash TEXT PRIMARY KEY,
+            codec TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL,
+            created_at TEXT NOT NULL
+        ) WITHOUT ROWID
+    """)
+
+
+def blob_text(codec: Optional[str], data: Optional[bytes]) -> Optional[str]:
+    """Texte d'une ligne de blobs (fonction SQL blob_text(codec, data))"""
+    if data is None:
+        return None
+    return _decompress(codec, data).decode()
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("Contenu zstd: installer le paquet zstandard pour le lire")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def get_blob_store() -> BlobStore:
+    """Stockage partagé (ouvert au premier appel)"""
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = BlobStore()
+
+    return _store
+
+
+def externalize_articles(
+    articles: List[dict],
+    store: BlobStore,
+    min_chars: int = DEFAULT_MIN_CHARS
+) -> List[dict]:
+    """
+    Sort les contenus volumineux de dicts d'articles (modifiés en place):
+    content -> "" et content_ref -> hash du contenu stocké.
+    """
+    large = [a for a in articles if a.get('content') and len(a['content']) >= min_chars]
+    refs = store.put_many(a['content'] for a in large)
+    for article, ref in zip(large, refs):
+        article['content'] = ""
+        article['content_ref'] = ref
+    return articles
+
+
+def load_content(article: dict, store: BlobStore = None) -> str:
+    """
+    Contenu d'un dict d'article, relu depuis le stockage si nécessaire
+    (et mis en cache dans le dict).
+    """
+    if article.get('content') or not article.get('content_ref'):
+        return article.get('content') or ""
+
+    text = (store or get_blob_store()).get(article['content_ref'])
+    if text is None:
+        logger.warning(f"Contenu introuvable: {article['content_ref']}")
+        text = ""
+    article['content'] = text
+    return text
@@ -0,0 +1,101 @@
+"""
+Filtre de Bloom - Post Veille IA
+
+Ensemble probabiliste compact des IDs d'articles déjà vus. Répond
+"certainement nouveau" sans requête SQLite ; une réponse positive peut être
+un faux positif et doit être confirmée par la base.
+
+Format du fichier: en-tête (magic, m, k, count, watermark, capacity,
+error_rate) suivi du tableau de bits.
+"""
+
+import hashlib
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Optional, Tuple
+
+_MAGIC = b"VBF1"
+_HEADER = struct.Struct("<4sQIQqQd")
+
+
+class BloomFilter:
+    """Filtre de Bloom à double hachage (blake2b)"""
+
+    def __init__(self, capacity: int = 200_000, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: Nombre d'éléments prévus
+            error_rate: Taux de faux positifs visé à pleine capacité
+        """
+        self.capacity = max(1, int(capacity))
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(
+            -self.capacity * math.log(error_rate) / (math.log(2) ** 2)
+        )))
+        self.num_hashes = max(1, int(round(self.num_bits / self.capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.bits)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def save(self, path: Path, watermark: int = 0):
+        """Écrit le filtre sur disque (écriture atomique)"""
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(
+                _MAGIC, self.num_bits, self.num_hashes, self.count,
+                watermark, self.capacity, self.error_rate
+            ))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional[Tuple['BloomFilter', int]]:
+        """
+        Charge un filtre depuis le disque.
+
+        Returns:
+            (filtre, watermark) ou None si le fichier est absent ou invalide
+        """
+        try:
+            with open(path, "rb") as f:
+                header = f.read(_HEADER.size)
+                magic, num_bits, num_hashes, count, watermark, capacity, error_rate = _HEADER.unpack(header)
+                if magic != _MAGIC:
+                    return None
+                bits = bytearray(f.read())
+        except (OSError, struct.error):
+            return None
+
+        if len(bits) != (num_bits + 7) // 8:
+            return None
+
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.error_rate = error_rate
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.bits = bits
+        bloom.count = count
+        return bloom, watermark
@@ -0,0 +1,64 @@
+"""
+Dates de publication - Post Veille IA
+
+Convertit published_at (chaîne) en timestamp epoch entier (secondes UTC),
+calculé une fois à la collecte (Article.published_ts) : le scoring compare
+des entiers au lieu de re-parser des chaînes.
+
+Les collecteurs écrivent des dates UTC (iso_utc pour les timestamps de
+Reddit et les dates déjà décodées par feedparser).
+
+Formats acceptés (ceux produits par les collecteurs et les flux) :
+  - ISO 8601 UTC avec "Z" final ("2026-01-15T10:00:00Z", "2026-01-15T10:00:00.123456Z")
+  - ISO 8601 avec décalage ("2026-01-15T10:00:00+01:00", Discord)
+  - ISO 8601 naïf (considéré UTC) ou date seule ("2026-01-15")
+  - RFC 2822 des flux RSS ("Thu, 15 Jan 2026 10:00:00 GMT")
+
+Usage:
+    parse_timestamp("2026-01-15T10:00:00Z")  # -> 1768471200
+    iso_utc(1768471200)                      # -> "2026-01-15T10:00:00Z"
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Union
+
+
+def iso_utc(ts: Union[int, float]) -> str:
+    """Date ISO 8601 UTC avec "Z" final d'un timestamp epoch"""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+
+
+def parse_timestamp(value: Union[str, int, float, None]) -> Optional[int]:
+    """
+    Timestamp epoch (secondes UTC) d'une date de publication.
+
+    Les dates sans fuseau sont considérées UTC. Un nombre est pris comme un
+    timestamp déjà calculé.
+
+    Returns:
+        Entier, ou None si la date est absente ou illisible
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    text = value.strip()
+    if not text:
+        return None
+
+    try:
+        # "Z" final: accepté par fromisoformat depuis Python 3.11 seulement
+        if text[-1] in "zZ":
+            text = text[:-1] + "+00:00"
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(text)
+        except (TypeError, ValueError, IndexError):
+            return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
@@ -7,12 +7,14 @@ Gère la déduplication des articles via SQLite.
 
 import sqlite3
 import logging
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Set
+from typing import Iterable, List, Set
 import json
 
 from .schema import Article
+from .bloom import BloomFilter
 
 # Configuration logging
 logging.basicConfig(level=logging.INFO)
@@ -21,19 +23,120 @@ logger = logging.getLogger(__name__)
 # Chemin par défaut de la base
 DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "veille.db"
 
+# Rétention par défaut des IDs vus (surchargée par settings.dedupe_window_days)
+DEFAULT_RETENTION_DAYS = 7
+
+# Nombre d'IDs par requête IN (limite SQLite: 999 paramètres)
+LOOKUP_CHUNK_SIZE = 500
+
+# Filtre de Bloom devant la table (surchargé par settings.dedup_bloom)
+DEFAULT_BLOOM_CAPACITY = 200_000
+DEFAULT_BLOOM_ERROR_RATE = 0.001
+
 
 class DeduplicationDB:
-    """Gestionnaire de déduplication SQLite"""
+    """
+    Gestionnaire de déduplication SQLite.
+
+    Une seule connexion est gardée ouverte (mode WAL, synchronous=NORMAL) et
+    les insertions se font par lots dans une transaction unique.
+    Utilisable comme context manager pour fermer la connexion.
+
+    Un filtre de Bloom persistant (veille.bloom à côté de la base) répond
+    "certainement nouveau" sans toucher SQLite ; seules les réponses
+    "peut-être vu" sont vérifiées en base. Le filtre mémorise le dernier
+    rowid indexé et rattrape au chargement les lignes ajoutées depuis.
+    """
 
-    def __init__(self, db_path: str = None):
+    def __init__(
+        self,
+        db_path: str = None,
+        use_bloom: bool = True,
+        bloom_capacity: int = DEFAULT_BLOOM_CAPACITY,
+        bloom_error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+        bloom_path: str = None
+    ):
         self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._init_db()
 
+        self.bloom = None
+        self.bloom_path = Path(bloom_path) if bloom_path else self.db_path.with_suffix(".bloom")
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.bloom_stats = {'definitely_new': 0, 'maybe_seen': 0, 'false_positives': 0}
+        if use_bloom:
+            self._load_bloom()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Sauvegarde le filtre de Bloom et ferme la connexion SQLite"""
+        with self._lock:
+            if self._conn is not None:
+                if self.bloom is not None:
+                    self.bloom.save(self.bloom_path, self._max_rowid())
+                self._conn.close()
+                self._conn = None
+
+    def _max_rowid(self) -> int:
+        return self._conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM seen_articles").fetchone()[0]
+
+    def _load_bloom(self):
+        """Charge le filtre persistant, ou le reconstruit s'il est absent / inadapté"""
+        loaded = BloomFilter.load(self.bloom_path)
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+
+            if (
+                loaded is None
+                or loaded[0].capacity != self.bloom_capacity
+                or loaded[0].error_rate != self.bloom_error_rate
+                or loaded[0].count > loaded[0].capacity
+            ):
+                self._rebuild_bloom_locked(total)
+                return
+
+            self.bloom, watermark = loaded
+
+            # Rattraper les lignes écrites sans mise à jour du filtre
+            cursor = self._conn.execute(
+                "SELECT id FROM seen_articles WHERE rowid > ?", (watermark,)
+            )
+            for (article_id,) in cursor:
+                self.bloom.add(article_id)
+
+    def _rebuild_bloom_locked(self, total: int):
+        if total > self.bloom_capacity:
+            logger.warning(
+                f"Filtre de Bloom: {total} IDs pour une capacité de {self.bloom_capacity} "
+                f"- augmenter settings.dedup_bloom.capacity"
+            )
+
+        self.bloom = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        for (article_id,) in self._conn.execute("SELECT id FROM seen_articles"):
+            self.bloom.add(article_id)
+        self.bloom.save(self.bloom_path, self._max_rowid())
+        logger.info(f"Filtre de Bloom reconstruit: {total} IDs, {self.bloom.size_bytes // 1024} Ko")
+
+    def rebuild_bloom(self):
+        """Reconstruit le filtre de Bloom depuis la table"""
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+            self._rebuild_bloom_locked(total)
+
     def _init_db(self):
         """Initialise la base de données"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+        with self._lock, self._conn:
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS seen_articles (
                     id TEXT PRIMARY KEY,
                     url TEXT NOT NULL,
@@ -44,109 +147,187 @@ class DeduplicationDB:
                     last_seen_at TEXT NOT NULL
                 )
             """)
-            conn.execute("""
+            self._conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_seen_at
                 ON seen_articles(first_seen_at)
             """)
-            conn.commit()
 
     def is_seen(self, article_id: str) -> bool:
         """Vérifie si un article a déjà été vu"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM seen_articles WHERE id = ?",
-                (article_id,)
-            )
-            return cursor.fetchone() is not None
+        return bool(self.find_seen([article_id]))
 
     def mark_seen(self, article: Article):
         """Marque un article comme vu"""
-        now = datetime.utcnow().isoformat() + "Z"
+        self.mark_seen_many([article])
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO seen_articles (id, url, title, source_name, source_type, first_seen_at, last_seen_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET last_seen_at = ?
-            """, (
+    def mark_seen_many(self, articles: List[Article]) -> int:
+        """
+        Marque un lot d'articles comme vus en une seule transaction.
+
+        Returns:
+            Nombre d'articles écrits
+        """
+        if not articles:
+            return 0
+
+        now = datetime.utcnow().isoformat() + "Z"
+        rows = [
+            (
                 article.id,
                 article.url,
                 article.title[:200],
                 article.source_name,
                 article.source_type,
                 now, now, now
-            ))
-            conn.commit()
+            )
+            for article in articles
+        ]
+
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO seen_articles (id, url, title, source_name, source_type, first_seen_at, last_seen_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET last_seen_at = ?
+            """, rows)
+
+            if self.bloom is not None:
+                for article in articles:
+                    self.bloom.add(article.id)
+
+        return len(rows)
+
+    def find_seen(self, article_ids: Iterable[str]) -> Set[str]:
+        """
+        Retourne les IDs du lot déjà présents en base.
+
+        Sonde uniquement les IDs candidats (requêtes IN par paquets sur la
+        clé primaire) : le coût dépend de la taille du lot, pas de l'historique.
+        Les IDs absents du filtre de Bloom ne sont pas cherchés en base.
+        """
+        ids = list(dict.fromkeys(article_ids))
+        seen = set()
+
+        with self._lock:
+            # Le filtre de Bloom écarte les IDs certainement nouveaux
+            if self.bloom is not None:
+                candidates = [article_id for article_id in ids if article_id in self.bloom]
+                self.bloom_stats['definitely_new'] += len(ids) - len(candidates)
+                self.bloom_stats['maybe_seen'] += len(candidates)
+                ids = candidates
+
+            for i in range(0, len(ids), LOOKUP_CHUNK_SIZE):
+                chunk = ids[i:i + LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self._conn.execute(
+                    f"SELECT id FROM seen_articles WHERE id IN ({placeholders})",
+                    chunk
+                )
+                seen.update(row[0] for row in cursor.fetchall())
+
+            if self.bloom is not None:
+                self.bloom_stats['false_positives'] += len(ids) - len(seen)
+
+        return seen
 
     def get_seen_ids(self) -> Set[str]:
-        """Récupère tous les IDs déjà vus"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT id FROM seen_articles")
+        """Récupère tous les IDs déjà vus (préférer find_seen pour un lot)"""
+        with self._lock:
+            cursor = self._conn.execute("SELECT id FROM seen_articles")
             return {row[0] for row in cursor.fetchall()}
 
-    def cleanup_old(self, retention_days: int = 7):
+    def cleanup_old(self, retention_days: int = DEFAULT_RETENTION_DAYS):
         """Supprime les entrées plus vieilles que retention_days"""
         cutoff = (datetime.utcnow() - timedelta(days=retention_days)).isoformat() + "Z"
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
                 "DELETE FROM seen_articles WHERE first_seen_at < ?",
                 (cutoff,)
             )
             deleted = cursor.rowcount
-            conn.commit()
 
         if deleted > 0:
             logger.info(f"Nettoyage: {deleted} anciennes entrées supprimées")
 
+            # Les IDs supprimés restent dans le filtre (faux positifs) :
+            # reconstruire quand ils en représentent une part importante
+            if self.bloom is not None and deleted * 4 > self.bloom.count:
+                self.rebuild_bloom()
+
         return deleted
 
     def get_stats(self) -> dict:
         """Retourne des statistiques sur la base"""
-        with sqlite3.connect(self.db_path) as conn:
-            total = conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
 
             by_source = {}
-            cursor = conn.execute(
+            cursor = self._conn.execute(
                 "SELECT source_type, COUNT(*) FROM seen_articles GROUP BY source_type"
             )
             for row in cursor.fetchall():
                 by_source[row[0]] = row[1]
 
-            return {
+            stats = {
                 "total_articles": total,
                 "by_source_type": by_source
             }
 
+            if self.bloom is not None:
+                stats["bloom"] = dict(
+                    self.bloom_stats,
+                    size_bytes=self.bloom.size_bytes,
+                    capacity=self.bloom.capacity,
+                    error_rate=self.bloom.error_rate
+                )
+
+            return stats
 
-def deduplicate_articles(articles: List[Article], db_path: str = None) -> List[Article]:
+
+def deduplicate_articles(
+    articles: List[Article],
+    db_path: str = None,
+    db: DeduplicationDB = None,
+    retention_days: int = DEFAULT_RETENTION_DAYS
+) -> List[Article]:
     """
     Filtre les articles déjà vus et marque les nouveaux comme vus.
 
     Args:
         articles: Liste d'articles à filtrer
         db_path: Chemin vers la base SQLite
+        db: Base déjà ouverte (traitement par lots) ; le nettoyage des
+            vieilles entrées est alors à la charge de l'appelant
+        retention_days: Durée de conservation des IDs vus
 
     Returns:
         Liste d'articles non vus
     """
-    db = DeduplicationDB(db_path)
+    owns_db = db is None
+    if owns_db:
+        db = DeduplicationDB(db_path)
 
-    # Nettoyer les vieilles entrées
-    db.cleanup_old(retention_days=7)
+        # Nettoyer les vieilles entrées
+        db.cleanup_old(retention_days=retention_days)
 
-    # Récupérer les IDs déjà vus
-    seen_ids = db.get_seen_ids()
+    # Ne sonder que les IDs du lot
+    seen_ids = db.find_seen(article.id for article in articles)
 
-    # Filtrer et marquer
+    # Filtrer (les doublons à l'intérieur du lot sont aussi écartés)
     new_articles = []
     for article in articles:
         if article.id not in seen_ids:
+            seen_ids.add(article.id)
             new_articles.append(article)
-            db.mark_seen(article)
         else:
             logger.debug(f"Article déjà vu: {article.title[:50]}")
 
+    # Marquer tout le lot en une seule transaction
+    db.mark_seen_many(new_articles)
+
+    if owns_db:
+        db.close()
+
     logger.info(f"Déduplication: {len(new_articles)} nouveaux / {len(articles)} total")
 
     return new_articles
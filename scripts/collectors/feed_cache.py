@@ -0,0 +1,105 @@
+"""
+Cache HTTP des flux RSS - Post Veille IA
+
+Conserve les validateurs HTTP (ETag, Last-Modified) et le hash du dernier
+contenu de chaque flux pour envoyer des requêtes conditionnelles.
+Stocké dans la même base SQLite que la déduplication (data/veille.db).
+"""
+
+import sqlite3
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from .dedup import DEFAULT_DB_PATH
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class FeedCache:
+    """Stockage SQLite des validateurs HTTP par flux"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialise la table du cache"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feed_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body_hash TEXT,
+                    last_checked_at TEXT NOT NULL,
+                    last_changed_at TEXT
+                )
+            """)
+            conn.commit()
+
+    def get(self, url: str) -> Optional[dict]:
+        """Récupère les validateurs connus pour un flux"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT etag, last_modified, body_hash FROM feed_cache WHERE url = ?",
+                (url,)
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+
+        return {'etag': row[0], 'last_modified': row[1], 'body_hash': row[2]}
+
+    def conditional_headers(self, url: str) -> dict:
+        """Construit les en-têtes If-None-Match / If-Modified-Since"""
+        entry = self.get(url)
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def update(self, url: str, etag: Optional[str], last_modified: Optional[str], body_hash: str):
+        """Enregistre les validateurs d'un flux qui vient d'être parsé"""
+        now = datetime.utcnow().isoformat() + "Z"
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT INTO feed_cache (url, etag, last_modified, body_hash, last_checked_at, last_changed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    body_hash = excluded.body_hash,
+                    last_checked_at = excluded.last_checked_at,
+                    last_changed_at = excluded.last_changed_at
+            """, (url, etag, last_modified, body_hash, now, now))
+            conn.commit()
+
+    def touch(self, url: str):
+        """Met à jour la date de vérification d'un flux inchangé"""
+        now = datetime.utcnow().isoformat() + "Z"
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE feed_cache SET last_checked_at = ? WHERE url = ?",
+                (now, url)
+            )
+            conn.commit()
+
+    def clear(self, url: str = None):
+        """Vide le cache (d'un flux ou de tous)"""
+        with sqlite3.connect(self.db_path) as conn:
+            if url:
+                conn.execute("DELETE FROM feed_cache WHERE url = ?", (url,))
+            else:
+                conn.execute("DELETE FROM feed_cache")
+            conn.commit()
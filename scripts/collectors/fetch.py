@@ -0,0 +1,170 @@
+"""
+Couche de téléchargement HTTP - Post Veille IA
+
+Téléchargements bornés : délais de connexion et de lecture, budget total
+par requête et taille maximale lue en streaming. Évite qu'un flux bloqué
+ou énorme ne fige la collecte ou ne sature la mémoire du Raspberry Pi.
+"""
+
+import logging
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+
+from .http_session import get_session
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Taille des blocs lus en streaming
+CHUNK_SIZE = 64 * 1024
+
+
+class FetchTimeout(Exception):
+    """Budget total de la requête dépassé"""
+
+
+@dataclass
+class FetchLimits:
+    """Limites appliquées à un téléchargement"""
+
+    connect_timeout: float = 5.0     # Secondes pour établir la connexion
+    read_timeout: float = 15.0       # Secondes max sans recevoir de données
+    total_timeout: float = 30.0      # Budget total (connexion + lecture)
+    max_bytes: int = 5_000_000       # Octets max lus (après décompression)
+
+    @classmethod
+    def from_settings(cls, settings: dict, prefix: str = "") -> 'FetchLimits':
+        """Construit les limites depuis la section settings de sources.yaml"""
+        defaults = cls()
+        return cls(
+            connect_timeout=settings.get(f'{prefix}connect_timeout', defaults.connect_timeout),
+            read_timeout=settings.get(f'{prefix}read_timeout', defaults.read_timeout),
+            total_timeout=settings.get(f'{prefix}total_timeout', defaults.total_timeout),
+            max_bytes=settings.get(f'{prefix}max_bytes', defaults.max_bytes),
+        )
+
+
+@dataclass
+class FetchResult:
+    """Résultat d'un téléchargement borné"""
+
+    status_code: int
+    headers: dict
+    body: bytes
+    truncated: bool = False          # True si max_bytes a été atteint
+    elapsed: float = 0.0             # Durée totale en secondes
+
+
+def _response_socket(response: requests.Response) -> Optional[socket.socket]:
+    """Socket sous-jacente d'une réponse en streaming, si accessible"""
+    sock = getattr(getattr(response.raw, 'connection', None), 'sock', None)
+    if sock is None:
+        # Connexion non réutilisable (Connection: close): http.client l'a
+        # détachée, seule la réponse garde la socket via son fichier
+        fp = getattr(getattr(response.raw, '_fp', None), 'fp', None)
+        sock = getattr(getattr(fp, 'raw', None), '_sock', None)
+    return sock
+
+
+def _abort_response(response: requests.Response, expired: threading.Event):
+    """Coupe la connexion d'une réponse en cours de lecture (budget épuisé)"""
+    expired.set()
+    sock = _response_socket(response)
+    try:
+        if sock is not None:
+            # shutdown() débloque un recv() en attente, contrairement à close()
+            sock.shutdown(socket.SHUT_RDWR)
+        else:
+            response.close()
+    except OSError:
+        pass
+
+
+def fetch_url(
+    url: str,
+    headers: Optional[dict] = None,
+    limits: FetchLimits = None,
+    session: requests.Session = None
+) -> FetchResult:
+    """
+    Télécharge une URL en respectant les limites.
+
+    Le corps est lu par blocs : au-delà de max_bytes la lecture s'arrête et
+    le résultat est marqué tronqué. Le budget total est garanti au niveau de
+    la socket : un minuteur la coupe à l'échéance, même si le serveur envoie
+    quelques octets juste avant chaque read_timeout.
+
+    Raises:
+        FetchTimeout: budget total dépassé
+        requests.exceptions.RequestException: erreur réseau, statut HTTP
+            d'erreur ou délai de connexion / lecture dépassé
+    """
+    limits = limits or FetchLimits()
+    http = session or get_session()
+    start = time.monotonic()
+    deadline = start + limits.total_timeout
+
+    response = http.get(
+        url,
+        headers=headers,
+        timeout=(
+            min(limits.connect_timeout, limits.total_timeout),
+            min(limits.read_timeout, limits.total_timeout)
+        ),
+        stream=True
+    )
+
+    expired = threading.Event()
+    watchdog = threading.Timer(
+        max(0.0, deadline - time.monotonic()),
+        _abort_response, args=(response, expired)
+    )
+    watchdog.daemon = True
+
+    chunks = []
+    size = 0
+    truncated = False
+
+    try:
+        response.raise_for_status()
+        watchdog.start()
+
+        try:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if size + len(chunk) > limits.max_bytes:
+                    chunks.append(chunk[:limits.max_bytes - size])
+                    size = limits.max_bytes
+                    truncated = True
+                    break
+
+                chunks.append(chunk)
+                size += len(chunk)
+        except Exception:
+            # Socket coupée par le minuteur: l'erreur de lecture est un dépassement
+            if not expired.is_set():
+                raise
+
+        if expired.is_set():
+            raise FetchTimeout(
+                f"budget de {limits.total_timeout}s dépassé après {size} octets"
+            )
+
+        if truncated:
+            logger.warning(f"Contenu tronqué à {limits.max_bytes} octets: {url}")
+
+        return FetchResult(
+            status_code=response.status_code,
+            headers=response.headers,
+            body=b"".join(chunks),
+            truncated=truncated,
+            elapsed=time.monotonic() - start
+        )
+    finally:
+        watchdog.cancel()
+        response.close()
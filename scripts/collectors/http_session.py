@@ -0,0 +1,137 @@
+"""
+Session HTTP partagée - Post Veille IA
+
+Une seule requests.Session pour tous les collecteurs et les notifications :
+pool de connexions keep-alive par hôte (évite un handshake TCP + TLS par
+requête), taille de pool réglable par hôte et décompression gzip/brotli
+transparente. Les compteurs urllib3 permettent de vérifier la réutilisation
+des connexions.
+
+Configuration (sources.yaml):
+    settings:
+      http:
+        pool_connections: 100
+        pool_maxsize: 4
+        pool_maxsize_per_host:
+          r.jina.ai: 8
+"""
+
+import logging
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .settings import load_settings
+
+# Brotli décodé par urllib3 si l'un des deux paquets est installé
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Valeurs par défaut
+DEFAULT_POOL_CONNECTIONS = 100   # Nombre d'hôtes gardés en cache
+DEFAULT_POOL_MAXSIZE = 4         # Connexions keep-alive par hôte
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_maxsize_per_host: Dict[str, int] = None
+) -> requests.Session:
+    """
+    Crée une session avec pools de connexions keep-alive.
+
+    Args:
+        pool_connections: Nombre de pools d'hôtes conservés
+        pool_maxsize: Connexions conservées par hôte
+        pool_maxsize_per_host: Surcharge de pool_maxsize pour certains hôtes
+    """
+    session = requests.Session()
+
+    default_adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", default_adapter)
+    session.mount("http://", default_adapter)
+
+    # Adaptateurs dédiés (requests choisit le préfixe le plus long)
+    for host, maxsize in (pool_maxsize_per_host or {}).items():
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxsize)
+        session.mount(f"https://{host}", adapter)
+        session.mount(f"http://{host}", adapter)
+
+    encodings = ["gzip", "deflate"]
+    if BROTLI_AVAILABLE:
+        encodings.append("br")
+    session.headers["Accept-Encoding"] = ", ".join(encodings)
+
+    return session
+
+
+def get_session() -> requests.Session:
+    """Retourne la session partagée (créée au premier appel depuis settings.http)"""
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                http_settings = load_settings().get('http', {}) or {}
+                _session = create_session(
+                    pool_connections=http_settings.get('pool_connections', DEFAULT_POOL_CONNECTIONS),
+                    pool_maxsize=http_settings.get('pool_maxsize', DEFAULT_POOL_MAXSIZE),
+                    pool_maxsize_per_host=http_settings.get('pool_maxsize_per_host')
+                )
+
+    return _session
+
+
+def get_connection_stats() -> dict:
+    """
+    Statistiques de réutilisation des connexions de la session partagée.
+
+    Returns:
+        {'requests': n, 'connections': m, 'reused': n - m, 'reuse_ratio': x,
+         'by_host': {host: {...}}}
+    """
+    by_host = {}
+
+    if _session is not None:
+        seen_adapters = set()
+        for adapter in _session.adapters.values():
+            if id(adapter) in seen_adapters:
+                continue
+            seen_adapters.add(id(adapter))
+
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                host_stats = by_host.setdefault(pool.host, {'requests': 0, 'connections': 0})
+                host_stats['requests'] += pool.num_requests
+                host_stats['connections'] += pool.num_connections
+
+    total_requests = sum(h['requests'] for h in by_host.values())
+    total_connections = sum(h['connections'] for h in by_host.values())
+    reused = max(total_requests - total_connections, 0)
+
+    return {
+        'requests': total_requests,
+        'connections': total_connections,
+        'reused': reused,
+        'reuse_ratio': round(reused / total_requests, 3) if total_requests else 0.0,
+        'by_host': by_host,
+    }
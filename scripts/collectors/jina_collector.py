@@ -10,13 +10,15 @@ import requests
 import logging
 import os
 import re
-import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 import yaml
 from pathlib import Path
 
 from .schema import Article
+from .async_fetch import RateLimitedFetcher, iter_in_order
+from .http_session import get_session
 
 # Configuration logging
 logging.basicConfig(level=logging.INFO)
@@ -24,7 +26,8 @@ logger = logging.getLogger(__name__)
 
 # Configuration Jina
 JINA_READER_URL = "https://r.jina.ai"
-RATE_LIMIT_DELAY = 3  # Secondes entre chaque requête (conservateur)
+RATE_LIMIT_RPM = 20           # Free tier (requêtes / minute)
+RATE_LIMIT_RPM_WITH_KEY = 200 # Avec JINA_API_KEY
 
 
 def load_jina_sources(config_path: str = None) -> List[dict]:
@@ -38,6 +41,20 @@ def load_jina_sources(config_path: str = None) -> List[dict]:
     return [s for s in config.get('jina', {}).get('sites', []) if s.get('enabled', True)]
 
 
+def load_jina_rate_limit(config_path: str = None, api_key: Optional[str] = None) -> float:
+    """Charge le débit max vers Jina (requêtes / minute) selon la présence d'une clé"""
+    if config_path is None:
+        config_path = Path(__file__).parent.parent.parent / "config" / "sources.yaml"
+
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+
+    jina_config = config.get('jina', {})
+    if api_key:
+        return jina_config.get('rate_limit_rpm_with_key', RATE_LIMIT_RPM_WITH_KEY)
+    return jina_config.get('rate_limit_rpm', RATE_LIMIT_RPM)
+
+
 def get_jina_api_key() -> Optional[str]:
     """Récupère la clé API Jina depuis l'environnement"""
     return os.getenv('JINA_API_KEY')
@@ -100,13 +117,8 @@ def extract_articles_from_markdown(markdown: str, source: dict) -> List[dict]:
     return articles[:15]  # Max 15 articles par source
 
 
-def fetch_with_jina(url: str, api_key: Optional[str] = None) -> Optional[str]:
-    """
-    Récupère le contenu d'une URL via Jina Reader API.
-
-    Returns:
-        Contenu en Markdown ou None si erreur
-    """
+def build_jina_request(url: str, api_key: Optional[str] = None) -> Tuple[str, dict]:
+    """Construit (url Jina, headers) pour lire une URL via Jina Reader"""
     headers = {
         "Accept": "text/markdown",
     }
@@ -114,11 +126,21 @@ def fetch_with_jina(url: str, api_key: Optional[str] = None) -> Optional[str]:
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
 
-    jina_url = f"{JINA_READER_URL}/{url}"
+    return f"{JINA_READER_URL}/{url}", headers
+
+
+def fetch_with_jina(url: str, api_key: Optional[str] = None) -> Optional[str]:
+    """
+    Récupère le contenu d'une URL via Jina Reader API.
+
+    Returns:
+        Contenu en Markdown ou None si erreur
+    """
+    jina_url, headers = build_jina_request(url, api_key)
 
     try:
         logger.debug(f"Fetching via Jina: {url}")
-        response = requests.get(jina_url, headers=headers, timeout=30)
+        response = get_session().get(jina_url, headers=headers, timeout=30)
         response.raise_for_status()
         return response.text
     except requests.exceptions.RequestException as e:
@@ -126,6 +148,28 @@ def fetch_with_jina(url: str, api_key: Optional[str] = None) -> Optional[str]:
         return None
 
 
+def markdown_to_articles(markdown: str, source: dict) -> List[Article]:
+    """Convertit le markdown Jina d'une source en Articles"""
+    articles = []
+
+    for raw in extract_articles_from_markdown(markdown, source):
+        article = Article(
+            id="",
+            url=raw.get('url', source['url']),
+            title=raw.get('title', 'Sans titre'),
+            content=raw.get('content', ''),
+            summary=raw.get('content', '')[:300] if raw.get('content') else None,
+            source_name=source['name'],
+            source_type="jina",
+            source_category=source.get('category', 'newsletter'),
+            published_at=datetime.utcnow().isoformat() + "Z",  # Pas de date exacte dispo
+        )
+        article.id = article.generate_id()
+        articles.append(article)
+
+    return articles
+
+
 def collect_single_jina_source(source: dict, api_key: Optional[str] = None) -> List[Article]:
     """Collecte une seule source via Jina"""
     articles = []
@@ -139,22 +183,7 @@ def collect_single_jina_source(source: dict, api_key: Optional[str] = None) -> L
             return []
 
         # Extraire les articles du markdown
-        raw_articles = extract_articles_from_markdown(markdown, source)
-
-        for raw in raw_articles:
-            article = Article(
-                id="",
-                url=raw.get('url', source['url']),
-                title=raw.get('title', 'Sans titre'),
-                content=raw.get('content', ''),
-                summary=raw.get('content', '')[:300] if raw.get('content') else None,
-                source_name=source['name'],
-                source_type="jina",
-                source_category=source.get('category', 'newsletter'),
-                published_at=datetime.utcnow().isoformat() + "Z",  # Pas de date exacte dispo
-            )
-            article.id = article.generate_id()
-            articles.append(article)
+        articles = markdown_to_articles(markdown, source)
 
         logger.info(f"  → {len(articles)} articles extraits depuis {source['name']}")
 
@@ -164,39 +193,85 @@ def collect_single_jina_source(source: dict, api_key: Optional[str] = None) -> L
     return articles
 
 
-def collect_jina(
+async def collect_single_jina_source_async(
+    fetcher: RateLimitedFetcher,
+    source: dict,
+    api_key: Optional[str] = None
+) -> List[Article]:
+    """Collecte une source Jina via le moteur asynchrone (erreurs isolées par source)"""
+    articles = []
+
+    try:
+        logger.info(f"Collecte Jina: {source['name']}")
+
+        jina_url, headers = build_jina_request(source['url'], api_key)
+        response = await fetcher.get(jina_url, headers=headers, timeout=30)
+        response.raise_for_status()
+
+        if not response.text:
+            return []
+
+        articles = markdown_to_articles(response.text, source)
+
+        logger.info(f"  → {len(articles)} articles extraits depuis {source['name']}")
+
+    except Exception as e:
+        logger.error(f"Erreur collecte Jina {source['name']}: {e}")
+
+    return articles
+
+
+def iter_jina(
     config_path: str = None,
     max_articles_per_source: int = 15
-) -> List[Article]:
+) -> Iterator[Article]:
     """
-    Collecte tous les sites configurés via Jina Reader API.
+    Générateur : produit les articles de chaque site dans l'ordre de
+    sources.yaml, dès que ce site et ceux qui le précèdent sont récupérés.
+
+    Les requêtes partent en parallèle, cadencées par un token bucket
+    sur r.jina.ai (jina.rate_limit_rpm / rate_limit_rpm_with_key).
 
     Args:
         config_path: Chemin vers sources.yaml
         max_articles_per_source: Nombre max d'articles par source
-
-    Returns:
-        Liste d'Articles normalisés
     """
     sources = load_jina_sources(config_path)
     api_key = get_jina_api_key()
-    all_articles = []
+    rate_limit = load_jina_rate_limit(config_path, api_key)
+    total = 0
 
     if not api_key:
-        logger.warning("JINA_API_KEY non définie - utilisation du free tier (20 RPM)")
+        logger.warning(f"JINA_API_KEY non définie - utilisation du free tier ({rate_limit} RPM)")
+
+    logger.info(f"Démarrage collecte Jina - {len(sources)} sources ({rate_limit} req/min)")
+
+    def make_coros():
+        fetcher = RateLimitedFetcher({urlparse(JINA_READER_URL).netloc: rate_limit})
+        return [collect_single_jina_source_async(fetcher, source, api_key) for source in sources]
+
+    for articles in iter_in_order(make_coros):
+        total += len(articles[:max_articles_per_source])
+        yield from articles[:max_articles_per_source]
 
-    logger.info(f"Démarrage collecte Jina - {len(sources)} sources")
+    logger.info(f"Collecte Jina terminée - {total} articles total")
 
-    for i, source in enumerate(sources):
-        articles = collect_single_jina_source(source, api_key)
-        all_articles.extend(articles[:max_articles_per_source])
 
-        # Rate limiting entre les sources
-        if i < len(sources) - 1:
-            time.sleep(RATE_LIMIT_DELAY)
+def collect_jina(
+    config_path: str = None,
+    max_articles_per_source: int = 15
+) -> List[Article]:
+    """
+    Collecte tous les sites configurés via Jina Reader API.
+
+    Args:
+        config_path: Chemin vers sources.yaml
+        max_articles_per_source: Nombre max d'articles par source
 
-    logger.info(f"Collecte Jina terminée - {len(all_articles)} articles total")
-    return all_articles
+    Returns:
+        Liste d'Articles normalisés
+    """
+    return list(iter_jina(config_path, max_articles_per_source))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,368 @@
+"""
+Détection des quasi-doublons - Post Veille IA
+
+Regroupe en "histoires" les articles qui annoncent la même chose depuis des
+sources différentes (blog officiel, presse, newsletter, Reddit...), alors que
+leurs URLs (et donc leurs IDs) diffèrent.
+
+Signatures MinHash sur les k-grammes de caractères du titre + résumé, indexées
+par LSH (bandes) dans la base de déduplication. Chaque article reçoit le
+cluster_id de son histoire (Article.cluster_id, story_signatures.cluster_id).
+
+Une histoire a un représentant, choisi par rang de source (champ priority de
+sources.yaml: high, medium, low, puis les sources sans priorité) et non par
+ordre d'arrivée : un article d'une source mieux classée qu'un représentant
+déjà enregistré le remplace (story_clusters). Le représentant précédent reste
+dans le JSONL du jour, écrit en ajout seulement.
+"""
+
+import hashlib
+import logging
+import random
+import re
+import sqlite3
+import threading
+from array import array
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import yaml
+
+from .schema import Article
+from .dedup import DEFAULT_DB_PATH
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Valeurs par défaut (surchargées par settings.near_dedup)
+DEFAULT_THRESHOLD = 0.6         # Similarité de Jaccard estimée min
+DEFAULT_LOOKBACK_DAYS = 3       # Fenêtre de comparaison
+DEFAULT_NUM_PERM = 64           # Taille des signatures MinHash
+DEFAULT_SHINGLE_SIZE = 5        # k-grammes de caractères
+
+# Rang des sources (1 = la plus fiable) selon leur priorité dans sources.yaml
+PRIORITY_TIERS = {'high': 1, 'medium': 2, 'low': 3}
+DEFAULT_TIER = len(PRIORITY_TIERS) + 1   # Sources sans priorité (Reddit, YouTube...)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalize_text(text: str) -> str:
+    """Minuscules, ponctuation retirée, espaces normalisés"""
+    text = re.sub(r"[^\w\s]", " ", (text or "").lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def shingles(text: str, k: int = DEFAULT_SHINGLE_SIZE) -> Set[str]:
+    """k-grammes de caractères d'un texte normalisé"""
+    text = normalize_text(text)
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choisit (bandes, lignes par bande) pour que le seuil de la courbe LSH
+    (1/b)^(1/r) soit le plus proche possible du seuil de similarité.
+    """
+    best = (num_perm, 1)
+    best_gap = float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        gap = abs((1 / bands) ** (1 / rows) - threshold)
+        if gap < best_gap:
+            best, best_gap = (bands, rows), gap
+    return best
+
+
+def load_source_tiers(config_path: str = None) -> Dict[str, int]:
+    """Rang de chaque source de sources.yaml ayant une priorité (RSS, Jina)"""
+    if config_path is None:
+        config_path = Path(__file__).parent.parent.parent / "config" / "sources.yaml"
+
+    try:
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        return {}
+
+    sources = list(config.get('rss', []) or [])
+    sources += (config.get('jina', {}) or {}).get('sites', []) or []
+    return {
+        source['name']: PRIORITY_TIERS[source['priority']]
+        for source in sources
+        if source.get('name') and source.get('priority') in PRIORITY_TIERS
+    }
+
+
+class MinHasher:
+    """Calcule des signatures MinHash (permutations a*x+b mod p)"""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.params = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, items: Set[str]) -> List[int]:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(item.encode(), digest_size=4).digest(), "little")
+            for item in items
+        ]
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self.params
+        ]
+
+
+def estimate_similarity(sig_a: List[int], sig_b: List[int]) -> float:
+    """Estimation de la similarité de Jaccard entre deux signatures"""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+class NearDuplicateIndex:
+    """Index LSH des signatures d'histoires, stocké dans la base de déduplication"""
+
+    def __init__(
+        self,
+        db_path: str = None,
+        threshold: float = DEFAULT_THRESHOLD,
+        lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        source_tiers: Dict[str, int] = None
+    ):
+        """
+        Args:
+            source_tiers: source_name -> rang (load_source_tiers), DEFAULT_TIER sinon
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self.lookback_days = lookback_days
+        self.shingle_size = shingle_size
+        self.source_tiers = source_tiers or {}
+        self.hasher = MinHasher(num_perm)
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _init_db(self):
+        """Initialise les tables des signatures et des buckets LSH"""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS story_signatures (
+                    article_id TEXT PRIMARY KEY,
+                    cluster_id TEXT NOT NULL,
+                    similarity REAL,
+                    title TEXT,
+                    source_name TEXT,
+                    signature BLOB NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_story_cluster
+                ON story_signatures(cluster_id)
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS story_lsh (
+                    bucket INTEGER NOT NULL,
+                    article_id TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_story_lsh_bucket
+                ON story_lsh(bucket)
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS story_clusters (
+                    cluster_id TEXT PRIMARY KEY,
+                    representative_id TEXT NOT NULL,
+                    tier INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+
+    def tier(self, article: Article) -> int:
+        """Rang de la source d'un article (1 = la plus fiable)"""
+        return self.source_tiers.get(article.source_name, DEFAULT_TIER)
+
+    def _buckets(self, signature: List[int]) -> List[int]:
+        """Un bucket par bande (le numéro de bande est inclus dans le hash)"""
+        buckets = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(
+                array("Q", [band] + chunk).tobytes(), digest_size=8
+            ).digest()
+            buckets.append(int.from_bytes(digest, "little", signed=True))
+        return buckets
+
+    def _find_cluster(self, signature: List[int], buckets: List[int], cutoff: str) -> Optional[Tuple[str, float]]:
+        placeholders = ",".join("?" * len(buckets))
+        cursor = self._conn.execute(f"""
+            SELECT DISTINCT s.cluster_id, s.signature
+            FROM story_lsh l
+            JOIN story_signatures s ON s.article_id = l.article_id
+            WHERE l.bucket IN ({placeholders}) AND l.created_at >= ?
+        """, (*buckets, cutoff))
+
+        best = None
+        for cluster_id, blob in cursor.fetchall():
+            similarity = estimate_similarity(signature, array("Q", blob))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (cluster_id, similarity)
+        return best
+
+    def assign_clusters(self, articles: List[Article]) -> Tuple[List[Article], List[Article]]:
+        """
+        Rattache chaque article à une histoire existante ou en crée une, et
+        renseigne article.cluster_id.
+
+        Les articles du lot sont traités par rang de source : le mieux classé
+        d'une nouvelle histoire en devient le représentant. Un article rattaché
+        à une histoire existante la représente si sa source est mieux classée
+        que celle du représentant enregistré.
+
+        Returns:
+            (représentants d'une histoire, quasi-doublons), dans l'ordre du lot
+        """
+        now = datetime.utcnow()
+        now_str = now.isoformat() + "Z"
+        cutoff = (now - timedelta(days=self.lookback_days)).isoformat() + "Z"
+
+        representative_ids = set()
+        promoted = 0
+
+        with self._lock, self._conn:
+            # Tri stable: à rang égal, l'ordre d'arrivée départage
+            for article in sorted(articles, key=self.tier):
+                items = shingles(f"{article.title} {article.summary or ''}", self.shingle_size)
+                if not items:
+                    representative_ids.add(article.id)
+                    continue
+
+                tier = self.tier(article)
+                signature = self.hasher.signature(items)
+                buckets = self._buckets(signature)
+                match = self._find_cluster(signature, buckets, cutoff)
+
+                if match:
+                    cluster_id, similarity = match
+                    row = self._conn.execute(
+                        "SELECT tier FROM story_clusters WHERE cluster_id = ?", (cluster_id,)
+                    ).fetchone()
+                    if row is not None and tier < row[0]:
+                        self._conn.execute("""
+                            UPDATE story_clusters SET representative_id = ?, tier = ?, updated_at = ?
+                            WHERE cluster_id = ?
+                        """, (article.id, tier, now_str, cluster_id))
+                        representative_ids.add(article.id)
+                        promoted += 1
+                    else:
+                        logger.debug(f"Quasi-doublon ({similarity:.2f}): {article.title[:50]}")
+                else:
+                    cluster_id, similarity = article.id, None
+                    self._conn.execute("""
+                        INSERT OR REPLACE INTO story_clusters (cluster_id, representative_id, tier, updated_at)
+                        VALUES (?, ?, ?, ?)
+                    """, (cluster_id, article.id, tier, now_str))
+                    representative_ids.add(article.id)
+
+                article.cluster_id = cluster_id
+                self._conn.execute("""
+                    INSERT OR IGNORE INTO story_signatures
+                        (article_id, cluster_id, similarity, title, source_name, signature, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    article.id, cluster_id, similarity, article.title[:200],
+                    article.source_name, array("Q", signature).tobytes(), now_str
+                ))
+                self._conn.executemany(
+                    "INSERT INTO story_lsh (bucket, article_id, created_at) VALUES (?, ?, ?)",
+                    [(bucket, article.id, now_str) for bucket in buckets]
+                )
+
+        representatives = [a for a in articles if a.id in representative_ids]
+        duplicates = [a for a in articles if a.id not in representative_ids]
+
+        if duplicates:
+            logger.info(f"Quasi-doublons: {len(duplicates)} rattachés à une histoire existante")
+        if promoted:
+            logger.info(f"Quasi-doublons: {promoted} nouveaux représentants (source mieux classée)")
+
+        return representatives, duplicates
+
+    def get_cluster(self, cluster_id: str) -> List[dict]:
+        """Liste les articles d'une histoire"""
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT s.article_id, s.title, s.source_name, s.similarity, s.created_at,
+                       s.article_id = c.representative_id
+                FROM story_signatures s
+                LEFT JOIN story_clusters c ON c.cluster_id = s.cluster_id
+                WHERE s.cluster_id = ?
+                ORDER BY s.created_at
+            """, (cluster_id,))
+            return [
+                {
+                    'article_id': row[0],
+                    'title': row[1],
+                    'source_name': row[2],
+                    'similarity': row[3],
+                    'created_at': row[4],
+                    'representative': bool(row[5]),
+                }
+                for row in cursor.fetchall()
+            ]
+
+    def cleanup_old(self, retention_days: int = None):
+        """
+        Supprime les buckets LSH sortis de la fenêtre de comparaison, les
+        signatures (appartenance aux histoires) plus vieilles que retention_days
+        et les histoires dont plus aucune signature ne reste.
+        """
+        now = datetime.utcnow()
+        lsh_cutoff = (now - timedelta(days=self.lookback_days)).isoformat() + "Z"
+        retention_days = max(retention_days or self.lookback_days, self.lookback_days)
+        cutoff = (now - timedelta(days=retention_days)).isoformat() + "Z"
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM story_lsh WHERE created_at < ?", (lsh_cutoff,))
+            cursor = self._conn.execute(
+                "DELETE FROM story_signatures WHERE created_at < ?", (cutoff,)
+            )
+            # Une histoire ancienne dont un membre récent reste garde son
+            # représentant (sinon cluster_id orphelin)
+            self._conn.execute("""
+                DELETE FROM story_clusters
+                WHERE updated_at < ?
+                  AND cluster_id NOT IN (SELECT cluster_id FROM story_signatures)
+            """, (cutoff,))
+            return cursor.rowcount
@@ -0,0 +1,167 @@
+"""
+Pipeline de collecte en flux - Post Veille IA
+
+Chaque collecteur (générateur) tourne dans son propre thread et dépose ses
+articles dans une file bornée. Le thread appelant les consomme par petits
+lots (déduplication + ajout au JSONL du jour) au fil de l'eau : la mémoire
+reste bornée par la taille de la file et un crash en fin de collecte ne fait
+perdre que le lot en cours.
+
+Usage:
+    results = run_pipeline(
+        {'rss': lambda: iter_rss(config_path)},
+        process_batch=lambda batch: save_articles(batch, output_dir),
+    )
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .schema import Article
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Valeurs par défaut (surchargées par settings.pipeline_*)
+DEFAULT_BUFFER_SIZE = 500       # Articles en attente dans la file
+DEFAULT_BATCH_SIZE = 50         # Articles traités par lot
+DEFAULT_FLUSH_SECONDS = 5.0     # Délai max avant de traiter un lot incomplet
+
+# Marqueur de fin d'une étape
+_DONE = object()
+
+
+@dataclass
+class StageResult:
+    """Bilan d'une étape de collecte"""
+
+    count: int = 0                   # Articles produits
+    seconds: float = 0.0             # Durée de l'étape
+    error: Optional[str] = None      # Message si l'étape a échoué
+    done: bool = False               # False si abandonnée à l'échéance
+
+
+def run_pipeline(
+    stages: Dict[str, Callable[[], Iterable[Article]]],
+    process_batch: Callable[[List[Article]], None],
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+    deadline_seconds: float = None
+) -> Dict[str, StageResult]:
+    """
+    Exécute les étapes en parallèle et traite leurs articles par lots.
+
+    Args:
+        stages: Nom de l'étape -> fabrique d'itérateur d'Articles
+        process_batch: Appelé dans le thread courant pour chaque lot
+        buffer_size: Taille max de la file (articles collectés non traités)
+        batch_size: Taille des lots passés à process_batch
+        flush_seconds: Un lot incomplet est traité après ce délai
+        deadline_seconds: Durée max ; les étapes non terminées sont abandonnées
+                          (threads daemon) mais leurs articles déjà produits
+                          sont traités
+
+    Returns:
+        Bilan par étape
+    """
+    articles_queue = queue.Queue(maxsize=max(1, buffer_size))
+    stop = threading.Event()
+    results = {name: StageResult() for name in stages}
+    start = time.monotonic()
+    deadline_at = start + deadline_seconds if deadline_seconds else None
+
+    def put(item) -> bool:
+        # put() bloquant mais interruptible par l'arrêt du pipeline
+        while not stop.is_set():
+            try:
+                articles_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(name: str, make_iter: Callable[[], Iterable[Article]]):
+        result = results[name]
+        stage_start = time.monotonic()
+        logger.info(f"Démarrage étape {name.upper()}")
+        try:
+            for article in make_iter():
+                if not put((name, article)):
+                    return
+                result.count += 1
+        except Exception as e:
+            result.error = str(e)
+            logger.error(f"Erreur collecte {name.upper()}: {e}")
+        finally:
+            result.seconds = time.monotonic() - stage_start
+            put((name, _DONE))
+
+    for name, make_iter in stages.items():
+        threading.Thread(
+            target=produce,
+            args=(name, make_iter),
+            name=f"collect-{name}",
+            daemon=True
+        ).start()
+
+    active = set(stages)
+    batch = []
+    last_flush = time.monotonic()
+
+    def flush():
+        nonlocal batch, last_flush
+        if batch:
+            process_batch(batch)
+        batch = []
+        last_flush = time.monotonic()
+
+    def consume(item) -> None:
+        name, article = item
+        if article is _DONE:
+            active.discard(name)
+            results[name].done = True
+            return
+        batch.append(article)
+
+    try:
+        while active:
+            now = time.monotonic()
+            if deadline_at is not None and now >= deadline_at:
+                break
+
+            timeout = flush_seconds
+            if deadline_at is not None:
+                timeout = min(timeout, deadline_at - now)
+
+            try:
+                consume(articles_queue.get(timeout=max(timeout, 0.01)))
+            except queue.Empty:
+                flush()
+                continue
+
+            if len(batch) >= batch_size or time.monotonic() - last_flush >= flush_seconds:
+                flush()
+    finally:
+        stop.set()
+
+    # Traiter ce qui reste dans la file (étapes abandonnées à l'échéance)
+    while True:
+        try:
+            consume(articles_queue.get_nowait())
+        except queue.Empty:
+            break
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+
+    for name in active:
+        results[name].seconds = time.monotonic() - start
+        logger.error(f"Échéance de {deadline_seconds}s atteinte - étape {name.upper()} abandonnée")
+
+    return results
@@ -7,13 +7,15 @@ Collecte les posts populaires des subreddits IA via l'endpoint JSON gratuit.
 
 import requests
 import logging
-import time
-from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 import yaml
 from pathlib import Path
 
 from .schema import Article
+from .dates import iso_utc
+from .async_fetch import RateLimitedFetcher, iter_in_order
+from .http_session import get_session
 
 # Configuration logging
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ logger = logging.getLogger(__name__)
 # Configuration Reddit
 REDDIT_BASE_URL = "https://www.reddit.com"
 USER_AGENT = "VeilleIA/2.0 (by /u/veille_ia_bot)"
-RATE_LIMIT_DELAY = 2  # Secondes entre chaque requête
+RATE_LIMIT_RPM = 30  # Requêtes / minute (ajusté par les en-têtes X-Ratelimit-*)
 
 
 def load_reddit_sources(config_path: str = None) -> List[dict]:
@@ -37,6 +39,34 @@ def load_reddit_sources(config_path: str = None) -> List[dict]:
     return [s for s in reddit_config.get('subreddits', []) if s.get('enabled', True)]
 
 
+def load_reddit_rate_limit(config_path: str = None) -> float:
+    """Charge le débit max vers Reddit (requêtes / minute)"""
+    if config_path is None:
+        config_path = Path(__file__).parent.parent.parent / "config" / "sources.yaml"
+
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+
+    return config.get('reddit', {}).get('rate_limit_rpm', RATE_LIMIT_RPM)
+
+
+def build_subreddit_request(
+    subreddit: str,
+    filter_type: str = "hot",
+    period: str = None,
+    limit: int = 25
+) -> Tuple[str, dict, dict]:
+    """Construit (url, params, headers) pour l'endpoint JSON d'un subreddit"""
+    url = f"{REDDIT_BASE_URL}/r/{subreddit}/{filter_type}.json"
+
+    params = {"limit": limit}
+    if period and filter_type == "top":
+        params["t"] = period
+
+    headers = {"User-Agent": USER_AGENT}
+    return url, params, headers
+
+
 def fetch_subreddit(
     subreddit: str,
     filter_type: str = "hot",
@@ -55,16 +85,10 @@ def fetch_subreddit(
     Returns:
         Données JSON ou None si erreur
     """
-    url = f"{REDDIT_BASE_URL}/r/{subreddit}/{filter_type}.json"
-
-    params = {"limit": limit}
-    if period and filter_type == "top":
-        params["t"] = period
-
-    headers = {"User-Agent": USER_AGENT}
+    url, params, headers = build_subreddit_request(subreddit, filter_type, period, limit)
 
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=15)
+        response = get_session().get(url, params=params, headers=headers, timeout=15)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -87,13 +111,59 @@ def extract_post_content(post_data: dict) -> str:
     return ""
 
 
+def parse_subreddit_posts(data: dict, source: dict) -> List[Article]:
+    """Convertit la réponse JSON d'un subreddit en Articles"""
+    articles = []
+    subreddit = source['name']
+    min_upvotes = source.get('min_upvotes', 0)
+
+    posts = data['data'].get('children', [])
+
+    for post in posts:
+        post_data = post.get('data', {})
+
+        # Filtrer par upvotes
+        score = post_data.get('ups', 0)
+        if score < min_upvotes:
+            continue
+
+        # Ignorer les posts épinglés (souvent des règles)
+        if post_data.get('stickied'):
+            continue
+
+        # created_utc: timestamp epoch UTC
+        created_utc = post_data.get('created_utc')
+
+        # Créer l'article
+        article = Article(
+            id="",
+            url=f"https://reddit.com{post_data.get('permalink', '')}",
+            title=post_data.get('title', 'Sans titre'),
+            content=extract_post_content(post),
+            summary=post_data.get('title', ''),
+            source_name=f"r/{subreddit}",
+            source_type="reddit",
+            source_category="community",
+            published_at=iso_utc(created_utc) if created_utc else None,
+            published_ts=int(created_utc) if created_utc else None,
+            author=post_data.get('author'),
+            score=score,
+            num_comments=post_data.get('num_comments', 0),
+            tags=[post_data.get('link_flair_text')] if post_data.get('link_flair_text') else []
+        )
+
+        article.id = article.generate_id()
+        articles.append(article)
+
+    return articles
+
+
 def collect_single_subreddit(source: dict) -> List[Article]:
     """Collecte les posts d'un seul subreddit"""
     articles = []
     subreddit = source['name']
     filter_type = source.get('filter', 'hot')
     period = source.get('period')
-    min_upvotes = source.get('min_upvotes', 0)
 
     try:
         logger.info(f"Collecte Reddit: r/{subreddit} ({filter_type})")
@@ -102,41 +172,35 @@ def collect_single_subreddit(source: dict) -> List[Article]:
         if not data or 'data' not in data:
             return []
 
-        posts = data['data'].get('children', [])
-
-        for post in posts:
-            post_data = post.get('data', {})
-
-            # Filtrer par upvotes
-            score = post_data.get('ups', 0)
-            if score < min_upvotes:
-                continue
-
-            # Ignorer les posts épinglés (souvent des règles)
-            if post_data.get('stickied'):
-                continue
-
-            # Créer l'article
-            article = Article(
-                id="",
-                url=f"https://reddit.com{post_data.get('permalink', '')}",
-                title=post_data.get('title', 'Sans titre'),
-                content=extract_post_content(post),
-                summary=post_data.get('title', ''),
-                source_name=f"r/{subreddit}",
-                source_type="reddit",
-                source_category="community",
-                published_at=datetime.fromtimestamp(
-                    post_data.get('created_utc', 0)
-                ).isoformat() + "Z" if post_data.get('created_utc') else None,
-                author=post_data.get('author'),
-                score=score,
-                num_comments=post_data.get('num_comments', 0),
-                tags=[post_data.get('link_flair_text')] if post_data.get('link_flair_text') else []
-            )
-
-            article.id = article.generate_id()
-            articles.append(article)
+        articles = parse_subreddit_posts(data, source)
+
+        logger.info(f"  → {len(articles)} posts collectés depuis r/{subreddit}")
+
+    except Exception as e:
+        logger.error(f"Erreur collecte r/{subreddit}: {e}")
+
+    return articles
+
+
+async def collect_single_subreddit_async(fetcher: RateLimitedFetcher, source: dict) -> List[Article]:
+    """Collecte un subreddit via le moteur asynchrone (erreurs isolées par source)"""
+    articles = []
+    subreddit = source['name']
+    filter_type = source.get('filter', 'hot')
+    period = source.get('period')
+
+    try:
+        logger.info(f"Collecte Reddit: r/{subreddit} ({filter_type})")
+
+        url, params, headers = build_subreddit_request(subreddit, filter_type, period, limit=50)
+        response = await fetcher.get(url, params=params, headers=headers, timeout=15)
+        response.raise_for_status()
+
+        data = response.json()
+        if not data or 'data' not in data:
+            return []
+
+        articles = parse_subreddit_posts(data, source)
 
         logger.info(f"  → {len(articles)} posts collectés depuis r/{subreddit}")
 
@@ -146,6 +210,38 @@ def collect_single_subreddit(source: dict) -> List[Article]:
     return articles
 
 
+def iter_reddit(
+    config_path: str = None,
+    max_articles_per_source: int = 15
+) -> Iterator[Article]:
+    """
+    Générateur : produit les posts de chaque subreddit dans l'ordre de
+    sources.yaml, dès que ce subreddit et ceux qui le précèdent sont récupérés.
+
+    Les requêtes partent en parallèle, cadencées par un token bucket
+    sur www.reddit.com (reddit.rate_limit_rpm dans sources.yaml).
+
+    Args:
+        config_path: Chemin vers sources.yaml
+        max_articles_per_source: Nombre max d'articles par subreddit
+    """
+    sources = load_reddit_sources(config_path)
+    rate_limit = load_reddit_rate_limit(config_path)
+    total = 0
+
+    logger.info(f"Démarrage collecte Reddit - {len(sources)} subreddits ({rate_limit} req/min)")
+
+    def make_coros():
+        fetcher = RateLimitedFetcher({urlparse(REDDIT_BASE_URL).netloc: rate_limit})
+        return [collect_single_subreddit_async(fetcher, source) for source in sources]
+
+    for articles in iter_in_order(make_coros):
+        total += len(articles[:max_articles_per_source])
+        yield from articles[:max_articles_per_source]
+
+    logger.info(f"Collecte Reddit terminée - {total} posts total")
+
+
 def collect_reddit(
     config_path: str = None,
     max_articles_per_source: int = 15
@@ -158,25 +254,12 @@ def collect_reddit(
         max_articles_per_source: Nombre max d'articles par subreddit
 
     Returns:
-        Liste d'Articles normalisés
+        Liste d'Articles normalisés, triés par score décroissant
     """
-    sources = load_reddit_sources(config_path)
-    all_articles = []
-
-    logger.info(f"Démarrage collecte Reddit - {len(sources)} subreddits")
-
-    for i, source in enumerate(sources):
-        articles = collect_single_subreddit(source)
-        all_articles.extend(articles[:max_articles_per_source])
-
-        # Rate limiting entre les subreddits
-        if i < len(sources) - 1:
-            time.sleep(RATE_LIMIT_DELAY)
+    all_articles = list(iter_reddit(config_path, max_articles_per_source))
 
     # Trier par score décroissant
     all_articles.sort(key=lambda a: a.score or 0, reverse=True)
-
-    logger.info(f"Collecte Reddit terminée - {len(all_articles)} posts total")
     return all_articles
 
 
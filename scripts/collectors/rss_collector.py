@@ -5,17 +5,27 @@ US-2.1 : Collecteur RSS
 Collecte les flux RSS des blogs officiels et sites tech.
 """
 
+import calendar
 import feedparser
+import hashlib
 import logging
+import requests
 import ssl
 import certifi
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
-from time import mktime
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 import yaml
 from pathlib import Path
 
 from .schema import Article
+from .dates import iso_utc
+from .feed_cache import FeedCache
+from .fetch import FetchLimits, FetchTimeout, fetch_url
+from .settings import load_settings
 
 # Fix SSL certificates pour macOS
 ssl._create_default_https_context = lambda: ssl.create_default_context(cafile=certifi.where())
@@ -24,6 +34,21 @@ ssl._create_default_https_context = lambda: ssl.create_default_context(cafile=ce
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parallélisme par défaut (surchargé par settings.rss_max_workers / rss_max_per_host)
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_PER_HOST = 2
+
+# Flux soumis d'avance par worker: borne les résultats en attente d'être consommés
+IN_FLIGHT_PER_WORKER = 2
+
+# Statuts de récupération d'un flux
+FETCH_FETCHED = "fetched"            # Nouveau contenu téléchargé et parsé
+FETCH_NOT_MODIFIED = "not_modified"  # 304 Not Modified
+FETCH_UNCHANGED = "unchanged"        # 200 mais contenu identique au précédent
+FETCH_TRUNCATED = "truncated"        # Contenu coupé à rss_max_bytes puis parsé
+FETCH_TIMEOUT = "timeout"            # Délai de connexion, lecture ou budget dépassé
+FETCH_ERROR = "error"
+
 
 def load_rss_sources(config_path: str = None) -> List[dict]:
     """Charge les sources RSS depuis le fichier de config"""
@@ -43,8 +68,8 @@ def parse_date(entry) -> Optional[str]:
     for field in date_fields:
         if hasattr(entry, field) and getattr(entry, field):
             try:
-                dt = datetime.fromtimestamp(mktime(getattr(entry, field)))
-                return dt.isoformat() + "Z"
+                # feedparser décode les dates en struct_time UTC
+                return iso_utc(calendar.timegm(getattr(entry, field)))
             except:
                 continue
 
@@ -80,18 +105,86 @@ def is_recent(entry, max_age_hours: int = 72) -> bool:
         return True
 
 
-def collect_single_feed(source: dict, max_articles: int = 15, max_age_hours: int = 72) -> List[Article]:
-    """Collecte un seul flux RSS"""
+def fetch_feed(
+    source: dict,
+    cache: FeedCache = None,
+    limits: FetchLimits = None
+) -> Tuple[str, Optional[bytes], dict]:
+    """
+    Télécharge un flux avec une requête conditionnelle si le cache le permet.
+
+    Le téléchargement est borné (délais, budget total, taille max) :
+    feedparser ne reçoit que les octets effectivement lus.
+
+    Returns:
+        (statut, contenu brut ou None, en-têtes de réponse)
+    """
+    url = source['url']
+    headers = {"User-Agent": feedparser.USER_AGENT}
+    if cache is not None:
+        headers.update(cache.conditional_headers(url))
+
+    result = fetch_url(url, headers=headers, limits=limits)
+
+    if result.status_code == 304:
+        if cache is not None:
+            cache.touch(url)
+        return FETCH_NOT_MODIFIED, None, result.headers
+
+    body = result.body
+
+    if cache is not None:
+        entry = cache.get(url)
+        if entry and entry['body_hash'] == hashlib.sha256(body).hexdigest():
+            cache.touch(url)
+            return FETCH_UNCHANGED, None, result.headers
+
+    return (FETCH_TRUNCATED if result.truncated else FETCH_FETCHED), body, result.headers
+
+
+def collect_single_feed(
+    source: dict,
+    max_articles: int = 15,
+    max_age_hours: int = 72,
+    cache: FeedCache = None,
+    fetch_stats: dict = None,
+    limits: FetchLimits = None
+) -> List[Article]:
+    """
+    Collecte un seul flux RSS.
+
+    Si un cache est fourni, le flux n'est pas parsé quand le serveur répond
+    304 ou renvoie exactement le même contenu qu'au passage précédent.
+    Le statut de récupération est enregistré dans fetch_stats[source['name']].
+    """
     articles = []
+    status = FETCH_ERROR
 
     try:
         logger.info(f"Collecte RSS: {source['name']}")
-        feed = feedparser.parse(source['url'])
+        status, body, headers = fetch_feed(source, cache, limits)
+
+        if body is None:
+            logger.info(f"  → {source['name']} inchangé ({status})")
+            return []
+
+        feed = feedparser.parse(body, response_headers={k.lower(): v for k, v in headers.items()})
 
         if feed.bozo and not feed.entries:
+            status = FETCH_ERROR
             logger.warning(f"Erreur parsing {source['name']}: {feed.bozo_exception}")
             return []
 
+        # Mémoriser les validateurs seulement une fois le flux parsé, et jamais
+        # pour un corps tronqué: le prochain passage doit le télécharger en entier
+        if cache is not None and status != FETCH_TRUNCATED:
+            cache.update(
+                source['url'],
+                headers.get('ETag'),
+                headers.get('Last-Modified'),
+                hashlib.sha256(body).hexdigest()
+            )
+
         for entry in feed.entries[:max_articles]:
             # Vérifier la date
             if not is_recent(entry, max_age_hours):
@@ -118,43 +211,183 @@ def collect_single_feed(source: dict, max_articles: int = 15, max_age_hours: int
 
         logger.info(f"  → {len(articles)} articles collectés depuis {source['name']}")
 
+    except (FetchTimeout, requests.exceptions.Timeout) as e:
+        status = FETCH_TIMEOUT
+        logger.error(f"Timeout collecte {source['name']}: {e}")
+
     except Exception as e:
+        status = FETCH_ERROR
         logger.error(f"Erreur collecte {source['name']}: {e}")
 
+    finally:
+        if fetch_stats is not None:
+            fetch_stats[source['name']] = status
+
     return articles
 
 
-def collect_rss(
+def iter_rss(
     config_path: str = None,
     max_articles_per_source: int = 15,
-    max_age_hours: int = 72
-) -> List[Article]:
+    max_age_hours: int = 72,
+    max_workers: int = None,
+    max_per_host: int = None,
+    use_cache: bool = None,
+    stats: dict = None
+) -> Iterator[Article]:
     """
-    Collecte tous les flux RSS configurés.
+    Générateur : produit les articles RSS au fil de la collecte.
+
+    Les flux sont récupérés en parallèle par un pool de threads borné,
+    avec au plus IN_FLIGHT_PER_WORKER flux soumis d'avance par worker. La
+    limite par hôte est appliquée à la soumission : un flux dont l'hôte a
+    déjà max_per_host requêtes en cours attend hors du pool, et les workers
+    passent aux flux d'autres hôtes. Les articles sont produits dans l'ordre
+    des sources de sources.yaml, dès qu'une source (et toutes celles qui la
+    précèdent) est terminée.
 
     Args:
         config_path: Chemin vers sources.yaml
         max_articles_per_source: Nombre max d'articles par source
         max_age_hours: Ne pas collecter les articles plus vieux que X heures
-
-    Returns:
-        Liste d'Articles normalisés
+        max_workers: Nombre de flux récupérés en parallèle (1 = séquentiel)
+        max_per_host: Nombre max de requêtes simultanées vers un même hôte
+        use_cache: Requêtes conditionnelles ETag / Last-Modified (défaut: settings)
+        stats: Dict optionnel complété avec les statuts de récupération
     """
     sources = load_rss_sources(config_path)
-    all_articles = []
+    settings = load_settings(config_path)
 
-    logger.info(f"Démarrage collecte RSS - {len(sources)} sources")
+    if max_workers is None:
+        max_workers = settings.get('rss_max_workers', DEFAULT_MAX_WORKERS)
+    if max_per_host is None:
+        max_per_host = settings.get('rss_max_per_host', DEFAULT_MAX_PER_HOST)
+    max_workers = max(1, min(max_workers, len(sources) or 1))
+    if use_cache is None:
+        use_cache = settings.get('rss_conditional_get', True)
 
-    for source in sources:
-        articles = collect_single_feed(
+    cache = FeedCache() if use_cache else None
+    limits = FetchLimits.from_settings(settings, prefix='rss_')
+    fetch_stats = {}
+    total = 0
+
+    logger.info(f"Démarrage collecte RSS - {len(sources)} sources ({max_workers} workers)")
+
+    def collect(source: dict) -> List[Article]:
+        return collect_single_feed(
             source,
             max_articles=max_articles_per_source,
-            max_age_hours=max_age_hours
+            max_age_hours=max_age_hours,
+            cache=cache,
+            fetch_stats=fetch_stats,
+            limits=limits
         )
-        all_articles.extend(articles)
 
-    logger.info(f"Collecte RSS terminée - {len(all_articles)} articles total")
-    return all_articles
+    if max_workers == 1:
+        for source in sources:
+            articles = collect(source)
+            total += len(articles)
+            yield from articles
+    else:
+        # Fenêtre bornée plutôt que map(): map() soumet toutes les sources d'un
+        # coup et garde en mémoire les articles des flux terminés tant que le
+        # consommateur ne les a pas lus
+        window = max_workers * IN_FLIGHT_PER_WORKER
+        hosts = [urlparse(s['url']).netloc.lower() for s in sources]
+        max_per_host = max(1, max_per_host)
+
+        # État partagé avec les callbacks de fin de flux (threads du pool)
+        cond = threading.Condition(threading.RLock())
+        pending = list(range(len(sources)))   # Sources pas encore soumises, dans l'ordre
+        futures = {}                          # Source soumise, pas encore consommée -> future
+        active = defaultdict(int)             # Hôte -> flux soumis non terminés
+        state = {'next': 0, 'closed': False}
+
+        def schedule():
+            """Soumet les premières sources dont l'hôte n'est pas saturé"""
+            with cond:
+                i = 0
+                while i < len(pending) and not state['closed']:
+                    index = pending[i]
+                    # La prochaine source à produire passe même fenêtre pleine
+                    if len(futures) >= window and index != state['next']:
+                        break
+                    host = hosts[index]
+                    if active[host] >= max_per_host:
+                        i += 1
+                        continue
+                    del pending[i]
+                    active[host] += 1
+                    future = executor.submit(collect, sources[index])
+                    futures[index] = future
+                    future.add_done_callback(lambda _, host=host: release(host))
+                cond.notify_all()
+
+        def release(host: str):
+            """Fin d'un flux: libère sa place pour l'hôte et soumet la suite"""
+            with cond:
+                active[host] -= 1
+                schedule()
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rss") as executor:
+            try:
+                schedule()
+                for index in range(len(sources)):
+                    with cond:
+                        # Ordre des sources conservé
+                        cond.wait_for(lambda: index in futures)
+                        future = futures[index]
+                    articles = future.result()
+                    with cond:
+                        del futures[index]
+                        state['next'] = index + 1
+                        schedule()
+                    total += len(articles)
+                    yield from articles
+            finally:
+                # Générateur abandonné: ne pas lancer les flux pas encore démarrés
+                with cond:
+                    state['closed'] = True
+                    for future in futures.values():
+                        future.cancel()
+
+    by_status = {}
+    for status in fetch_stats.values():
+        by_status[status] = by_status.get(status, 0) + 1
+
+    if stats is not None:
+        stats['feeds'] = len(sources)
+        stats['by_status'] = by_status
+        stats['timeouts'] = [name for name, st in fetch_stats.items() if st == FETCH_TIMEOUT]
+        stats['truncated'] = [name for name, st in fetch_stats.items() if st == FETCH_TRUNCATED]
+
+    logger.info(f"Collecte RSS terminée - {total} articles total ({by_status})")
+
+
+def collect_rss(
+    config_path: str = None,
+    max_articles_per_source: int = 15,
+    max_age_hours: int = 72,
+    max_workers: int = None,
+    max_per_host: int = None,
+    use_cache: bool = None,
+    stats: dict = None
+) -> List[Article]:
+    """
+    Collecte tous les flux RSS configurés (voir iter_rss pour les paramètres).
+
+    Returns:
+        Liste d'Articles normalisés
+    """
+    return list(iter_rss(
+        config_path,
+        max_articles_per_source=max_articles_per_source,
+        max_age_hours=max_age_hours,
+        max_workers=max_workers,
+        max_per_host=max_per_host,
+        use_cache=use_cache,
+        stats=stats
+    ))
 
 
 if __name__ == "__main__":
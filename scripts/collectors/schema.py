@@ -1,21 +1,32 @@
 """
 Schema de données pour Post Veille IA
 US-2.6 : Normalisation des données
+
+Classes à slots (pas de __dict__ par instance) et conversions écrites à la
+main : to_dict / to_json évitent la copie profonde de dataclasses.asdict,
+from_dict évite le filtrage générique des champs. Le JSON passe par
+serialization.py (orjson / msgspec si installés).
+
+published_at est converti une fois pour toutes en timestamp entier
+(published_ts) à la création de l'article, utilisé par le scoring.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 import hashlib
-import json
+
+from .dates import parse_timestamp
+from .serialization import dumps, loads
+from .urls import canonicalize_url
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Structure normalisée d'un article collecté"""
 
     # Identifiants
-    id: str                          # Hash SHA256 de l'URL
+    id: str                          # Hash SHA256 de l'URL canonique
     url: str                         # URL source
 
     # Contenu
@@ -30,6 +41,7 @@ class Article:
 
     # Dates
     published_at: Optional[str] = None   # Date de publication (ISO 8601)
+    published_ts: Optional[int] = None   # published_at en epoch UTC (calculé, voir dates.py)
     collected_at: str = ""               # Date de collecte (ISO 8601)
 
     # Métadonnées additionnelles
@@ -41,33 +53,107 @@ class Article:
     score: Optional[int] = None      # Upvotes (Reddit)
     num_comments: Optional[int] = None
 
+    # Spécifique YouTube (durée, langue du transcript...)
+    metadata: Optional[dict] = None
+
+    # Contenu stocké hors JSONL (hash dans blob_store), content vide dans ce cas
+    content_ref: Optional[str] = None
+
+    # Histoire (quasi-doublons, voir near_dup.py) : même valeur pour tous ses articles
+    cluster_id: Optional[str] = None
+
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
         if not self.collected_at:
             self.collected_at = datetime.utcnow().isoformat() + "Z"
+        if self.published_ts is None and self.published_at:
+            self.published_ts = parse_timestamp(self.published_at)
         if not self.id:
             self.id = self.generate_id()
 
     def generate_id(self) -> str:
-        """Génère un ID unique basé sur l'URL"""
-        return hashlib.sha256(self.url.encode()).hexdigest()[:16]
+        """Génère un ID unique basé sur l'URL canonique (voir urls.py)"""
+        return hashlib.sha256(canonicalize_url(self.url).encode()).hexdigest()[:16]
+
+    def _fields(self, copy: bool) -> dict:
+        tags = self.tags
+        metadata = self.metadata
+        if copy:
+            tags = list(tags)
+            metadata = dict(metadata) if metadata is not None else None
+        return {
+            'id': self.id,
+            'url': self.url,
+            'title': self.title,
+            'content': self.content,
+            'summary': self.summary,
+            'source_name': self.source_name,
+            'source_type': self.source_type,
+            'source_category': self.source_category,
+            'published_at': self.published_at,
+            'published_ts': self.published_ts,
+            'collected_at': self.collected_at,
+            'language': self.language,
+            'author': self.author,
+            'tags': tags,
+            'score': self.score,
+            'num_comments': self.num_comments,
+            'metadata': metadata,
+            'content_ref': self.content_ref,
+            'cluster_id': self.cluster_id,
+        }
+
+    def get_content(self, store=None) -> str:
+        """Contenu, relu depuis le stockage par contenu au premier accès"""
+        if self.content or not self.content_ref:
+            return self.content
+
+        from .blob_store import get_blob_store
+        self.content = (store or get_blob_store()).get(self.content_ref) or ""
+        return self.content
 
     def to_dict(self) -> dict:
-        """Convertit en dictionnaire"""
-        return asdict(self)
+        """Convertit en dictionnaire (tags et metadata copiés)"""
+        return self._fields(copy=True)
 
     def to_json(self) -> str:
         """Convertit en JSON string"""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        return dumps(self._fields(copy=False))
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Article':
-        """Crée un Article depuis un dictionnaire"""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        """Crée un Article depuis un dictionnaire (clés inconnues ignorées)"""
+        get = data.get
+        return cls(
+            id=get('id', ''),
+            url=data['url'],
+            title=data['title'],
+            content=data['content'],
+            summary=get('summary'),
+            source_name=get('source_name', ''),
+            source_type=get('source_type', ''),
+            source_category=get('source_category', ''),
+            published_at=get('published_at'),
+            published_ts=get('published_ts'),
+            collected_at=get('collected_at', ''),
+            language=get('language', 'en'),
+            author=get('author'),
+            tags=get('tags'),
+            score=get('score'),
+            num_comments=get('num_comments'),
+            metadata=get('metadata'),
+            content_ref=get('content_ref'),
+            cluster_id=get('cluster_id'),
+        )
+
+    @classmethod
+    def from_json(cls, line) -> 'Article':
+        """Crée un Article depuis une ligne JSON (str ou bytes)"""
+        return cls.from_dict(loads(line))
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzedArticle:
     """Article avec analyse Claude"""
 
@@ -91,16 +177,26 @@ class AnalyzedArticle:
         if not self.analyzed_at:
             self.analyzed_at = datetime.utcnow().isoformat() + "Z"
 
+    def _fields(self, copy: bool) -> dict:
+        return {
+            'article': self.article._fields(copy),
+            'relevance_score': self.relevance_score,
+            'score_justification': self.score_justification,
+            'categories': list(self.categories) if copy else self.categories,
+            'linkedin_angles': list(self.linkedin_angles) if copy else self.linkedin_angles,
+            'hashtags': list(self.hashtags) if copy else self.hashtags,
+            'suggested_post_type': self.suggested_post_type,
+            'analyzed_at': self.analyzed_at,
+        }
+
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data['article'] = self.article.to_dict()
-        return data
+        return self._fields(copy=True)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        return dumps(self._fields(copy=False))
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkedInDraft:
     """Draft de post LinkedIn"""
 
@@ -134,11 +230,27 @@ class LinkedInDraft:
         self.char_count = len(self.content)
         self.word_count = len(self.content.split())
 
+    def _fields(self, copy: bool) -> dict:
+        return {
+            'id': self.id,
+            'article_id': self.article_id,
+            'post_type': self.post_type,
+            'length_type': self.length_type,
+            'content': self.content,
+            'char_count': self.char_count,
+            'word_count': self.word_count,
+            'hashtags': list(self.hashtags) if copy else self.hashtags,
+            'status': self.status,
+            'notes': self.notes,
+            'created_at': self.created_at,
+            'suggested_publish_time': self.suggested_publish_time,
+        }
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        return self._fields(copy=True)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        return dumps(self._fields(copy=False))
 
 
 # Catégories disponibles
@@ -0,0 +1,70 @@
+"""
+Sérialisation JSON - Post Veille IA
+
+Encodeur/décodeur JSON utilisé pour les articles (JSONL). orjson ou msgspec
+sont utilisés s'ils sont installés (plusieurs fois plus rapides que json),
+sinon la bibliothèque standard. La sortie est identique quel que soit le
+backend: UTF-8 non échappé, séparateurs compacts.
+
+Usage:
+    line = dumps(article.to_dict())
+    data = loads(line)
+"""
+
+import json
+from typing import Any, Union
+
+# Backend optionnel (pip install orjson, ou msgspec)
+try:
+    import orjson
+
+    JSON_BACKEND = "orjson"
+
+    def dumps(obj: Any) -> str:
+        """Sérialise en JSON (str)"""
+        return orjson.dumps(obj).decode()
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Sérialise en JSON (bytes UTF-8)"""
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+
+except ImportError:
+    try:
+        import msgspec
+
+        JSON_BACKEND = "msgspec"
+        _encoder = msgspec.json.Encoder()
+        _decoder = msgspec.json.Decoder()
+
+        def dumps(obj: Any) -> str:
+            """Sérialise en JSON (str)"""
+            return _encoder.encode(obj).decode()
+
+        def dumps_bytes(obj: Any) -> bytes:
+            """Sérialise en JSON (bytes UTF-8)"""
+            return _encoder.encode(obj)
+
+        def loads(data: Union[str, bytes]) -> Any:
+            """Désérialise du JSON (str ou bytes)"""
+            return _decoder.decode(data)
+
+    except ImportError:
+        JSON_BACKEND = "json"
+        _encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        _decoder = json.JSONDecoder()
+
+        def dumps(obj: Any) -> str:
+            """Sérialise en JSON (str)"""
+            return _encoder.encode(obj)
+
+        def dumps_bytes(obj: Any) -> bytes:
+            """Sérialise en JSON (bytes UTF-8)"""
+            return _encoder.encode(obj).encode()
+
+        def loads(data: Union[str, bytes]) -> Any:
+            """Désérialise du JSON (str ou bytes)"""
+            if isinstance(data, (bytes, bytearray)):
+                data = data.decode()
+            return _decoder.decode(data)
@@ -0,0 +1,25 @@
+"""
+Paramètres globaux - Post Veille IA
+
+Lit la section `settings` de sources.yaml (timeouts, parallélisme, etc.).
+"""
+
+from pathlib import Path
+import yaml
+
+# Chemin par défaut de la config
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "sources.yaml"
+
+
+def load_settings(config_path: str = None) -> dict:
+    """Charge la section `settings` du fichier de config"""
+    if config_path is None:
+        config_path = DEFAULT_CONFIG_PATH
+
+    try:
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        return {}
+
+    return config.get('settings', {}) or {}
@@ -0,0 +1,216 @@
+"""
+Canonicalisation des URLs - Post Veille IA
+
+Réduit les variantes d'une même page (paramètres de tracking, http/https,
+www., slash final, AMP, redirections de newsletters...) à une URL canonique
+unique. Article.generate_id hache cette URL, ce qui fait tomber ces
+variantes dans la déduplication par ID.
+
+Les règles (globales et par domaine) sont lues depuis config/url_rules.yaml.
+Seuls les paramètres de tracking sans ambiguïté sont retirés partout ; les
+noms génériques (source, ref...) ne le sont que sur les domaines où ils
+servent au tracking.
+
+Usage:
+    canonicalize_url("http://www.example.com/post/?utm_source=x")
+    # -> "https://example.com/post"
+"""
+
+import logging
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import yaml
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Chemin par défaut des règles
+DEFAULT_RULES_PATH = Path(__file__).parent.parent.parent / "config" / "url_rules.yaml"
+
+# Règles minimales si le fichier de config est absent
+DEFAULT_RULES = {
+    'force_https': True,
+    'strip_www': True,
+    'tracking_params': ["utm_*", "fbclid", "gclid"],
+}
+
+# Profondeur max de déballage des redirections imbriquées
+MAX_REDIRECT_DEPTH = 3
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+_NO_TRACKING = (frozenset(), ())
+_ARXIV_VERSION = re.compile(r"^(/(?:abs|pdf)/[\w.\-/]+?)v\d+(\.pdf)?$")
+
+
+class UrlCanonicalizer:
+    """Applique un jeu de règles de canonicalisation"""
+
+    def __init__(self, rules: dict = None):
+        rules = rules if rules is not None else DEFAULT_RULES
+
+        self.force_https = rules.get('force_https', True)
+        self.strip_www = rules.get('strip_www', True)
+        self.strip_amp = rules.get('strip_amp', True)
+
+        self.tracking_exact, self.tracking_prefixes = _tracking_patterns(
+            rules.get('tracking_params')
+        )
+
+        # domaine -> (paramètre contenant la cible, chemin requis ou None)
+        self.redirects = {}
+        for host, spec in (rules.get('redirects', {}) or {}).items():
+            if isinstance(spec, dict):
+                self.redirects[host.lower()] = (spec.get('param'), spec.get('path'))
+            else:
+                self.redirects[host.lower()] = (spec, None)
+
+        self.host_aliases = {
+            k.lower(): v.lower() for k, v in (rules.get('host_aliases', {}) or {}).items()
+        }
+        # domaine -> règle, paramètres de tracking du domaine précompilés
+        self.domains = {}
+        for host, spec in (rules.get('domains', {}) or {}).items():
+            rule = dict(spec or {})
+            rule['tracking'] = _tracking_patterns(rule.get('tracking_params'))
+            self.domains[host.lower()] = rule
+        self.rewrites = [
+            (re.compile(r['pattern']), r['replace'])
+            for r in rules.get('rewrites', []) or []
+        ]
+
+    def _domain_rule(self, host: str) -> dict:
+        """Règle du domaine ou du domaine parent le plus proche"""
+        parts = host.split('.')
+        for i in range(len(parts) - 1):
+            rule = self.domains.get('.'.join(parts[i:]))
+            if rule is not None:
+                return rule
+        return {}
+
+    def _is_tracking(self, key: str, rule: dict) -> bool:
+        """Paramètre de tracking global ou propre au domaine de la règle"""
+        key = key.lower()
+        if key in self.tracking_exact or key.startswith(self.tracking_prefixes):
+            return True
+        exact, prefixes = rule.get('tracking', _NO_TRACKING)
+        return key in exact or key.startswith(prefixes)
+
+    def _unwrap(self, parts, host: str) -> Optional[str]:
+        """URL cible d'une redirection connue, sinon None"""
+        # Cache AMP de Google: <x>.cdn.ampproject.org/c/s/<host>/<path>
+        if host.endswith('.cdn.ampproject.org'):
+            match = re.match(r"^/[a-z]/(s/)?(.+)$", parts.path)
+            if match:
+                scheme = 'https' if match.group(1) else 'http'
+                return f"{scheme}://{match.group(2)}"
+
+        spec = self.redirects.get(host)
+        if spec is None:
+            return None
+        param, path = spec
+        if path and parts.path != path:
+            return None
+        for key, value in parse_qsl(parts.query, keep_blank_values=True):
+            if key == param and value.startswith(('http://', 'https://')):
+                return value
+        return None
+
+    def canonicalize(self, url: str, _depth: int = 0) -> str:
+        """Retourne l'URL canonique (inchangée si ce n'est pas une URL http(s))"""
+        url = (url or "").strip()
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return url
+
+        scheme = parts.scheme.lower()
+        if scheme not in _DEFAULT_PORTS or not parts.hostname:
+            return url
+
+        host = parts.hostname.lower().rstrip('.')
+        if self.strip_www and host.startswith('www.'):
+            host = host[4:]
+
+        if _depth < MAX_REDIRECT_DEPTH:
+            target = self._unwrap(parts, host)
+            if target:
+                return self.canonicalize(target, _depth + 1)
+
+        if self.strip_amp and host.startswith('amp.'):
+            host = host[4:]
+        host = self.host_aliases.get(host, host)
+
+        if self.force_https:
+            scheme = 'https'
+
+        netloc = host
+        try:
+            port = parts.port
+        except ValueError:
+            port = None
+        if port and port != _DEFAULT_PORTS.get(parts.scheme.lower()):
+            netloc = f"{host}:{port}"
+
+        rule = self._domain_rule(host)
+
+        # Chemin: slash final, suffixe AMP, version arXiv
+        path = re.sub(r"/{2,}", "/", parts.path)
+        if self.strip_amp:
+            path = re.sub(r"/amp(?:\.html)?/?$", "", path)
+        if rule.get('strip_version'):
+            path = _ARXIV_VERSION.sub(r"\1\2", path)
+        path = path.rstrip('/')
+
+        # Paramètres: tracking retiré, liste blanche par domaine, ordre stable
+        keep = rule.get('keep_params')
+        params = [
+            (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not self._is_tracking(k, rule) and (keep is None or k in keep)
+        ]
+        query = urlencode(sorted(params))
+
+        canonical = urlunsplit((scheme, netloc, path, query, ""))
+
+        for pattern, replace in self.rewrites:
+            canonical = pattern.sub(replace, canonical)
+
+        return canonical
+
+
+def _tracking_patterns(patterns) -> tuple:
+    """(noms exacts, préfixes) d'une liste de paramètres ("utm_*" = préfixe)"""
+    patterns = [p.lower() for p in patterns or []]
+    return (
+        frozenset(p for p in patterns if not p.endswith('*')),
+        tuple(p[:-1] for p in patterns if p.endswith('*'))
+    )
+
+
+def load_url_rules(rules_path: str = None) -> dict:
+    """Charge les règles de canonicalisation (règles minimales si absentes)"""
+    if rules_path is None:
+        rules_path = DEFAULT_RULES_PATH
+
+    try:
+        with open(rules_path, 'r') as f:
+            return yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        logger.warning(f"Règles d'URL introuvables ({rules_path}) - règles minimales utilisées")
+        return dict(DEFAULT_RULES)
+
+
+@lru_cache(maxsize=None)
+def get_canonicalizer(rules_path: str = None) -> UrlCanonicalizer:
+    """Canonicaliseur partagé (règles chargées une seule fois)"""
+    return UrlCanonicalizer(load_url_rules(rules_path))
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonicalise une URL avec les règles de config/url_rules.yaml"""
+    return get_canonicalizer().canonicalize(url)
+
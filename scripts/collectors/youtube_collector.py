@@ -18,8 +18,9 @@ import os
 import re
 import requests
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict
 from pathlib import Path
+import yaml
 
 try:
     from youtube_transcript_api import YouTubeTranscriptApi
@@ -43,6 +44,7 @@ except ImportError:
     WebshareProxyConfig = None
 
 from .schema import Article
+from .http_session import get_session
 
 # Configuration logging
 logging.basicConfig(level=logging.INFO)
@@ -52,6 +54,22 @@ logger = logging.getLogger(__name__)
 FLYIO_SERVICE_URL = "https://youtube-transcript-service-winter-sea-1469.fly.dev"
 
 
+def load_youtube_videos(config_path: str = None) -> List[str]:
+    """Charge les URLs des vidéos à transcrire depuis le fichier de config"""
+    if config_path is None:
+        config_path = Path(__file__).parent.parent.parent / "config" / "sources.yaml"
+
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+
+    videos = config.get('youtube', {}).get('videos', []) or []
+    return [
+        v if isinstance(v, str) else v['url']
+        for v in videos
+        if isinstance(v, str) or v.get('enabled', True)
+    ]
+
+
 def extract_video_id(url: str) -> Optional[str]:
     """
     Extrait l'ID vidéo depuis une URL YouTube.
@@ -106,7 +124,7 @@ def get_transcript_via_flyio(
         Dict avec le transcript ou None si erreur
     """
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{FLYIO_SERVICE_URL}/transcript",
             json={
                 "url": video_url,
@@ -348,21 +366,18 @@ def transcript_to_article(
     return article
 
 
-def collect_youtube(
+def iter_youtube(
     video_urls: List[str],
     languages: List[str] = ['fr', 'en']
-) -> List[Article]:
+) -> Iterator[Article]:
     """
-    Collecte les transcripts de plusieurs vidéos YouTube.
+    Générateur : produit l'Article de chaque transcript dès qu'il est récupéré.
 
     Args:
         video_urls: Liste d'URLs de vidéos
         languages: Langues préférées pour les transcripts
-
-    Returns:
-        Liste d'Articles avec les transcripts
     """
-    articles = []
+    count = 0
 
     logger.info(f"Collecte YouTube - {len(video_urls)} vidéos")
 
@@ -372,14 +387,30 @@ def collect_youtube(
         transcript_data = get_transcript(url, languages)
 
         if transcript_data:
-            article = transcript_to_article(transcript_data)
-            articles.append(article)
+            count += 1
             logger.info(f"    ✓ {transcript_data['word_count']} mots extraits")
+            yield transcript_to_article(transcript_data)
         else:
             logger.warning(f"    ✗ Transcript non disponible")
 
-    logger.info(f"Collecte YouTube terminée - {len(articles)} transcripts")
-    return articles
+    logger.info(f"Collecte YouTube terminée - {count} transcripts")
+
+
+def collect_youtube(
+    video_urls: List[str],
+    languages: List[str] = ['fr', 'en']
+) -> List[Article]:
+    """
+    Collecte les transcripts de plusieurs vidéos YouTube.
+
+    Args:
+        video_urls: Liste d'URLs de vidéos
+        languages: Langues préférées pour les transcripts
+
+    Returns:
+        Liste d'Articles avec les transcripts
+    """
+    return list(iter_youtube(video_urls, languages))
 
 
 # === CLI ===
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Nettoyage du stockage des contenus - Post Veille IA
+
+Supprime de la table blobs (collectors/blob_store.py) les contenus qu'aucun
+article ne référence plus : ni les JSONL de la collecte, ni l'archive
+compressée, ni le stockage plein texte (table articles). Les blobs récents (--min-age-hours) sont gardés, une collecte en
+cours pouvant les avoir stockés avant d'écrire son JSONL.
+
+Usage:
+    python scripts/gc_blobs.py --dry-run        # Compte les blobs supprimables
+    python scripts/gc_blobs.py
+    python scripts/gc_blobs.py --raw-dir autre/dossier --archive-dir autre/archive
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from collectors.archive import ArchiveReader, DEFAULT_ARCHIVE_DIR, raw_jsonl_files
+from collectors.blob_store import BlobStore, DEFAULT_GC_MIN_AGE_HOURS
+from collectors.dedup import DEFAULT_DB_PATH
+from collectors.serialization import loads
+
+# Configuration logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RAW_DIR = PROJECT_ROOT / "output" / "raw-articles"
+
+
+def live_refs(raw_dir: Path, archive_dir: Path, db_path: Path) -> set:
+    """content_ref des articles des JSONL, de l'archive et du stockage plein texte"""
+    refs = set()
+    for path in raw_jsonl_files(raw_dir):
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    ref = loads(line).get('content_ref')
+                    if ref:
+                        refs.add(ref)
+
+    if (archive_dir / "index.db").exists():
+        with ArchiveReader(archive_dir) as reader:
+            refs.update(a['content_ref'] for a in reader.iter_articles() if a.get('content_ref'))
+
+    # L'index FTS5 d'article_store lit ces contenus depuis blobs
+    conn = sqlite3.connect(db_path)
+    try:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+        if "content_ref" in columns:
+            refs.update(row[0] for row in conn.execute(
+                "SELECT DISTINCT content_ref FROM articles WHERE content_ref IS NOT NULL"
+            ))
+    finally:
+        conn.close()
+
+    return refs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Supprime les contenus stockés non référencés")
+    parser.add_argument('--db', type=str, default=None, help="Base SQLite (défaut: data/veille.db)")
+    parser.add_argument('--raw-dir', type=str, default=None, help="Dossier des JSONL")
+    parser.add_argument('--archive-dir', type=str, default=None, help="Dossier de l'archive")
+    parser.add_argument('--min-age-hours', type=float, default=DEFAULT_GC_MIN_AGE_HOURS,
+                        help="Âge min d'un blob supprimable")
+    parser.add_argument('--dry-run', action='store_true', help="Compter sans supprimer")
+    args = parser.parse_args()
+
+    raw_dir = Path(args.raw_dir) if args.raw_dir else RAW_DIR
+    archive_dir = Path(args.archive_dir) if args.archive_dir else DEFAULT_ARCHIVE_DIR
+    db_path = Path(args.db) if args.db else DEFAULT_DB_PATH
+
+    refs = live_refs(raw_dir, archive_dir, db_path)
+    logger.info(f"{len(refs)} contenus référencés (JSONL, archive et stockage plein texte)")
+
+    with BlobStore(args.db) as store:
+        removed = store.collect_garbage(refs, args.min_age_hours, dry_run=args.dry_run)
+        logger.info(f"{removed} blobs {'supprimables' if args.dry_run else 'supprimés'}")
+        print(json.dumps(store.get_stats(), indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
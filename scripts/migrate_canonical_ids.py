@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Migration des IDs d'articles vers les URLs canoniques - Post Veille IA
+
+Les IDs étaient le hash de l'URL brute ; ils sont désormais le hash de l'URL
+canonique (collectors/urls.py). Ce script, à lancer une seule fois, re-calcule
+les IDs de seen_articles et des tables d'histoires (story_signatures,
+story_lsh), fusionne les lignes qui tombent sur le même ID puis reconstruit
+le filtre de Bloom.
+
+Usage:
+    python scripts/migrate_canonical_ids.py --dry-run
+    python scripts/migrate_canonical_ids.py
+"""
+
+import argparse
+import hashlib
+import logging
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from collectors.dedup import (
+    DEFAULT_DB_PATH,
+    DEFAULT_BLOOM_CAPACITY,
+    DEFAULT_BLOOM_ERROR_RATE,
+    DeduplicationDB
+)
+from collectors.settings import load_settings
+from collectors.urls import canonicalize_url
+
+# Configuration logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def canonical_id(url: str) -> str:
+    """Même calcul que Article.generate_id"""
+    return hashlib.sha256(canonicalize_url(url).encode()).hexdigest()[:16]
+
+
+def table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone() is not None
+
+
+def migrate_seen_articles(conn: sqlite3.Connection) -> dict:
+    """
+    Re-calcule les IDs de seen_articles.
+
+    Returns:
+        {ancien_id: nouvel_id} pour les lignes modifiées
+    """
+    rows = conn.execute("""
+        SELECT id, url, title, source_name, source_type, first_seen_at, last_seen_at
+        FROM seen_articles
+    """).fetchall()
+
+    mapping = {}
+    moved = []
+    for row in rows:
+        new_id = canonical_id(row[1])
+        if new_id != row[0]:
+            mapping[row[0]] = new_id
+            moved.append((new_id,) + tuple(row[1:]))
+
+    if not moved:
+        return mapping
+
+    conn.executemany("DELETE FROM seen_articles WHERE id = ?", [(old,) for old in mapping])
+    # Plusieurs variantes d'une même page: on garde la première vue et la dernière
+    conn.executemany("""
+        INSERT INTO seen_articles (id, url, title, source_name, source_type, first_seen_at, last_seen_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            first_seen_at = MIN(first_seen_at, excluded.first_seen_at),
+            last_seen_at = MAX(last_seen_at, excluded.last_seen_at)
+    """, moved)
+
+    return mapping
+
+
+def migrate_stories(conn: sqlite3.Connection, mapping: dict):
+    """Reporte les nouveaux IDs dans les tables d'histoires (quasi-doublons)"""
+    if not mapping or not table_exists(conn, 'story_signatures'):
+        return
+
+    pairs = [(new, old) for old, new in mapping.items()]
+
+    # Une signature par article: les variantes fusionnées gardent la première
+    conn.executemany("UPDATE OR IGNORE story_signatures SET article_id = ? WHERE article_id = ?", pairs)
+    conn.executemany("DELETE FROM story_signatures WHERE article_id = ?", [(old,) for old in mapping])
+    conn.executemany("UPDATE story_signatures SET cluster_id = ? WHERE cluster_id = ?", pairs)
+
+    if table_exists(conn, 'story_lsh'):
+        conn.executemany("UPDATE story_lsh SET article_id = ? WHERE article_id = ?", pairs)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-calcule les IDs d'articles à partir des URLs canoniques"
+    )
+    parser.add_argument(
+        '--db',
+        type=str,
+        default=None,
+        help="Chemin vers veille.db"
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help="Affiche les changements sans modifier la base"
+    )
+    parser.add_argument(
+        '--no-backup',
+        action='store_true',
+        help="Ne pas copier la base avant migration"
+    )
+
+    args = parser.parse_args()
+    db_path = Path(args.db) if args.db else DEFAULT_DB_PATH
+
+    if not db_path.exists():
+        logger.error(f"Base introuvable: {db_path}")
+        return 1
+
+    if not args.dry_run and not args.no_backup:
+        backup_path = db_path.with_name(f"{db_path.name}.bak-{datetime.utcnow():%Y%m%d%H%M%S}")
+        with sqlite3.connect(db_path) as src, sqlite3.connect(backup_path) as dst:
+            src.backup(dst)
+        logger.info(f"Sauvegarde: {backup_path}")
+
+    conn = sqlite3.connect(db_path)
+    try:
+        total_before = conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+
+        with conn:
+            mapping = migrate_seen_articles(conn)
+            migrate_stories(conn, mapping)
+            total_after = conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+
+            if args.dry_run:
+                conn.rollback()
+    finally:
+        conn.close()
+
+    logger.info(f"IDs modifiés: {len(mapping)} / {total_before}")
+    logger.info(f"Doublons fusionnés: {total_before - total_after}")
+
+    if args.dry_run:
+        logger.info("Simulation: aucune modification écrite")
+        return 0
+
+    # Le filtre contient les anciens IDs: reconstruction complète
+    if mapping:
+        bloom_settings = load_settings().get('dedup_bloom', {}) or {}
+        with DeduplicationDB(
+            db_path,
+            use_bloom=False,
+            bloom_capacity=bloom_settings.get('capacity', DEFAULT_BLOOM_CAPACITY),
+            bloom_error_rate=bloom_settings.get('error_rate', DEFAULT_BLOOM_ERROR_RATE)
+        ) as db:
+            db.rebuild_bloom()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
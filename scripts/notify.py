@@ -27,6 +27,10 @@ from dotenv import load_dotenv
 PROJECT_ROOT = Path(__file__).parent.parent
 load_dotenv(PROJECT_ROOT / ".env")
 
+# Session HTTP partagée avec les collecteurs
+sys.path.insert(0, str(Path(__file__).parent))
+from collectors.http_session import get_session
+
 # Configuration logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -71,7 +75,7 @@ def send_notification(
         payload["avatar_url"] = avatar_url
 
     try:
-        response = requests.post(webhook_url, json=payload, timeout=10)
+        response = get_session().post(webhook_url, json=payload, timeout=10)
         response.raise_for_status()
         logger.info("Notification Discord envoyée")
         return True
@@ -111,7 +115,10 @@ def send_collection_stats(stats: dict, webhook_url: str = None) -> bool:
         for source, count in by_source.items():
             message += f"• {source.upper()}: {count}\n"
 
-    message += f"\n_Total brut: {total_raw} | Dédupliqués: {stats.get('total_deduped', 0)}_"
+    message += f"\n_Total brut: {total_raw} | Dédupliqués: {stats.get('total_deduped', 0)}"
+    if stats.get('total_near_dup'):
+        message += f" | Même histoire: {stats['total_near_dup']}"
+    message += "_"
 
     return send_notification(message, webhook_url)
 
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Index de pertinence BM25 - Post Veille IA
+
+Alimente et interroge l'index des titres et résumés (scoring/relevance.py)
+utilisé par le score rapide BM25 de l'analyse. La collecte le complète au
+fil de l'eau (settings.relevance_index); `build` indexe l'archive
+compressée puis les JSONL déjà collectés (articles déjà indexés ignorés).
+
+Usage:
+    python scripts/relevance_index.py build                   # output/archive + output/raw-articles
+    python scripts/relevance_index.py build --raw-dir autre/dossier --archive-dir autre/archive
+    python scripts/relevance_index.py search "agents autonomes Mistral"
+    python scripts/relevance_index.py stats
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from collectors.archive import ArchiveReader, DEFAULT_ARCHIVE_DIR, raw_jsonl_files
+from scoring import RelevanceIndex
+
+# Configuration logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RAW_DIR = PROJECT_ROOT / "output" / "raw-articles"
+
+# Articles indexés par transaction
+BUILD_BATCH_SIZE = 1000
+
+
+def iter_jsonl(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def add_in_batches(index: RelevanceIndex, articles) -> int:
+    """Indexe un itérable d'articles par transactions de BUILD_BATCH_SIZE"""
+    added = 0
+    while True:
+        batch = list(itertools.islice(articles, BUILD_BATCH_SIZE))
+        if not batch:
+            return added
+        added += index.add_articles(batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index de pertinence BM25 (titres et résumés)")
+    parser.add_argument('--db', type=str, default=None, help="Base SQLite (défaut: data/veille.db)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help="Indexe les JSONL existants")
+    build.add_argument('--raw-dir', type=str, default=None, help="Dossier des JSONL")
+    build.add_argument('--archive-dir', type=str, default=None, help="Dossier de l'archive")
+
+    search = subparsers.add_parser('search', help="Articles indexés classés par BM25")
+    search.add_argument('query')
+    search.add_argument('--limit', type=int, default=20)
+
+    subparsers.add_parser('stats', help="Statistiques de l'index")
+
+    args = parser.parse_args()
+
+    with RelevanceIndex(args.db) as index:
+        if args.command == 'build':
+            raw_dir = Path(args.raw_dir) if args.raw_dir else RAW_DIR
+            archive_dir = Path(args.archive_dir) if args.archive_dir else DEFAULT_ARCHIVE_DIR
+            total = 0
+
+            # JSONL anciens déjà passés dans l'archive (et éventuellement supprimés)
+            if (archive_dir / "index.db").exists():
+                with ArchiveReader(archive_dir) as reader:
+                    added = add_in_batches(index, reader.iter_articles())
+                logger.info(f"Archive: {added} articles indexés")
+                total += added
+
+            for path in raw_jsonl_files(raw_dir):
+                added = add_in_batches(index, iter_jsonl(path))
+                logger.info(f"{path.name}: {added} articles indexés")
+                total += added
+            logger.info(f"Total: {total} articles indexés")
+
+        elif args.command == 'search':
+            for article_id, score in index.search(args.query, limit=args.limit):
+                print(f"{score:8.3f}  {article_id}")
+
+        elif args.command == 'stats':
+            print(json.dumps(index.get_stats(), indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
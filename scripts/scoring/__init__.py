@@ -0,0 +1,24 @@
+"""
+Scoring des articles
+Post Veille IA - Analyse
+"""
+
+from .keywords import KeywordEngine, KeywordAutomaton, KeywordMatches, AHOCORASICK_AVAILABLE
+from .context import ScoringContext, get_scoring_context, extract_keywords_from_text
+from .batch import BatchScorer, MultiProfileScorer, NUMPY_AVAILABLE
+from .relevance import Bm25Scorer, RelevanceIndex
+
+__all__ = [
+    'KeywordEngine',
+    'KeywordAutomaton',
+    'KeywordMatches',
+    'AHOCORASICK_AVAILABLE',
+    'ScoringContext',
+    'get_scoring_context',
+    'extract_keywords_from_text',
+    'BatchScorer',
+    'MultiProfileScorer',
+    'NUMPY_AVAILABLE',
+    'Bm25Scorer',
+    'RelevanceIndex',
+]
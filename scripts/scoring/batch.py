@@ -0,0 +1,491 @@
+"""
+Scoring par lots - Post Veille IA
+
+Même résultat que quick_score_title et score_article (analyze_articles.py,
+qui restent le chemin de référence), calculé pour tous les articles d'un
+coup avec numpy:
+
+1. Les textes sont passés dans l'automate des mots-clés en une fois: le DFA
+   avance sur tous les articles d'un bloc en parallèle (un octet par pas,
+   articles triés par longueur pour limiter le remplissage).
+2. Le résultat est une matrice booléenne articles × motifs (dans tout le
+   texte, et dans le titre seul).
+3. Chaque critère de scoring_criteria (dont la fraîcheur, sur les
+   timestamps published_ts), la moyenne pondérée et les pénalités sont des
+   opérations sur des tableaux.
+
+numpy est optionnel: sans lui, analyze_articles garde le chemin article par
+article.
+
+MultiProfileScorer fait de même pour plusieurs profils à la fois, avec un
+seul passage des automates sur les textes.
+
+Usage:
+    batch = BatchScorer(context)
+    quick = batch.quick_scores(articles)
+    results = batch.score_articles(articles)
+
+    multi = MultiProfileScorer([context_a, context_b])
+    results_a, results_b = multi.score_articles(articles)
+"""
+
+import time
+from typing import Callable, List, Optional
+
+from .context import TIMELINESS_DEFAULT, TIMELINESS_FRESH, TIMELINESS_STALE, ScoringContext
+from .keywords import KeywordAutomaton, KeywordEngine
+
+# numpy optionnel (pip install numpy)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Taille (octets) d'un bloc de textes traité en parallèle: les petits blocs
+# restent en cache CPU et sont plus rapides que de gros blocs
+DEFAULT_CHUNK_BYTES = 4 << 20
+
+# Score de la source selon son niveau (0: inconnue)
+_TIER_SCORES = {1: 1.0, 2: 0.7, 0: 0.4}
+_TIER_BONUS = {1: 2.0, 2: 1.0, 0: 0.0}
+
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("Scoring par lots: installer numpy (pip install numpy)")
+
+
+def _fold(text: str) -> str:
+    """Texte pour _DfaArrays.match: inchangé s'il est ASCII, sinon lower()"""
+    return text if text.isascii() else text.lower()
+
+
+def _fold_article(title: str, content: str, summary: str) -> str:
+    """`titre contenu résumé` comme KeywordEngine.scan_article"""
+    text = f"{title} {content} {summary}"
+    if text.isascii():
+        return text
+    return f"{title.lower()} {content.lower()} {summary.lower()}"
+
+
+def _article_texts(articles: List[dict], content_loader: Callable[[dict], str]):
+    """(textes `titre contenu résumé`, titres) repliés pour _DfaArrays.match"""
+    titles = [a.get('title', '') or "" for a in articles]
+    texts = [
+        _fold_article(title, content_loader(a) or "", a.get('summary', '') or "")
+        for a, title in zip(articles, titles)
+    ]
+    return texts, [_fold(title) for title in titles]
+
+
+class _DfaArrays:
+    """Tables numpy d'un KeywordAutomaton pour la recherche par lots"""
+
+    def __init__(self, automaton: KeywordAutomaton, chunk_bytes: int):
+        self.automaton = automaton
+        self.n_patterns = len(automaton.patterns)
+        self.chunk_bytes = chunk_bytes
+        self.tables = automaton.dfa_tables()
+        if self.tables is None:
+            return
+
+        delta, outputs = self.tables
+        # Alphabet réduit aux octets présents dans les motifs (classe 0: tous
+        # les autres, qui ramènent toujours à la racine): table compacte qui
+        # tient dans le cache CPU
+        alphabet = sorted({byte for pattern in automaton.patterns for byte in pattern.encode()})
+        self.byte_class = np.zeros(256, dtype=np.uint8)
+        for i, byte in enumerate(alphabet):
+            self.byte_class[byte] = i + 1
+        # Majuscules ASCII repliées: un texte ASCII n'a pas à passer par lower()
+        for upper in range(ord('A'), ord('Z') + 1):
+            self.byte_class[upper] = self.byte_class[upper + 32]
+        width = len(alphabet) + 1
+
+        # Renumérotation: états terminaux en dernier, un seul test
+        # (état >= premier terminal) suffit à les repérer
+        terminal = [state for state, out in enumerate(outputs) if out]
+        others = [state for state, out in enumerate(outputs) if not out]
+        new_id = np.empty(len(delta), dtype=np.int64)
+        new_id[others + terminal] = np.arange(len(delta))
+        self.first_terminal = len(others)
+        self.terminal_outputs = [outputs[state] for state in terminal]
+
+        table = np.zeros((len(delta), width), dtype=np.int64)
+        if alphabet:
+            table[new_id, 1:] = new_id[np.array(delta, dtype=np.int64)[:, alphabet]]
+
+        # États multipliés par la largeur: état suivant = flat[état + classe]
+        self.width = width
+        self.dtype = np.int16 if len(delta) * width < 2 ** 15 else np.int32
+        self.flat = (table * width).astype(self.dtype).ravel()
+
+    def match(self, texts: List[str]) -> 'np.ndarray':
+        """
+        Matrice (textes × motifs): motif présent dans le texte.
+
+        Les textes sont en minuscules, ou ASCII (majuscules repliées par la
+        table des classes, voir _fold).
+        """
+        matrix = np.zeros((len(texts), self.n_patterns), dtype=bool)
+        if not texts or not self.n_patterns:
+            return matrix
+
+        if self.tables is None:
+            # Backend C: un appel par texte, déjà à vitesse native
+            for row, text in enumerate(texts):
+                found, _ = self.automaton.find_patterns(text.lower())
+                if found:
+                    matrix[row, list(found)] = True
+            return matrix
+
+        data = [text.encode() for text in texts]
+        order = sorted(range(len(data)), key=lambda i: len(data[i]))
+        n_terminal = len(self.terminal_outputs)
+        hits = np.zeros((len(data), n_terminal), dtype=bool)
+
+        start = 0
+        while start < len(order):
+            # Bloc: autant d'articles que possible dans chunk_bytes
+            end = start + 1
+            while end < len(order) and (end - start + 1) * len(data[order[end]]) <= self.chunk_bytes:
+                end += 1
+            rows = order[start:end]
+            start = end
+
+            width = len(data[rows[-1]])
+            if not width:
+                continue
+            block = np.zeros((len(rows), width), dtype=np.uint8)
+            for r, i in enumerate(rows):
+                block[r, :len(data[i])] = np.frombuffer(data[i], dtype=np.uint8)
+            # Octet 0 en remplissage (classe 0): l'état revient à la racine
+            # sans rien reconnaître
+            columns = self.byte_class.take(block.T).astype(self.dtype)
+
+            # Un pas par octet: états de tous les articles du bloc, gardés
+            # pour repérer les états terminaux en une seule opération
+            n = len(rows)
+            states = np.empty((width, n), dtype=self.dtype)
+            state = np.zeros(n, dtype=self.dtype)
+            index = np.empty(n, dtype=self.dtype)
+            flat = self.flat
+            for step, column in enumerate(columns):
+                np.add(state, column, out=index)
+                state = states[step]
+                flat.take(index, out=state, mode='clip')
+
+            steps, cols = np.nonzero(states >= self.first_terminal * self.width)
+            terminal = states[steps, cols] // self.width - self.first_terminal
+            hits[np.asarray(rows)[cols], terminal] = True
+
+        # États terminaux -> motifs reconnus (suffixes compris)
+        hits_by_terminal = np.ascontiguousarray(hits.T)
+        for i, patterns in enumerate(self.terminal_outputs):
+            for pattern in patterns:
+                matrix[:, pattern] |= hits_by_terminal[i]
+        return matrix
+
+
+class BatchScorer:
+    """quick_score_title et score_article sur une liste d'articles, avec numpy"""
+
+    def __init__(
+        self,
+        context: ScoringContext,
+        content_loader: Callable[[dict], str] = None,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        timestamp_loader: Callable[[dict], Optional[int]] = None
+    ):
+        """
+        Args:
+            context: Contexte de scoring (config, préférences, automates)
+            content_loader: Contenu d'un article (défaut: champ 'content');
+                            analyze_articles passe article_content pour les
+                            contenus sortis dans le stockage par contenu
+            chunk_bytes: Taille d'un bloc de textes traité en parallèle
+            timestamp_loader: Date de publication epoch d'un article (défaut:
+                              champ 'published_ts'); analyze_articles passe
+                              article_timestamp pour les anciens JSONL
+        """
+        _require_numpy()
+        self.context = context
+        self.content_loader = content_loader or (lambda article: article.get('content', ''))
+        self.timestamp_loader = timestamp_loader or (lambda article: article.get('published_ts'))
+        self.chunk_bytes = chunk_bytes
+        self._keyword_arrays: Optional[_DfaArrays] = None
+        self._news_focus_arrays: Optional[_DfaArrays] = None
+
+    @property
+    def _keywords(self) -> _DfaArrays:
+        """Tables du DFA des mots-clés (compilées au premier usage)"""
+        if self._keyword_arrays is None:
+            self._keyword_arrays = _DfaArrays(self.context.engine.automaton, self.chunk_bytes)
+        return self._keyword_arrays
+
+    @property
+    def _news_focus(self) -> _DfaArrays:
+        """Tables du DFA du news_focus (compilées au premier usage)"""
+        if self._news_focus_arrays is None:
+            self._news_focus_arrays = _DfaArrays(self.context.news_focus.automaton, self.chunk_bytes)
+        return self._news_focus_arrays
+
+    @staticmethod
+    def _counts(engine: KeywordEngine, matrix: 'np.ndarray', list_name: str) -> 'np.ndarray':
+        """Nombre d'entrées de la liste présentes, par article"""
+        entries = engine.entry_patterns(list_name)
+        patterns = [p for p in entries if p is not None]
+        counts = matrix[:, patterns].sum(axis=1) if patterns else np.zeros(len(matrix), dtype=np.int64)
+        return counts + (len(entries) - len(patterns))
+
+    def _keyword_score(
+        self,
+        matrix: 'np.ndarray',
+        list_name: str,
+        has_title: Optional['np.ndarray'] = None
+    ) -> 'np.ndarray':
+        """Équivalent vectoriel de KeywordEngine.keyword_score"""
+        engine = self.context.engine
+        size = engine.sizes.get(list_name, 0)
+        if not size:
+            return np.zeros(len(matrix))
+        score = np.minimum(self._counts(engine, matrix, list_name) / size, 1.0)
+        if has_title is not None:
+            score = np.where(has_title, score, 0.0)
+        return score
+
+    def _source_tiers(self, articles: List[dict]) -> 'np.ndarray':
+        return np.array(
+            [self.context.source_tier(a.get('source_name', '')) for a in articles],
+            dtype=np.int8
+        )
+
+    def quick_scores(self, articles: List[dict]) -> List[float]:
+        """quick_score_title pour chaque article"""
+        if not articles:
+            return []
+
+        titles = [_fold(a.get('title', '')) for a in articles]
+        return self.quick_scores_from_matches(articles, self._news_focus.match(titles))
+
+    def quick_scores_from_matches(self, articles: List[dict], matrix: 'np.ndarray') -> List[float]:
+        """quick_score_title depuis la matrice titres × motifs du news_focus"""
+        matches = self._counts(self.context.news_focus, matrix, 'news_focus')
+
+        score = np.zeros(len(articles))
+        score += np.minimum(matches * 2.0, 10.0)
+
+        tiers = self._source_tiers(articles)
+        for tier, bonus in _TIER_BONUS.items():
+            if bonus:
+                score[tiers == tier] += bonus
+
+        return score.tolist()
+
+    def _timeliness(self, articles: List[dict], now: int) -> 'np.ndarray':
+        """Équivalent vectoriel de ScoringContext.timeliness_score"""
+        timestamps = [self.timestamp_loader(a) for a in articles]
+        # NaN (date inconnue): faux dans toutes les comparaisons
+        age = now - np.array([np.nan if ts is None else ts for ts in timestamps], dtype=np.float64)
+        score = np.full(len(articles), TIMELINESS_DEFAULT)
+        if self.context.stale_seconds is not None:
+            score[age > self.context.stale_seconds] = TIMELINESS_STALE
+        if self.context.fresh_seconds is not None:
+            score[age < self.context.fresh_seconds] = TIMELINESS_FRESH
+        return score
+
+    def score_articles(self, articles: List[dict], now: int = None) -> List[dict]:
+        """score_article pour chaque article (score, breakdown, categories), à la date now (epoch)"""
+        if not articles:
+            return []
+
+        texts, folded_titles = _article_texts(articles, self.content_loader)
+        full = self._keywords.match(texts)
+        in_title = self._keywords.match(folded_titles)
+        return self.score_from_matches(articles, full, in_title, now)
+
+    def score_from_matches(
+        self,
+        articles: List[dict],
+        full: 'np.ndarray',
+        in_title: 'np.ndarray',
+        now: int = None
+    ) -> List[dict]:
+        """score_article depuis les matrices articles × motifs (texte entier, titre seul)"""
+        if now is None:
+            now = int(time.time())
+
+        engine = self.context.engine
+        criteria = self.context.config.get('scoring_criteria', {})
+
+        titles = [a.get('title', '') for a in articles]
+        has_title = np.array([bool(title) for title in titles])
+
+        n = len(articles)
+        columns = {}
+        total_weight = 0
+        weighted_sum = np.zeros(n)
+
+        # 1. Pertinence audience (+0.3 si mot-clé dans le titre)
+        audience = criteria.get('audience_relevance', {})
+        if audience:
+            weight = audience.get('weight', 0)
+            score = self._keyword_score(full, 'audience')
+            bonus = self._keyword_score(in_title, 'audience', has_title) > 0
+            score = np.where(bonus, np.minimum(score + 0.3, 1.0), score)
+            columns['audience_relevance'] = score * 10
+            weighted_sum += score * weight
+            total_weight += weight
+
+        # 2. Potentiel d'engagement (titre)
+        engagement = criteria.get('engagement_potential', {})
+        if engagement:
+            weight = engagement.get('weight', 0)
+            score = self._keyword_score(in_title, 'engagement', has_title)
+            columns['engagement_potential'] = score * 10
+            weighted_sum += score * weight
+            total_weight += weight
+
+        # 3. Qualité de la source
+        source_quality = criteria.get('source_quality', {})
+        if source_quality:
+            weight = source_quality.get('weight', 0)
+            tiers = self._source_tiers(articles)
+            score = np.full(n, _TIER_SCORES[0])
+            for tier in (1, 2):
+                score[tiers == tier] = _TIER_SCORES[tier]
+            columns['source_quality'] = score * 10
+            weighted_sum += score * weight
+            total_weight += weight
+
+        # 4. Fraîcheur (âge depuis published_ts)
+        timeliness = criteria.get('timeliness', {})
+        if timeliness:
+            weight = timeliness.get('weight', 0)
+            score = self._timeliness(articles, now)
+            columns['timeliness'] = score * 10
+            weighted_sum += score * weight
+            total_weight += weight
+
+        # 5. Originalité (longueur du titre)
+        uniqueness = criteria.get('uniqueness', {})
+        if uniqueness:
+            weight = uniqueness.get('weight', 0)
+            score = np.minimum(np.array([len(t) for t in titles]) / 80, 1.0)
+            columns['uniqueness'] = score * 10
+            weighted_sum += score * weight
+            total_weight += weight
+
+        if total_weight > 0:
+            final = (weighted_sum / total_weight) * 10
+        else:
+            final = np.full(n, 5.0)
+
+        # Pénalités
+        final = np.where(self._counts(engine, full, 'negative') > 0, final * 0.7, final)
+        final = np.where(self._counts(engine, in_title, 'clickbait') > 0, final * 0.8, final)
+        final = np.minimum(np.maximum(final, 1), 10)
+
+        # Catégories: 3 premières de la config présentes, sinon General
+        # (une liste par combinaison de catégories trouvées)
+        names = engine.category_names
+        found = np.zeros((n, len(names)), dtype=bool)
+        for i in range(len(names)):
+            found[:, i] = self._counts(engine, full, f'category:{i}') > 0
+        packed = np.packbits(found, axis=1)
+        keys = packed.view(f'V{packed.shape[1]}').ravel().tolist() if names else [b''] * n
+        first_row = {}
+        for i, key in enumerate(keys):
+            first_row.setdefault(key, i)
+        labels = {
+            key: [names[j] for j in np.flatnonzero(found[i])[:3]] or ['General']
+            for key, i in first_row.items()
+        }
+
+        breakdowns = [dict(zip(columns, values)) for values in zip(*(c.tolist() for c in columns.values()))]
+        if not breakdowns:
+            breakdowns = [{} for _ in range(n)]
+
+        return [
+            {
+                # round() Python (arrondi décimal exact) comme score_article
+                'score': round(score, 1),
+                'breakdown': breakdown,
+                'categories': list(labels[key]),
+            }
+            for score, breakdown, key in zip(final.tolist(), breakdowns, keys)
+        ]
+
+
+def _union_arrays(automata: List[KeywordAutomaton], chunk_bytes: int):
+    """
+    Un seul DFA pour les motifs de plusieurs automates, et pour chacun les
+    colonnes de ses motifs dans la matrice du DFA commun.
+    """
+    patterns = sorted({pattern for automaton in automata for pattern in automaton.patterns})
+    position = {pattern: i for i, pattern in enumerate(patterns)}
+    arrays = _DfaArrays(KeywordAutomaton(patterns), chunk_bytes)
+    columns = [
+        np.array([position[pattern] for pattern in automaton.patterns], dtype=np.intp)
+        for automaton in automata
+    ]
+    return arrays, columns
+
+
+class MultiProfileScorer:
+    """
+    BatchScorer de plusieurs profils (scoring.yaml + préférences) en un seul
+    passage: les textes sont repliés une fois et parcourus par un DFA réunissant
+    les mots-clés de tous les profils; chaque profil lit ses colonnes de la
+    matrice commune. Résultats identiques à un BatchScorer par profil.
+    """
+
+    def __init__(
+        self,
+        contexts: List[ScoringContext],
+        content_loader: Callable[[dict], str] = None,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        timestamp_loader: Callable[[dict], Optional[int]] = None
+    ):
+        """
+        Args:
+            contexts: Contexte de scoring de chaque profil
+            content_loader, chunk_bytes, timestamp_loader: voir BatchScorer
+        """
+        _require_numpy()
+        self.scorers = [
+            BatchScorer(context, content_loader, chunk_bytes, timestamp_loader)
+            for context in contexts
+        ]
+        self.content_loader = self.scorers[0].content_loader if self.scorers else None
+        self._keywords, self._keyword_columns = _union_arrays(
+            [context.engine.automaton for context in contexts], chunk_bytes
+        )
+        self._news_focus, self._news_focus_columns = _union_arrays(
+            [context.news_focus.automaton for context in contexts], chunk_bytes
+        )
+
+    def quick_scores(self, articles: List[dict]) -> List[List[float]]:
+        """quick_score_title de chaque article, par profil"""
+        if not articles:
+            return [[] for _ in self.scorers]
+
+        matrix = self._news_focus.match([_fold(a.get('title', '')) for a in articles])
+        return [
+            scorer.quick_scores_from_matches(articles, matrix[:, columns])
+            for scorer, columns in zip(self.scorers, self._news_focus_columns)
+        ]
+
+    def score_articles(self, articles: List[dict], now: int = None) -> List[List[dict]]:
+        """score_article de chaque article, par profil"""
+        if not articles:
+            return [[] for _ in self.scorers]
+
+        texts, folded_titles = _article_texts(articles, self.content_loader)
+        full = self._keywords.match(texts)
+        in_title = self._keywords.match(folded_titles)
+        return [
+            scorer.score_from_matches(articles, full[:, columns], in_title[:, columns], now)
+            for scorer, columns in zip(self.scorers, self._keyword_columns)
+        ]
@@ -0,0 +1,268 @@
+"""
+Contexte de scoring - Post Veille IA
+
+Tout ce qui se déduit de config/scoring.yaml et de content_preferences.json
+est précompilé une seule fois dans un ScoringContext passé aux fonctions de
+scoring: automate des mots-clés, mots-clés extraits du news_focus, niveau
+(tier 1/2) de chaque source déjà rencontrée, seuils de fraîcheur en secondes.
+
+Le contexte retient l'empreinte des fichiers lus (mtime, taille, SHA-256):
+is_stale() détecte une modification (un simple `touch` ne l'invalide pas).
+Il peut être persisté (pickle) pour un démarrage sans recompilation.
+
+Usage:
+    context = ScoringContext.load(CONFIG_PATH, PREFS_PATH, cache_path=DEFAULT_CACHE_PATH)
+    quick_score_title(article, context.config, context.preferences, context)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import yaml
+
+from .keywords import AHOCORASICK_AVAILABLE, KeywordEngine
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Contexte persisté (data/ à côté de veille.db)
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "scoring_context.pickle"
+
+# À incrémenter si la structure du contexte change (invalide les caches)
+CACHE_VERSION = 3
+
+# Score de fraîcheur: publié depuis moins de boost_if_hours_old_less_than,
+# entre les deux seuils (ou date inconnue), plus de penalty_if_hours_old_more_than
+TIMELINESS_FRESH = 1.0
+TIMELINESS_DEFAULT = 0.7
+TIMELINESS_STALE = 0.4
+
+# Mots vides ignorés dans le news_focus
+STOP_WORDS = frozenset({
+    'le', 'la', 'les', 'un', 'une', 'des', 'de', 'du', 'au', 'aux',
+    'je', 'tu', 'il', 'elle', 'nous', 'vous', 'ils', 'elles',
+    'mon', 'ma', 'mes', 'ton', 'ta', 'tes', 'son', 'sa', 'ses',
+    'ce', 'cette', 'ces', 'qui', 'que', 'quoi', 'dont', 'où',
+    'et', 'ou', 'mais', 'donc', 'car', 'ni', 'si', 'pour', 'par',
+    'sur', 'sous', 'dans', 'avec', 'sans', 'entre', 'vers', 'chez',
+    'être', 'avoir', 'faire', 'pouvoir', 'vouloir', 'devoir', 'aller',
+    'est', 'sont', 'était', 'peut', 'va', 'fait', 'bien', 'plus',
+    'se', 'ne', 'pas', 'quels', 'quel', 'quelle', 'quelles',
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'to', 'of', 'in', 'on', 'at', 'for', 'with', 'by', 'from',
+    'cherche', 'uniquement', 'news', 'peuvent', 'intéresser', 'publique',
+    'demande', 'comment', 'pourquoi', 'important', 'autant', 'faire',
+    'sujets', 'inclure', 'exclure', 'éviter', 'trop', 'techniques'
+})
+
+_WORD_RE = re.compile(r'[a-zA-ZÀ-ÿ]{3,}')
+
+# Empreinte d'un fichier: (mtime_ns, taille, sha256), None s'il n'existe pas
+Fingerprint = Optional[Tuple[int, int, str]]
+
+
+def extract_keywords_from_text(text: str) -> list:
+    """
+    Extrait les mots significatifs d'un texte (news_focus de l'utilisateur).
+    Ignore les mots vides (stop words).
+    """
+    words = _WORD_RE.findall(text.lower())
+    return list({w for w in words if w not in STOP_WORDS})
+
+
+def _sha256(path: Path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def file_fingerprint(path: Path) -> Fingerprint:
+    """Empreinte (mtime_ns, taille, SHA-256) d'un fichier, None s'il est absent"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, _sha256(path)
+
+
+class ScoringContext:
+    """Config de scoring et préférences, avec leurs dérivés précompilés"""
+
+    def __init__(self, config: dict, preferences: dict, fingerprints: Dict[str, Fingerprint] = None):
+        """
+        Args:
+            config: Configuration scoring.yaml
+            preferences: content_preferences.json ({} si absent)
+            fingerprints: Chemin -> empreinte des fichiers d'origine
+                          (vide: contexte construit en mémoire, jamais périmé)
+        """
+        self.config = config or {}
+        self.preferences = preferences or {}
+        self.fingerprints = dict(fingerprints or {})
+
+        self.engine = KeywordEngine.from_config(self.config)
+        self.user_keywords = extract_keywords_from_text(self.preferences.get('news_focus', ''))
+        self.news_focus = KeywordEngine({'news_focus': self.user_keywords})
+        self._source_tiers: Dict[str, int] = {}
+
+        # Seuils de fraîcheur (heures dans scoring.yaml), None si absents
+        timeliness = self.config.get('scoring_criteria', {}).get('timeliness') or {}
+        fresh_hours = timeliness.get('boost_if_hours_old_less_than')
+        stale_hours = timeliness.get('penalty_if_hours_old_more_than')
+        self.fresh_seconds = int(fresh_hours * 3600) if fresh_hours is not None else None
+        self.stale_seconds = int(stale_hours * 3600) if stale_hours is not None else None
+
+    @classmethod
+    def load(
+        cls,
+        config_path: Path,
+        prefs_path: Path,
+        cache_path: Path = None
+    ) -> 'ScoringContext':
+        """
+        Contexte des fichiers de config, repris du cache s'il est à jour.
+
+        Args:
+            config_path: scoring.yaml
+            prefs_path: content_preferences.json (facultatif)
+            cache_path: Fichier de persistance (None = pas de cache)
+        """
+        if cache_path:
+            cached = cls.load_cache(cache_path)
+            if (cached is not None
+                    and set(cached.fingerprints) == {str(config_path), str(prefs_path)}):
+                fingerprints = dict(cached.fingerprints)
+                if not cached.is_stale():
+                    if cached.fingerprints != fingerprints:
+                        cached.save(cache_path)   # Fichiers touchés mais identiques
+                    return cached
+
+        fingerprints = {
+            str(config_path): file_fingerprint(config_path),
+            str(prefs_path): file_fingerprint(prefs_path),
+        }
+
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f)
+
+        try:
+            with open(prefs_path, 'r', encoding='utf-8') as f:
+                preferences = json.load(f)
+        except FileNotFoundError:
+            logger.warning("content_preferences.json non trouvé, utilisation des défauts")
+            preferences = {}
+
+        context = cls(config, preferences, fingerprints)
+        if cache_path:
+            context.save(cache_path)
+        return context
+
+    @classmethod
+    def load_cache(cls, cache_path: Path) -> Optional['ScoringContext']:
+        """Contexte persisté, None si absent, illisible ou d'une autre version"""
+        try:
+            with open(cache_path, 'rb') as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Cache de scoring illisible ({cache_path}): {e}")
+            return None
+
+        if (not isinstance(payload, dict)
+                or payload.get('version') != CACHE_VERSION
+                or payload.get('ahocorasick') != AHOCORASICK_AVAILABLE):
+            return None
+        return payload.get('context')
+
+    def save(self, cache_path: Path):
+        """Persiste le contexte (écriture atomique)"""
+        cache_path = Path(cache_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(cache_path.suffix + '.tmp')
+        payload = {
+            'version': CACHE_VERSION,
+            'ahocorasick': AHOCORASICK_AVAILABLE,
+            'context': self,
+        }
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+
+    def is_stale(self) -> bool:
+        """
+        Vrai si un fichier d'origine a changé depuis la construction.
+
+        mtime et taille inchangés: à jour sans relire le fichier. Sinon le
+        SHA-256 tranche (et l'empreinte est rafraîchie s'il est identique).
+        """
+        for path, fingerprint in self.fingerprints.items():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                if fingerprint is not None:
+                    return True
+                continue
+            if fingerprint is None:
+                return True
+            if (stat.st_mtime_ns, stat.st_size) == fingerprint[:2]:
+                continue
+            digest = _sha256(Path(path))
+            if digest != fingerprint[2]:
+                return True
+            self.fingerprints[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return False
+
+    def source_tier(self, source: str) -> int:
+        """Niveau de la source: 1 (tier_1_sources), 2 (tier_2_sources) ou 0"""
+        tier = self._source_tiers.get(source)
+        if tier is None:
+            matches = self.engine.scan(source.lower())
+            if matches.any('tier_1'):
+                tier = 1
+            elif matches.any('tier_2'):
+                tier = 2
+            else:
+                tier = 0
+            self._source_tiers[source] = tier
+        return tier
+
+    def timeliness_score(self, published_ts: Optional[int], now: int) -> float:
+        """Score de fraîcheur (0-1) d'un article publié à published_ts (epoch), à la date now"""
+        if published_ts is None:
+            return TIMELINESS_DEFAULT
+        age = now - published_ts
+        if self.fresh_seconds is not None and age < self.fresh_seconds:
+            return TIMELINESS_FRESH
+        if self.stale_seconds is not None and age > self.stale_seconds:
+            return TIMELINESS_STALE
+        return TIMELINESS_DEFAULT
+
+    def news_focus_count(self, title_lower: str) -> int:
+        """Nombre de mots-clés du news_focus présents dans un titre en minuscules"""
+        return self.news_focus.scan(title_lower).count('news_focus')
+
+
+_context: Optional[ScoringContext] = None
+
+
+def get_scoring_context(
+    config_path: Path,
+    prefs_path: Path,
+    cache_path: Path = DEFAULT_CACHE_PATH
+) -> ScoringContext:
+    """Contexte partagé, reconstruit quand scoring.yaml ou les préférences changent"""
+    global _context
+
+    if (_context is None
+            or set(_context.fingerprints) != {str(config_path), str(prefs_path)}
+            or _context.is_stale()):
+        _context = ScoringContext.load(config_path, prefs_path, cache_path)
+
+    return _context
@@ -0,0 +1,297 @@
+"""
+Moteur de mots-clés - Post Veille IA
+
+Un automate d'Aho–Corasick compilé une seule fois depuis config/scoring.yaml
+couvre toutes les listes de mots-clés (pertinence audience, engagement,
+sources tier 1/2, exclusions, catégories). Un seul passage sur le texte
+renvoie toutes les correspondances avec leur liste d'origine, au lieu d'un
+`kw.lower() in text` par mot-clé et par critère.
+
+Même sémantique que les tests de sous-chaîne historiques: correspondance
+insensible à la casse, à l'intérieur des mots, chaque entrée d'une liste
+comptée au plus une fois.
+
+Backend C (pyahocorasick) utilisé s'il est installé, automate Python sinon.
+
+Usage:
+    engine = KeywordEngine.from_config(config)
+    matches = engine.scan_article(title, content, summary)
+    matches.count('audience'), matches.count('audience', title_only=True)
+"""
+
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+# Automate C optionnel (pip install pyahocorasick)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Listes de scoring.yaml couvertes par le moteur: nom -> chemin dans la config
+CONFIG_LISTS = {
+    'audience': ('scoring_criteria', 'audience_relevance', 'keywords_boost'),
+    'engagement': ('scoring_criteria', 'engagement_potential', 'keywords_boost'),
+    'tier_1': ('scoring_criteria', 'source_quality', 'tier_1_sources'),
+    'tier_2': ('scoring_criteria', 'source_quality', 'tier_2_sources'),
+    'negative': ('exclusions', 'negative_keywords'),
+    'clickbait': ('exclusions', 'clickbait_patterns'),
+}
+
+
+class KeywordAutomaton:
+    """
+    Automate d'Aho–Corasick sur des motifs en minuscules.
+
+    find() renvoie (position de fin, indice du motif) pour chaque occurrence,
+    chevauchements compris.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = list(patterns)
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for idx, pattern in enumerate(self.patterns):
+                if pattern:
+                    existing = self._automaton.get(pattern, ())
+                    self._automaton.add_word(pattern, existing + (idx,))
+            if len(self._automaton):
+                self._automaton.make_automaton()
+            else:
+                self._automaton = None
+            return
+
+        # Trie sur les octets UTF-8 des motifs (une sous-chaîne d'octets UTF-8
+        # correspond exactement à une sous-chaîne de caractères)
+        goto: List[Dict[int, int]] = [{}]
+        outputs: List[Tuple[int, ...]] = [()]
+        for idx, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for byte in pattern.encode():
+                nxt = goto[state].get(byte)
+                if nxt is None:
+                    goto.append({})
+                    outputs.append(())
+                    nxt = len(goto) - 1
+                    goto[state][byte] = nxt
+                state = nxt
+            outputs[state] += (idx,)
+
+        # Liens d'échec en largeur, puis table de transitions complète (DFA):
+        # une ligne de 256 états par état, la recherche n'a plus qu'une
+        # indexation de liste par octet
+        fail = [0] * len(goto)
+        delta: List[List[int]] = [None] * len(goto)
+        delta[0] = [goto[0].get(byte, 0) for byte in range(256)]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            if state:
+                row = list(delta[fail[state]])
+                for byte, nxt in goto[state].items():
+                    row[byte] = nxt
+                delta[state] = row
+                outputs[state] += outputs[fail[state]]
+            for byte, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]][byte] if state else 0
+                queue.append(nxt)
+
+        self._delta = delta
+        self._outputs = [out or None for out in outputs]
+
+    def find(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Occurrences (position du dernier caractère, indice du motif)"""
+        if AHOCORASICK_AVAILABLE:
+            if self._automaton is None:
+                return
+            for end, indices in self._automaton.iter(text):
+                for idx in indices:
+                    yield end, idx
+            return
+
+        delta = self._delta
+        outputs = self._outputs
+        state = 0
+        for pos, ch in enumerate(text):
+            for byte in ch.encode():
+                state = delta[state][byte]
+            if outputs[state]:
+                for idx in outputs[state]:
+                    yield pos, idx
+
+    def find_patterns(self, text: str, split: int = 0) -> Tuple[Set[int], Set[int]]:
+        """
+        Motifs présents dans le texte, sans le détail des occurrences.
+
+        Returns:
+            (motifs présents dans tout le texte, motifs se terminant avant
+             la position `split`)
+        """
+        if AHOCORASICK_AVAILABLE:
+            found, head = set(), set()
+            if self._automaton is not None:
+                for end, indices in self._automaton.iter(text):
+                    found.update(indices)
+                    if end < split:
+                        head.update(indices)
+            return found, head
+
+        # Boucle chaude: une indexation de liste par octet, états terminaux
+        # collectés une seule fois chacun
+        delta = self._delta
+        outputs = self._outputs
+        states = set()
+        add = states.add
+        state = 0
+        for byte in text[:split].encode():
+            state = delta[state][byte]
+            if outputs[state]:
+                add(state)
+        head_states = set(states)
+        for byte in text[split:].encode():
+            state = delta[state][byte]
+            if outputs[state]:
+                add(state)
+
+        found = {idx for s in states for idx in outputs[s]}
+        head = {idx for s in head_states for idx in outputs[s]}
+        return found, head
+
+    def dfa_tables(self) -> Optional[Tuple[List[List[int]], List[Optional[Tuple[int, ...]]]]]:
+        """
+        Tables du DFA Python: transitions (état -> 256 états suivants, par
+        octet UTF-8) et motifs reconnus dans chaque état. None avec le
+        backend C.
+        """
+        if AHOCORASICK_AVAILABLE:
+            return None
+        return self._delta, self._outputs
+
+
+class KeywordMatches:
+    """Entrées trouvées par liste, dans tout le texte et dans le titre seul"""
+
+    __slots__ = ('full', 'title', 'has_title')
+
+    def __init__(self, has_title: bool = True):
+        self.full: Dict[str, Set[int]] = {}
+        self.title: Dict[str, Set[int]] = {}
+        self.has_title = has_title
+
+    def count(self, list_name: str, title_only: bool = False) -> int:
+        """Nombre d'entrées de la liste présentes au moins une fois"""
+        return len((self.title if title_only else self.full).get(list_name, ()))
+
+    def any(self, list_name: str, title_only: bool = False) -> bool:
+        return self.count(list_name, title_only) > 0
+
+
+class KeywordEngine:
+    """Toutes les listes de mots-clés de scoring.yaml dans un seul automate"""
+
+    def __init__(self, lists: Dict[str, List[str]]):
+        """
+        Args:
+            lists: Nom de liste -> mots-clés (casse indifférente, doublons
+                   comptés comme des entrées distinctes, comme avant)
+        """
+        self.lists = {name: list(keywords) for name, keywords in lists.items()}
+        self.sizes = {name: len(keywords) for name, keywords in self.lists.items()}
+        # Noms des listes category:i (renseignés par from_config)
+        self.category_names: List[str] = []
+
+        # Motif unique -> entrées (liste, indice) qu'il satisfait
+        pattern_index: Dict[str, int] = {}
+        self._targets: List[List[Tuple[str, int]]] = []
+        self._always: List[Tuple[str, int]] = []   # Mot-clé vide: toujours présent
+        self._entry_patterns: Dict[str, List[Optional[int]]] = {}
+        for name, keywords in self.lists.items():
+            entries = self._entry_patterns[name] = []
+            for idx, keyword in enumerate(keywords):
+                pattern = keyword.lower()
+                if not pattern:
+                    self._always.append((name, idx))
+                    entries.append(None)
+                    continue
+                if pattern not in pattern_index:
+                    pattern_index[pattern] = len(self._targets)
+                    self._targets.append([])
+                self._targets[pattern_index[pattern]].append((name, idx))
+                entries.append(pattern_index[pattern])
+
+        self.automaton = KeywordAutomaton(list(pattern_index))
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'KeywordEngine':
+        """Compile les listes de scoring.yaml (critères, exclusions, catégories)"""
+        lists = {}
+        for name, path in CONFIG_LISTS.items():
+            node = config
+            for key in path:
+                node = (node or {}).get(key) if isinstance(node, dict) else None
+            lists[name] = list(node or [])
+
+        categories = config.get('categories', []) or []
+        for i, category in enumerate(categories):
+            lists[f'category:{i}'] = list(category.get('keywords', []) or [])
+
+        engine = cls(lists)
+        engine.category_names = [c['name'] for c in categories]
+        return engine
+
+    def scan(self, text_lower: str, title_end: int = -1) -> KeywordMatches:
+        """
+        Un seul passage sur un texte déjà en minuscules.
+
+        Args:
+            text_lower: Texte en minuscules
+            title_end: Longueur du titre en tête du texte; les occurrences
+                       qui s'y terminent sont aussi comptées pour le titre
+        """
+        matches = KeywordMatches(has_title=title_end > 0)
+        full = matches.full
+        title = matches.title
+        targets = self._targets
+
+        for name, idx in self._always:
+            full.setdefault(name, set()).add(idx)
+            title.setdefault(name, set()).add(idx)
+
+        found, in_title = self.automaton.find_patterns(text_lower, max(title_end, 0))
+        for pattern_idx in found:
+            for name, idx in targets[pattern_idx]:
+                full.setdefault(name, set()).add(idx)
+        for pattern_idx in in_title:
+            for name, idx in targets[pattern_idx]:
+                title.setdefault(name, set()).add(idx)
+
+        return matches
+
+    def scan_article(self, title: str, content: str, summary: str) -> KeywordMatches:
+        """Correspondances dans `titre contenu résumé`, et dans le titre seul"""
+        title_lower = (title or "").lower()
+        text = f"{title_lower} {(content or '').lower()} {(summary or '').lower()}"
+        return self.scan(text, title_end=len(title_lower))
+
+    def entry_patterns(self, list_name: str) -> List[Optional[int]]:
+        """Indice du motif de chaque entrée d'une liste (None: mot-clé vide)"""
+        return self._entry_patterns.get(list_name, [])
+
+    def keyword_score(self, matches: KeywordMatches, list_name: str, title_only: bool = False) -> float:
+        """Équivalent de calculate_keyword_score pour une liste"""
+        size = self.sizes.get(list_name, 0)
+        if not size or (title_only and not matches.has_title):
+            return 0.0
+        return min(matches.count(list_name, title_only) / size, 1.0)
+
+    def categories(self, matches: KeywordMatches, limit: int = 3) -> List[str]:
+        """Équivalent de detect_categories (ordre de la config, 3 max)"""
+        found = [
+            name for i, name in enumerate(self.category_names)
+            if matches.any(f'category:{i}')
+        ]
+        return found[:limit] if found else ['General']
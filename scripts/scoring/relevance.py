@@ -0,0 +1,300 @@
+"""
+Index de pertinence BM25 - Post Veille IA
+
+Petit index inversé des titres et résumés dans data/veille.db, complété à
+la collecte (collect_all.py) : longueur de chaque document, postings
+(terme, document, fréquence) et fréquence documentaire de chaque terme.
+
+Le score rapide de la phase 1 (quick_scoring.method: bm25 dans
+scoring.yaml) est le BM25 du titre et du résumé contre le news_focus de
+l'utilisateur: un mot rare de la préférence pèse plus qu'un mot courant,
+et le résumé compte en plus du titre. Bm25Scorer est un instantané des
+statistiques des seuls termes de la requête (quelques dizaines d'entrées):
+scorer un article revient à le découper en mots, sans accès à la base.
+
+Mots: ceux de extract_keywords_from_text (3 lettres ou plus, mots vides
+ignorés), les mêmes côté requête et côté documents.
+
+Usage:
+    with RelevanceIndex() as index:
+        index.add_articles(articles)
+        scorer = index.scorer(preferences['news_focus'])
+    scorer.score(article['title'], article['summary'])
+"""
+
+import logging
+import math
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .context import STOP_WORDS, _WORD_RE
+
+# Configuration logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Même base que la déduplication et le stockage des articles
+DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "veille.db"
+
+# Paramètres BM25 usuels: saturation de la fréquence, normalisation par la longueur
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Mots d'un texte en minuscules (3 lettres ou plus, sans mots vides)"""
+    return [w for w in _WORD_RE.findall(text.lower()) if w not in STOP_WORDS]
+
+
+def _article_text(article) -> Tuple[str, str]:
+    """(id, `titre résumé`) d'un Article ou d'un dict"""
+    if not isinstance(article, dict):
+        article = article.to_dict()
+    return article['id'], f"{article.get('title') or ''} {article.get('summary') or ''}"
+
+
+class Bm25Scorer:
+    """BM25 d'un texte contre une requête, statistiques figées (picklable)"""
+
+    def __init__(
+        self,
+        idf: Dict[str, float],
+        avgdl: float,
+        k1: float = DEFAULT_K1,
+        b: float = DEFAULT_B
+    ):
+        """
+        Args:
+            idf: Terme de la requête -> IDF
+            avgdl: Longueur moyenne des documents de l'index (0: index vide)
+            k1, b: Paramètres BM25
+        """
+        self.idf = dict(sorted(idf.items()))
+        self.avgdl = avgdl
+        self.k1 = k1
+        self.b = b
+
+    def term_score(self, term: str, tf: int, length: int) -> float:
+        """Contribution d'un terme présent tf fois dans un document de `length` mots"""
+        norm = 1.0 - self.b + self.b * length / self.avgdl if self.avgdl > 0 else 1.0
+        return self.idf[term] * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+
+    def score_terms(self, counts: Dict[str, int], length: int) -> float:
+        """BM25 d'un document (fréquences des termes de la requête, longueur)"""
+        # Somme dans l'ordre des termes: même résultat quel que soit le chemin
+        return sum(self.term_score(t, counts[t], length) for t in sorted(counts))
+
+    def score_words(self, words: List[str]) -> float:
+        """BM25 d'un texte déjà découpé (tokenize), partagé entre plusieurs requêtes"""
+        counts = Counter(w for w in words if w in self.idf)
+        if not counts:
+            return 0.0
+        return self.score_terms(counts, len(words))
+
+    def score_text(self, text: str) -> float:
+        """BM25 d'un texte"""
+        if not self.idf:
+            return 0.0
+        return self.score_words(tokenize(text))
+
+    def score(self, title: str, summary: str = "") -> float:
+        """BM25 du titre et du résumé d'un article (texte indexé à la collecte)"""
+        return self.score_text(f"{title or ''} {summary or ''}")
+
+    def to_dict(self) -> dict:
+        return {'idf': self.idf, 'avgdl': self.avgdl, 'k1': self.k1, 'b': self.b}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Bm25Scorer':
+        return cls(data['idf'], data['avgdl'], data['k1'], data['b'])
+
+
+class RelevanceIndex:
+    """Index inversé titre + résumé et statistiques BM25 dans veille.db"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _init_db(self):
+        """Crée les tables de l'index"""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS relevance_docs (
+                    id TEXT PRIMARY KEY,
+                    length INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS relevance_postings (
+                    term TEXT NOT NULL,
+                    doc_id TEXT NOT NULL,
+                    tf INTEGER NOT NULL,
+                    PRIMARY KEY (term, doc_id)
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS relevance_terms (
+                    term TEXT PRIMARY KEY,
+                    df INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+            # Une seule ligne: évite COUNT/SUM sur tout l'index à chaque lecture
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS relevance_stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    documents INTEGER NOT NULL,
+                    total_length INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO relevance_stats (id, documents, total_length) VALUES (1, 0, 0)"
+            )
+
+    def add_articles(self, articles: Iterable) -> int:
+        """
+        Indexe des articles (Article ou dict) en une transaction.
+        Les IDs déjà indexés sont ignorés.
+
+        Returns:
+            Nombre d'articles indexés
+        """
+        docs = {}
+        for article in articles:
+            article_id, text = _article_text(article)
+            docs.setdefault(article_id, text)
+        if not docs:
+            return 0
+
+        with self._lock, self._conn:
+            known = set()
+            ids = list(docs)
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                known.update(row[0] for row in self._conn.execute(
+                    f"SELECT id FROM relevance_docs WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+                ))
+
+            lengths = []
+            postings = []
+            df = Counter()
+            for article_id, text in docs.items():
+                if article_id in known:
+                    continue
+                words = tokenize(text)
+                counts = Counter(words)
+                lengths.append((article_id, len(words)))
+                postings.extend((term, article_id, tf) for term, tf in counts.items())
+                df.update(counts.keys())
+
+            if not lengths:
+                return 0
+
+            self._conn.executemany("INSERT INTO relevance_docs (id, length) VALUES (?, ?)", lengths)
+            self._conn.executemany(
+                "INSERT INTO relevance_postings (term, doc_id, tf) VALUES (?, ?, ?)", postings
+            )
+            self._conn.executemany("""
+                INSERT INTO relevance_terms (term, df) VALUES (?, ?)
+                ON CONFLICT(term) DO UPDATE SET df = df + excluded.df
+            """, df.items())
+            self._conn.execute(
+                "UPDATE relevance_stats SET documents = documents + ?, total_length = total_length + ?",
+                (len(lengths), sum(length for _, length in lengths))
+            )
+        return len(lengths)
+
+    def stats(self) -> Tuple[int, float]:
+        """(nombre de documents, longueur moyenne)"""
+        with self._lock:
+            documents, total_length = self._conn.execute(
+                "SELECT documents, total_length FROM relevance_stats"
+            ).fetchone()
+        return documents, total_length / documents if documents else 0.0
+
+    def scorer(self, query: str, k1: float = DEFAULT_K1, b: float = DEFAULT_B) -> Bm25Scorer:
+        """Instantané BM25 pour une requête (texte libre, ex. le news_focus)"""
+        terms = sorted(set(tokenize(query)))
+        documents, avgdl = self.stats()
+
+        df = {}
+        with self._lock:
+            for i in range(0, len(terms), 500):
+                chunk = terms[i:i + 500]
+                df.update(self._conn.execute(
+                    f"SELECT term, df FROM relevance_terms WHERE term IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                ))
+
+        # IDF toujours positive (variante Lucene): un terme absent de l'index
+        # a l'IDF maximale
+        idf = {
+            term: math.log(1 + (documents - df.get(term, 0) + 0.5) / (df.get(term, 0) + 0.5))
+            for term in terms
+        }
+        return Bm25Scorer(idf, avgdl, k1, b)
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 50,
+        k1: float = DEFAULT_K1,
+        b: float = DEFAULT_B
+    ) -> List[Tuple[str, float]]:
+        """
+        Documents indexés classés par BM25 (postings des seuls termes de la
+        requête, sans relire les textes).
+
+        Returns:
+            [(id, score)] par score décroissant
+        """
+        scorer = self.scorer(query, k1, b)
+        terms = list(scorer.idf)
+        if not terms:
+            return []
+
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT p.doc_id, p.term, p.tf, d.length
+                FROM relevance_postings p
+                JOIN relevance_docs d ON d.id = p.doc_id
+                WHERE p.term IN ({', '.join('?' * len(terms))})
+            """, terms).fetchall()
+
+        docs: Dict[str, Tuple[Dict[str, int], int]] = {}
+        for doc_id, term, tf, length in rows:
+            docs.setdefault(doc_id, ({}, length))[0][term] = tf
+
+        ranked = sorted(
+            ((doc_id, scorer.score_terms(counts, length)) for doc_id, (counts, length) in docs.items()),
+            key=lambda item: (-item[1], item[0])
+        )
+        return ranked[:limit] if limit is not None else ranked
+
+    def get_stats(self) -> dict:
+        """Statistiques de l'index"""
+        documents, avgdl = self.stats()
+        with self._lock:
+            terms = self._conn.execute("SELECT COUNT(*) FROM relevance_terms").fetchone()[0]
+        return {'documents': documents, 'terms': terms, 'avg_length': round(avgdl, 1)}
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Recherche plein texte dans les articles collectés - Post Veille IA
+
+Interroge le stockage FTS5 de data/veille.db (collectors/article_store.py),
+alimenté par collect_all si settings.article_store est activé (désactivé par
+défaut), ou à la demande avec --ingest.
+
+Usage:
+    python scripts/search_articles.py gemini --since 14d
+    python scripts/search_articles.py "GPT-5 benchmark" --source reddit --limit 10
+    python scripts/search_articles.py "OpenAI: news"                 # Mots cherchés tels quels
+    python scripts/search_articles.py '"open weights" OR "open source"' --fts --json
+    python scripts/search_articles.py --ingest              # Importe les JSONL existants
+    python scripts/search_articles.py --stats
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from collectors.article_store import ArticleStore, DEFAULT_SEARCH_LIMIT, resolve_since
+from collectors.archive import ArchiveReader, DEFAULT_ARCHIVE_DIR, raw_jsonl_files
+from collectors.serialization import loads
+
+# Configuration logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RAW_DIR = PROJECT_ROOT / "output" / "raw-articles"
+
+
+def ingest_existing(store: ArticleStore, raw_dir: Path, batch_size: int = 1000) -> int:
+    """Importe l'archive compressée puis les JSONL du dossier des articles bruts"""
+    total = 0
+
+    def flush(batch):
+        nonlocal total
+        total += store.add_articles(batch)
+        batch.clear()
+
+    batch = []
+    if (DEFAULT_ARCHIVE_DIR / "index.db").exists():
+        with ArchiveReader() as reader:
+            for article in reader.iter_articles():
+                batch.append(article)
+                if len(batch) >= batch_size:
+                    flush(batch)
+        flush(batch)
+        logger.info(f"Archive importée: {total} articles")
+
+    for path in raw_jsonl_files(raw_dir):
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    batch.append(loads(line))
+                    if len(batch) >= batch_size:
+                        flush(batch)
+        flush(batch)
+        logger.info(f"Importé {path.name} (total: {total})")
+
+    store.optimize()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recherche plein texte dans les articles collectés")
+    parser.add_argument('query', nargs='?', help="Recherche libre (requête FTS5 avec --fts)")
+    parser.add_argument('--fts', action='store_true',
+                        help="Requête en syntaxe FTS5 (AND/OR/NOT, \"phrases\", préfixe*)")
+    parser.add_argument('--since', type=str, default=None, help="YYYY-MM-DD ou relatif (14d, 2w)")
+    parser.add_argument('--until', type=str, default=None, help="YYYY-MM-DD (inclus)")
+    parser.add_argument('--source', type=str, default=None, help="source_type (rss, jina, reddit, youtube)")
+    parser.add_argument('--limit', type=int, default=DEFAULT_SEARCH_LIMIT, help="Nombre max de résultats")
+    parser.add_argument('--json', action='store_true', help="Sortie JSON")
+    parser.add_argument('--ingest', action='store_true', help="Importe les articles déjà collectés")
+    parser.add_argument('--stats', action='store_true', help="Statistiques du stockage")
+    parser.add_argument('--db', type=str, default=None, help="Chemin vers veille.db")
+
+    args = parser.parse_args()
+
+    with ArticleStore(args.db) as store:
+        if args.ingest:
+            total = ingest_existing(store, RAW_DIR)
+            logger.info(f"{total} articles ajoutés")
+            return 0
+
+        if args.stats:
+            print(json.dumps(store.get_stats(), indent=2))
+            return 0
+
+        if not args.query:
+            parser.error("une recherche est requise (ou --ingest / --stats)")
+
+        start = time.perf_counter()
+        try:
+            hits = store.search(
+                args.query,
+                since=resolve_since(args.since) if args.since else None,
+                until=args.until,
+                source_type=args.source,
+                limit=args.limit,
+                raw=args.fts
+            )
+        except sqlite3.OperationalError as e:
+            logger.error(f"Recherche invalide \"{args.query}\": {e}")
+            return 1
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps(hits, ensure_ascii=False, indent=2))
+        return 0
+
+    print(f"{len(hits)} résultats en {elapsed_ms:.1f} ms\n")
+    for hit in hits:
+        print(f"[{hit['collected_at'][:10]}] {hit['title'][:90]}")
+        print(f"    {hit['source_name']} - {hit['url']}")
+        if hit['snippet']:
+            print(f"    {' '.join(hit['snippet'].split())}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())